@@ -0,0 +1,166 @@
+"""
+This module provides `AliasSampler`, a weighted random sampler built with
+Vose's alias method.
+
+The table is built once in O(n) for n outcomes. Every outcome is given a column
+of equal width; a column holds its own outcome up to a cut-off and one other
+(alias) outcome above it. A sample picks a column and a point inside it, so it
+costs a single `randint` regardless of n.
+
+Weights are integers, which keeps the table exact: column widths are the total
+weight W, every outcome's weight is scaled by n, and a draw picks one of n * W
+equally likely cells. When all weights are equal every column is full and a
+sample is exactly `rng.random_choice(values)`. A draw is one 32-bit `randint`,
+so a table may have at most MAX_CELLS cells.
+"""
+
+from __future__ import annotations
+
+from data_structures.array_stack import ArrayStack
+from data_structures.referential_array import ArrayR
+from random_gen import RandomGen
+
+# randint() reduces one 32-bit draw, so cells past 2^32 could never be drawn.
+MAX_CELLS = 1 << 32
+
+
+class AliasSampler:
+
+    def __init__(self, weights, values=None) -> None:
+        """
+        Builds the alias table.
+
+        Args:
+            weights: Non-negative integer weights, one per outcome, supporting __getitem__ and __len__
+            values: The outcomes to return, in the same order as weights. Defaults to the indices 0 to n-1.
+
+        Raises:
+            ValueError: if there are no weights, a weight is negative or not an integer, all weights are 0,
+              or the table would need more than MAX_CELLS cells (n times the total weight, unless all
+              weights are equal)
+
+        Complexity:
+            Best Case Complexity: O(n), where n is the number of outcomes
+            Worst Case Complexity: O(n), where n is the number of outcomes
+            Explanation:
+            - each outcome is pushed on one of two stacks once, and every step of the pairing loop
+              fills one column and pops at least one outcome for good
+        """
+        n = len(weights)
+        if n == 0:
+            raise ValueError("At least one weight is needed.")
+        if values is not None and len(values) != n:
+            raise ValueError("There must be one value per weight.")
+        total = 0
+        for weight in weights:
+            if not isinstance(weight, int) or weight < 0:
+                raise ValueError("Weights must be non-negative integers.")
+            total += weight
+        if total == 0:
+            raise ValueError("At least one weight must be positive.")
+
+        self.weights = weights
+        self.values = values
+        self.width = total
+        self.__cut = ArrayR(n)
+        self.__alias = ArrayR(n)
+        self.__uniform = True
+
+        # Scaled weights: each column holds exactly `total` of them.
+        scaled = ArrayR(n)
+        small = ArrayStack(n)
+        large = ArrayStack(n)
+        for i in range(n):
+            scaled[i] = weights[i] * n
+            self.__alias[i] = i
+            if scaled[i] < total:
+                small.push(i)
+            else:
+                large.push(i)
+
+        while not small.is_empty() and not large.is_empty():
+            less = small.pop()
+            more = large.pop()
+            self.__cut[less] = scaled[less]
+            self.__alias[less] = more
+            scaled[more] -= total - scaled[less]
+            if scaled[more] < total:
+                small.push(more)
+            else:
+                large.push(more)
+
+        # Whatever is left fills its column exactly.
+        while not large.is_empty():
+            self.__cut[large.pop()] = total
+        while not small.is_empty():
+            self.__cut[small.pop()] = total
+
+        for i in range(n):
+            if self.__cut[i] != total:
+                self.__uniform = False
+        # With equal weights every column is a single cell.
+        self.cells = n if self.__uniform else n * total
+        if self.cells > MAX_CELLS:
+            raise ValueError(f"The weights need {self.cells} cells, more than one draw can pick from ({MAX_CELLS}).")
+
+    def __len__(self) -> int:
+        """ Returns the number of outcomes. """
+        return len(self.__cut)
+
+    def index_of_cell(self, cell: int) -> int:
+        """
+        Returns the outcome index a cell from 0 to self.cells - 1 maps to.
+        Lets callers draw cells in bulk, e.g. with RandomGen.randint_batch(0, sampler.cells - 1, out).
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.__uniform:
+            return cell
+        column = cell // self.width
+        if cell % self.width < self.__cut[column]:
+            return column
+        return self.__alias[column]
+
+    def value_of_cell(self, cell: int):
+        """
+        Returns the outcome a cell from 0 to self.cells - 1 maps to, see index_of_cell().
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        index = self.index_of_cell(cell)
+        return self.values[index] if self.values is not None else index
+
+    def sample_index(self, rng=RandomGen) -> int:
+        """
+        Draws the index of an outcome.
+
+        Args:
+            rng (RandomGen or RandomStream): The generator to draw from
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+            Explanation:
+            - one randint picks a cell, then the column and its cut-off are array lookups
+        """
+        return self.index_of_cell(rng.randint(0, self.cells - 1))
+
+    def sample(self, rng=RandomGen):
+        """
+        Draws an outcome.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.value_of_cell(rng.randint(0, self.cells - 1))
+
+    def __str__(self) -> str:
+        return f"AliasSampler({len(self)} outcomes)"
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -0,0 +1,149 @@
+"""
+This module provides `BinaryWriter` and `BinaryReader`, small helpers for the
+compact binary files the simulator saves.
+
+Every value is packed little-endian with `struct` into a single growing
+`bytearray`, so a whole file is written with one buffered write. The reader
+unpacks from a bytes-like object (a file read in full, or a memory map) at a
+moving offset, without copying it.
+"""
+
+from __future__ import annotations
+
+import struct
+
+
+class BinaryWriter:
+    """
+    Packs values into an in-memory buffer.
+
+    Usage:
+    ```
+    writer = BinaryWriter(b"SSCK", 1)
+    writer.pack("<I", 42)
+    writer.write_str("Dragons")
+    writer.save("season.ckpt")
+    ```
+    """
+
+    STR_LENGTH = struct.Struct("<H")
+
+    def __init__(self, magic: bytes = b"", version: int | None = None) -> None:
+        """
+        Args:
+            magic (bytes): Bytes identifying the file type, written first
+            version (int or None): Format version written after the magic bytes
+        """
+        self.buffer = bytearray(magic)
+        if version is not None:
+            self.pack("<H", version)
+
+    def __len__(self) -> int:
+        """ Returns the number of bytes written so far. """
+        return len(self.buffer)
+
+    def pack(self, fmt: str, *values) -> None:
+        """
+        Appends values packed with a struct format.
+        :complexity: O(B) where B is the number of bytes packed.
+        """
+        self.buffer += struct.pack(fmt, *values)
+
+    def write_str(self, text: str) -> None:
+        """
+        Appends a UTF-8 string prefixed with its length in bytes.
+        :complexity: O(L) where L is the length of the string.
+        :raises ValueError: if the encoded string is longer than 65535 bytes.
+        """
+        data = text.encode("utf-8")
+        if len(data) > 0xFFFF:
+            raise ValueError("String is too long to be written.")
+        self.buffer += self.STR_LENGTH.pack(len(data))
+        self.buffer += data
+
+    def write_bytes(self, data) -> None:
+        """
+        Appends raw bytes, e.g. the contents of an array.array.
+        :complexity: O(B) where B is the number of bytes.
+        """
+        self.buffer += data
+
+    def save(self, path: str) -> None:
+        """
+        Writes the buffer to a file in a single write.
+        :complexity: O(B) where B is the size of the buffer.
+        """
+        with open(path, "wb") as file:
+            file.write(self.buffer)
+
+
+class BinaryReader:
+    """
+    Unpacks values written by a BinaryWriter, in the same order.
+    """
+
+    def __init__(self, data, magic: bytes = b"", version: int | None = None) -> None:
+        """
+        Args:
+            data: The bytes-like object to read from
+            magic (bytes): The bytes the data must start with
+            version (int or None): The format version the data must have
+
+        Raises:
+            ValueError: if the magic bytes or version do not match
+        """
+        self.data = data
+        self.offset = 0
+        if bytes(self.data[:len(magic)]) != magic:
+            raise ValueError("Not a file of the expected type.")
+        self.offset = len(magic)
+        if version is not None:
+            found = self.unpack("<H")[0]
+            if found != version:
+                raise ValueError(f"Unsupported format version {found}, expected {version}.")
+
+    @classmethod
+    def load(cls, path: str, magic: bytes = b"", version: int | None = None) -> BinaryReader:
+        """
+        Reads a whole file in one read.
+        :complexity: O(B) where B is the size of the file.
+        """
+        with open(path, "rb") as file:
+            return cls(file.read(), magic, version)
+
+    def remaining(self) -> int:
+        """ Returns the number of bytes left to read. """
+        return len(self.data) - self.offset
+
+    def unpack(self, fmt: str) -> tuple:
+        """
+        Unpacks the next values with a struct format.
+        :complexity: O(B) where B is the number of bytes unpacked.
+        :raises ValueError: if the data ends before the values.
+        """
+        size = struct.calcsize(fmt)
+        if size > self.remaining():
+            raise ValueError("Unexpected end of data.")
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += size
+        return values
+
+    def read_str(self) -> str:
+        """
+        Reads a string written by BinaryWriter.write_str().
+        :complexity: O(L) where L is the length of the string.
+        """
+        length = self.unpack("<H")[0]
+        return self.read_bytes(length).decode("utf-8")
+
+    def read_bytes(self, size: int) -> bytes:
+        """
+        Reads the next `size` raw bytes.
+        :complexity: O(B) where B is size.
+        :raises ValueError: if fewer than `size` bytes are left.
+        """
+        if size > self.remaining():
+            raise ValueError("Unexpected end of data.")
+        data = bytes(self.data[self.offset:self.offset + size])
+        self.offset += size
+        return data
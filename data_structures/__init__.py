@@ -10,3 +10,5 @@ from data_structures.array_set import ArraySet
 from data_structures.bit_vector_set import BitVectorSet
 from data_structures.array_sorted_list import ArraySortedList
 from data_structures.node import Node
+from data_structures.avl_tree import AVLTree
+from data_structures.sequence_tree import SequenceTree
@@ -0,0 +1,268 @@
+from __future__ import annotations
+from typing import Generic, TypeVar
+from data_structures.linked_stack import LinkedStack
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class AVLNode(Generic[K, V]):
+    """
+    Node of an AVLTree.
+    Nodes are never modified once built: every update creates new nodes along
+    the search path instead (path copying), so an old root remains a valid
+    snapshot of the tree.
+    """
+    __slots__ = ('key', 'value', 'left', 'right', 'height', 'size')
+
+    def __init__(self, key: K, value: V, left: AVLNode[K, V] | None = None, right: AVLNode[K, V] | None = None) -> None:
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        left_height = left.height if left is not None else 0
+        right_height = right.height if right is not None else 0
+        self.height = 1 + (left_height if left_height > right_height else right_height)
+        self.size = 1 + (left.size if left is not None else 0) + (right.size if right is not None else 0)
+
+
+class AVLTree(Generic[K, V]):
+    """
+    Order statistic AVL tree.
+    Stores (key, value) pairs ordered by key, and additionally keeps the size of every subtree so
+    items can be accessed by their rank (position in sorted order).
+    Equal keys are allowed and are kept in insertion order.
+
+    Unless stated otherwise, all methods have O(log N * comp(K)) complexity, where N is the number of
+    items in the tree and comp(K) is the cost of comparing two keys.
+    """
+
+    def __init__(self) -> None:
+        self.__root = None
+
+    @classmethod
+    def from_sorted(cls, keys, values) -> AVLTree[K, V]:
+        """
+        Builds a perfectly balanced tree from keys that are already sorted.
+        :complexity: O(N) where N is the number of keys.
+        """
+        tree = cls()
+        tree.__root = tree.__build(keys, values, 0, len(keys))
+        return tree
+
+    def __build(self, keys, values, lo: int, hi: int) -> AVLNode[K, V] | None:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        return AVLNode(keys[mid], values[mid], self.__build(keys, values, lo, mid), self.__build(keys, values, mid + 1, hi))
+
+    def copy(self) -> AVLTree[K, V]:
+        """
+        Returns an independent tree holding the same items.
+        :complexity: O(1), the nodes are shared since they are never modified.
+        """
+        tree = AVLTree()
+        tree.__root = self.__root
+        return tree
+
+    def __len__(self) -> int:
+        """ Returns the number of items in the tree. """
+        return self.__root.size if self.__root is not None else 0
+
+    def is_empty(self) -> bool:
+        return self.__root is None
+
+    @staticmethod
+    def __height(node: AVLNode[K, V] | None) -> int:
+        return node.height if node is not None else 0
+
+    def __balance(self, key: K, value: V, left: AVLNode[K, V] | None, right: AVLNode[K, V] | None) -> AVLNode[K, V]:
+        """
+        Builds a node from its parts, rotating if the subtrees differ in height by more than one.
+        :complexity: O(1)
+        """
+        left_height = self.__height(left)
+        right_height = self.__height(right)
+        if left_height > right_height + 1:
+            if self.__height(left.left) < self.__height(left.right):
+                inner = left.right
+                left = AVLNode(inner.key, inner.value, AVLNode(left.key, left.value, left.left, inner.left), inner.right)
+            return AVLNode(left.key, left.value, left.left, AVLNode(key, value, left.right, right))
+        if right_height > left_height + 1:
+            if self.__height(right.right) < self.__height(right.left):
+                inner = right.left
+                right = AVLNode(inner.key, inner.value, inner.left, AVLNode(right.key, right.value, inner.right, right.right))
+            return AVLNode(right.key, right.value, AVLNode(key, value, left, right.left), right.right)
+        return AVLNode(key, value, left, right)
+
+    def insert(self, key: K, value: V) -> None:
+        """ Inserts the (key, value) pair, after any items with an equal key. """
+        self.__root = self.__insert(self.__root, key, value)
+
+    def __insert(self, node: AVLNode[K, V] | None, key: K, value: V) -> AVLNode[K, V]:
+        if node is None:
+            return AVLNode(key, value)
+        if key < node.key:
+            return self.__balance(node.key, node.value, self.__insert(node.left, key, value), node.right)
+        return self.__balance(node.key, node.value, node.left, self.__insert(node.right, key, value))
+
+    def remove(self, key: K, value: V | None = None) -> None:
+        """
+        Removes an item with the given key.
+        If value is given, the item holding that exact object is removed, which matters when
+        several items share the same key.
+        :complexity: O(log N * comp(K)), plus O(D) where D is the number of items sharing the key.
+        :raises KeyError: when no matching item is in the tree.
+        """
+        new_root, removed = self.__remove(self.__root, key, value)
+        if not removed:
+            raise KeyError(key)
+        self.__root = new_root
+
+    def __remove(self, node: AVLNode[K, V] | None, key: K, value: V | None) -> tuple[AVLNode[K, V] | None, bool]:
+        if node is None:
+            return None, False
+        if key < node.key:
+            left, removed = self.__remove(node.left, key, value)
+            return (self.__balance(node.key, node.value, left, node.right), True) if removed else (node, False)
+        if node.key < key:
+            right, removed = self.__remove(node.right, key, value)
+            return (self.__balance(node.key, node.value, node.left, right), True) if removed else (node, False)
+        if value is None or node.value is value:
+            return self.__remove_node(node), True
+        # Equal keys may sit on either side of this node after rotations.
+        left, removed = self.__remove(node.left, key, value)
+        if removed:
+            return self.__balance(node.key, node.value, left, node.right), True
+        right, removed = self.__remove(node.right, key, value)
+        if removed:
+            return self.__balance(node.key, node.value, node.left, right), True
+        return node, False
+
+    def __remove_node(self, node: AVLNode[K, V]) -> AVLNode[K, V] | None:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor = node.right
+        while successor.left is not None:
+            successor = successor.left
+        return self.__balance(successor.key, successor.value, node.left, self.__remove_min(node.right))
+
+    def __remove_min(self, node: AVLNode[K, V]) -> AVLNode[K, V] | None:
+        if node.left is None:
+            return node.right
+        return self.__balance(node.key, node.value, self.__remove_min(node.left), node.right)
+
+    def __node_at(self, index: int) -> AVLNode[K, V]:
+        if index < -len(self) or index >= len(self):
+            raise IndexError("Out of bounds access in tree.")
+        if index < 0:
+            index += len(self)
+        node = self.__root
+        while True:
+            left_size = node.left.size if node.left is not None else 0
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def __getitem__(self, index: int) -> V:
+        """
+        Returns the value with the given rank.
+        :complexity: O(log N)
+        :raises IndexError: if the index is out of bounds.
+        """
+        return self.__node_at(index).value
+
+    def key_at(self, index: int) -> K:
+        """
+        Returns the key with the given rank.
+        :complexity: O(log N)
+        :raises IndexError: if the index is out of bounds.
+        """
+        return self.__node_at(index).key
+
+    def rank(self, key: K) -> int:
+        """ Returns the number of items with a key strictly smaller than the given key. """
+        node = self.__root
+        rank = 0
+        while node is not None:
+            if node.key < key:
+                rank += 1 + (node.left.size if node.left is not None else 0)
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def __contains__(self, key: K) -> bool:
+        node = self.__root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def __iter__(self):
+        """
+        Iterates through the values in key order.
+        :complexity: O(N) for a full iteration.
+        """
+        stack = LinkedStack()
+        node = self.__root
+        while node is not None or not stack.is_empty():
+            while node is not None:
+                stack.push(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __reversed__(self):
+        """
+        Iterates through the values in reverse key order.
+        :complexity: O(log N) to reach the first value, O(N) for a full iteration.
+        """
+        stack = LinkedStack()
+        node = self.__root
+        while node is not None or not stack.is_empty():
+            while node is not None:
+                stack.push(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def between(self, low: K, high: K):
+        """
+        Iterates in key order through the values whose keys lie between low and high, inclusive.
+        :complexity: O(log N * comp(K) + k) where k is the number of values yielded.
+        """
+        stack = LinkedStack()
+        node = self.__root
+        while True:
+            while node is not None:
+                if node.key < low:
+                    node = node.right
+                else:
+                    stack.push(node)
+                    node = node.left
+            if stack.is_empty():
+                return
+            node = stack.pop()
+            if high < node.key:
+                return
+            yield node.value
+            node = node.right
+
+    def __str__(self) -> str:
+        return "AVLTree [" + ", ".join(str(value) for value in self) + "]"
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -38,6 +38,18 @@ class LinearProbeTable(HashTable[str, V]):
         self.__array: ArrayR[tuple[str, V]] = ArrayR(self.TABLE_SIZES[self.__size_index])
         self.__length = 0
 
+    @classmethod
+    def for_items(cls, count: int) -> LinearProbeTable[V]:
+        """
+        Returns an empty table that holds `count` items without rehashing.
+        :complexity: O(S + M) where S is len(TABLE_SIZES) and M is the size of the first table.
+        """
+        sizes = cls.TABLE_SIZES
+        first = 0
+        while first < len(sizes) - 1 and 2 * count > sizes[first]:
+            first += 1
+        return cls(sizes[first:])
+
     def hash(self, key: str) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
@@ -45,9 +57,10 @@ class LinearProbeTable(HashTable[str, V]):
         """
         value = 0
         a = 31415
+        table_size = self.table_size
         for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
+            value = (ord(char) + a * value) % table_size
+            a = a * self.HASH_BASE % (table_size - 1)
         return value
 
     @property
@@ -215,10 +228,12 @@ class LinearProbeTable(HashTable[str, V]):
         """
         old_array = self.__array
         self.__size_index += 1
-        if self.__size_index == len(self.TABLE_SIZES):
-            # Cannot be resized further.
-            return
-        self.__array = ArrayR(self.TABLE_SIZES[self.__size_index])
+        if self.__size_index < len(self.TABLE_SIZES):
+            new_size = self.TABLE_SIZES[self.__size_index]
+        else:
+            # Past the listed sizes, keep growing by a constant factor rather than filling up.
+            new_size = 4 * len(old_array)
+        self.__array = ArrayR(new_size)
         self.__length = 0
         for item in old_array:
             if item is not None:
@@ -1,5 +1,5 @@
 from data_structures.abstract_list import List, T
-from data_structures.node import Node
+from data_structures.node import Node, DoubleNode
 
 
 class LinkedListIterator:
@@ -20,7 +20,10 @@ class LinkedListIterator:
 
 
 class LinkedList(List[T]):
-    """ Linked-node based implementation of List ADT. """
+    """ Linked-node based implementation of List ADT.
+    The nodes are doubly linked, so a node returned by append_node() can later be
+    removed with delete_node() in O(1).
+    """
 
     def __init__(self):
         List.__init__(self)
@@ -64,13 +67,46 @@ class LinkedList(List[T]):
         """ Append the item to the end of the list. 
         :complexity: Given we have a reference to the rear of the list, this is O(1).
         """
-        new_node = Node(item)
+        self.append_node(item)
+
+    def append_node(self, item: T) -> DoubleNode[T]:
+        """ Append the item to the end of the list and return the node holding it.
+        :complexity: O(1)
+        """
+        new_node = DoubleNode(item)
         if self.__head is None:
             self.__head = new_node
         else:
             self.__rear.link = new_node
+            new_node.previous = self.__rear
         self.__rear = new_node
         self.__length += 1
+        return new_node
+
+    def delete_node(self, node: DoubleNode[T]) -> T:
+        """ Remove a node of this list and return its item.
+        :pre: node is a node of this list, e.g. returned by append_node() or nodes().
+        :complexity: O(1)
+        """
+        if node.previous is None:
+            self.__head = node.link
+        else:
+            node.previous.link = node.link
+        if node.link is None:
+            self.__rear = node.previous
+        else:
+            node.link.previous = node.previous
+        node.link = None
+        node.previous = None
+        self.__length -= 1
+        return node.item
+
+    def nodes(self):
+        """ Iterate through the nodes of the list, e.g. to remember them for delete_node(). """
+        current = self.__head
+        while current is not None:
+            yield current
+            current = current.link
 
     def __get_node_at_index(self, index: int) -> Node[T]:
         if -1 * len(self) <= index and index < len(self):
@@ -107,9 +143,13 @@ class LinkedList(List[T]):
                 previous_node = self.__get_node_at_index(index-1)
                 item = previous_node.link.item
                 previous_node.link = previous_node.link.link
+                if previous_node.link is not None:
+                    previous_node.link.previous = previous_node
             elif index == 0:
                 item = self.__head.item
                 self.__head = self.__head.link
+                if self.__head is not None:
+                    self.__head.previous = None
                 previous_node = self.__head
             else:
                 raise ValueError("Index out of bounds")
@@ -123,14 +163,17 @@ class LinkedList(List[T]):
             raise ValueError("Index out of bounds: list is empty")
 
     def insert(self, index: int, item: T) -> None:
-        new_node = Node(item)
+        new_node = DoubleNode(item)
         if index == 0:
             new_node.link = self.__head
             self.__head = new_node
         else:
             previous_node = self.__get_node_at_index(index-1)
             new_node.link = previous_node.link
+            new_node.previous = previous_node
             previous_node.link = new_node
+        if new_node.link is not None:
+            new_node.link.previous = new_node
 
         if index == len(self):
             if len(self) > 0:
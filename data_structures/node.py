@@ -11,3 +11,13 @@ class Node(Generic[T]):
     def __init__(self, item: T = None):
         self.item = item
         self.link = None
+
+
+class DoubleNode(Node[T]):
+    """ Linked node that also has a reference to the previous node,
+    so that it can be unlinked from its list without walking to it.
+    """
+
+    def __init__(self, item: T = None):
+        Node.__init__(self, item)
+        self.previous = None
@@ -69,6 +69,16 @@ class ArrayR(Generic[T]):
         new_array.array[:] = lst
         return new_array
 
+    @classmethod
+    def read_only(cls, items) -> ArrayR:
+        """ Creates an array of the given items that can be read but not written:
+        setting an item raises TypeError.
+        :complexity: O(n) where n is the number of items
+        """
+        new_array = cls.__new__(cls)
+        new_array.array = tuple(items)
+        return new_array
+
     def to_list(self) -> list:
         """ Returns a list representation of the array
         :complexity: O(n) where n is the length of the array
@@ -0,0 +1,221 @@
+from __future__ import annotations
+from typing import Generic, TypeVar
+from data_structures.abstract_list import List
+from data_structures.linked_stack import LinkedStack
+
+T = TypeVar('T')
+
+
+class SequenceNode(Generic[T]):
+    """
+    Node of a SequenceTree.
+    Like AVLNode, a node is never modified once built, so an old root remains a valid
+    snapshot of the sequence.
+    """
+    __slots__ = ('value', 'left', 'right', 'height', 'size')
+
+    def __init__(self, value: T, left: SequenceNode[T] | None = None, right: SequenceNode[T] | None = None) -> None:
+        self.value = value
+        self.left = left
+        self.right = right
+        left_height = left.height if left is not None else 0
+        right_height = right.height if right is not None else 0
+        self.height = 1 + (left_height if left_height > right_height else right_height)
+        self.size = 1 + (left.size if left is not None else 0) + (right.size if right is not None else 0)
+
+
+class SequenceTree(List[T]):
+    """
+    List held in an AVL tree ordered by position instead of by key.
+    Every node knows the size of its subtree, so the item at any position is found, inserted
+    or deleted in O(log N), and an item can be moved from one position to another in O(log N)
+    without shifting the items in between. Copies share their nodes, see copy().
+
+    Unless stated otherwise, all methods have O(log N) complexity, where N is the number of items.
+    """
+
+    def __init__(self) -> None:
+        List.__init__(self)
+        self.__root = None
+
+    @classmethod
+    def from_array(cls, items) -> SequenceTree[T]:
+        """
+        Builds a perfectly balanced tree holding the items of an indexable collection, in order.
+        :complexity: O(N) where N is the number of items.
+        """
+        tree = cls()
+        tree.__root = tree.__build(items, 0, len(items))
+        return tree
+
+    def __build(self, items, lo: int, hi: int) -> SequenceNode[T] | None:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        return SequenceNode(items[mid], self.__build(items, lo, mid), self.__build(items, mid + 1, hi))
+
+    def copy(self) -> SequenceTree[T]:
+        """
+        Returns an independent list holding the same items.
+        :complexity: O(1), the nodes are shared since they are never modified.
+        """
+        tree = SequenceTree()
+        tree.__root = self.__root
+        return tree
+
+    def __len__(self) -> int:
+        """ Returns the number of items. """
+        return self.__root.size if self.__root is not None else 0
+
+    def clear(self) -> None:
+        """ Removes every item. :complexity: O(1) """
+        self.__root = None
+
+    @staticmethod
+    def __height(node: SequenceNode[T] | None) -> int:
+        return node.height if node is not None else 0
+
+    @staticmethod
+    def __size(node: SequenceNode[T] | None) -> int:
+        return node.size if node is not None else 0
+
+    def __balance(self, value: T, left: SequenceNode[T] | None, right: SequenceNode[T] | None) -> SequenceNode[T]:
+        """
+        Builds a node from its parts, rotating if the subtrees differ in height by more than one.
+        :complexity: O(1)
+        """
+        left_height = self.__height(left)
+        right_height = self.__height(right)
+        if left_height > right_height + 1:
+            if self.__height(left.left) < self.__height(left.right):
+                inner = left.right
+                left = SequenceNode(inner.value, SequenceNode(left.value, left.left, inner.left), inner.right)
+            return SequenceNode(left.value, left.left, SequenceNode(value, left.right, right))
+        if right_height > left_height + 1:
+            if self.__height(right.right) < self.__height(right.left):
+                inner = right.left
+                right = SequenceNode(inner.value, inner.left, SequenceNode(right.value, inner.right, right.right))
+            return SequenceNode(right.value, SequenceNode(value, left, right.left), right.right)
+        return SequenceNode(value, left, right)
+
+    def __check_index(self, index: int, length: int) -> int:
+        """
+        Returns a non negative index.
+        :raises IndexError: if the index is out of bounds.
+        """
+        if index < -length or index >= length:
+            raise IndexError("Out of bounds access in list.")
+        return index + length if index < 0 else index
+
+    def __node_at(self, index: int) -> SequenceNode[T]:
+        index = self.__check_index(index, len(self))
+        node = self.__root
+        while True:
+            left_size = self.__size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Returns the item at a position.
+        :raises IndexError: if the index is out of bounds.
+        """
+        return self.__node_at(index).value
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """
+        Replaces the item at a position.
+        :raises IndexError: if the index is out of bounds.
+        """
+        self.__root = self.__set(self.__root, self.__check_index(index, len(self)), item)
+
+    def __set(self, node: SequenceNode[T], index: int, item: T) -> SequenceNode[T]:
+        left_size = self.__size(node.left)
+        if index < left_size:
+            return SequenceNode(node.value, self.__set(node.left, index, item), node.right)
+        if index == left_size:
+            return SequenceNode(item, node.left, node.right)
+        return SequenceNode(node.value, node.left, self.__set(node.right, index - left_size - 1, item))
+
+    def insert(self, index: int, item: T) -> None:
+        """
+        Inserts an item so that it ends up at the given position, len(self) appending it.
+        :raises IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index > len(self):
+            raise IndexError("Index out of bounds")
+        self.__root = self.__insert(self.__root, index, item)
+
+    def __insert(self, node: SequenceNode[T] | None, index: int, item: T) -> SequenceNode[T]:
+        if node is None:
+            return SequenceNode(item)
+        left_size = self.__size(node.left)
+        if index <= left_size:
+            return self.__balance(node.value, self.__insert(node.left, index, item), node.right)
+        return self.__balance(node.value, node.left, self.__insert(node.right, index - left_size - 1, item))
+
+    def delete_at_index(self, index: int) -> T:
+        """
+        Removes the item at a position and returns it.
+        :raises IndexError: if the index is out of bounds.
+        """
+        index = self.__check_index(index, len(self))
+        item = self.__node_at(index).value
+        self.__root = self.__delete(self.__root, index)
+        return item
+
+    def __delete(self, node: SequenceNode[T], index: int) -> SequenceNode[T] | None:
+        left_size = self.__size(node.left)
+        if index < left_size:
+            return self.__balance(node.value, self.__delete(node.left, index), node.right)
+        if index > left_size:
+            return self.__balance(node.value, node.left, self.__delete(node.right, index - left_size - 1))
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor = node.right
+        while successor.left is not None:
+            successor = successor.left
+        return self.__balance(successor.value, node.left, self.__delete(node.right, 0))
+
+    def move(self, source: int, target: int) -> None:
+        """
+        Moves the item at position `source` so that it ends up at position `target`, the items
+        in between each moving one place.
+        :raises IndexError: if either position is out of bounds.
+        """
+        target = self.__check_index(target, len(self))
+        item = self.delete_at_index(source)
+        self.__root = self.__insert(self.__root, target, item)
+
+    def index(self, item: T) -> int:
+        """
+        Returns the position of the first item equal to the given one.
+        :complexity: O(N)
+        :raises ValueError: if the item is not in the list.
+        """
+        for position, value in enumerate(self):
+            if value == item:
+                return position
+        raise ValueError("Item not in list.")
+
+    def __iter__(self):
+        """
+        Iterates through the items in order.
+        :complexity: O(N) for a full iteration.
+        """
+        stack = LinkedStack()
+        node = self.__root
+        while node is not None or not stack.is_empty():
+            while node is not None:
+                stack.push(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
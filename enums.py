@@ -2,7 +2,7 @@
 This module defines various enumerations used across the simulation project.
 
 It provides constant, readable values for concepts like `TeamGameResult`
-(WIN, DRAW, LOSS) and `PlayerPosition` (GOALKEEPER, DEFENDER, etc.),
+(WIN, DRAW, LOSS), `PlayerPosition` (GOALKEEPER, DEFENDER, etc.) and `ScheduleMethod`,
 ensuring consistency and preventing errors from using raw strings or integers.
 """
 
@@ -28,3 +28,20 @@ class PlayerPosition(Enum):
     DEFENDER = "Defender"
     MIDFIELDER = "Midfielder"
     STRIKER = "Striker"
+
+    def __init__(self, value: str) -> None:
+        # The index of the position in declaration order, so that per position data can be
+        # held in an array (see team.PositionSlots) instead of a table keyed by the value.
+        self.ordinal = len(type(self).__members__)
+
+
+class ScheduleMethod(Enum):
+    """
+    Enum class to represent the ways a season schedule can be generated
+    GREEDY fills each week with the first games that still fit (Season._generate_schedule)
+    CIRCLE uses the polygon method, always giving the minimum number of weeks (Season._generate_circle_schedule)
+    LAZY gives the same weeks as CIRCLE, but builds each week only when it is needed (LazySchedule)
+    """
+    GREEDY = "Greedy"
+    CIRCLE = "Circle"
+    LAZY = "Lazy"
@@ -5,9 +5,14 @@ simulating the outcome of a single game between two teams.
 It uses a static method that takes two teams as input and employs a
 probabilistic model to generate a realistic outcome, including the number
 of goals scored by each team and a list of the players who scored.
+`GameSimulator.simulate_batch` simulates many games at once and returns the
+results as compact columns in a `BatchSimulationOutcome`.
+Goal counts and scorers are drawn with alias samplers, in O(1) per draw.
 """
 
 from __future__ import annotations
+from array import array
+from alias_sampler import AliasSampler
 from data_structures.referential_array import ArrayR
 from data_structures.array_list import ArrayList
 from enums import PlayerPosition
@@ -17,7 +22,8 @@ from team import Team
 
 
 class GameSimulationOutcome:
-    def __init__(self, home_goals: int, away_goals: int, goal_scorers: ArrayList[str]):
+    def __init__(self, home_goals: int, away_goals: int, goal_scorers: ArrayList[str],
+                 scorer_players: ArrayList[Player] | None = None):
         """
         Constructor for the GameResults class
 
@@ -25,6 +31,8 @@ class GameSimulationOutcome:
             home_goals (int): The number of goals scored by the home team
             away_goals (int): The number of goals scored by the away team
             goal_scorers (ArrayList[str]): A list of the goal scorers in the game
+            scorer_players (ArrayList[Player] or None): The same goal scorers as Player objects, in the
+                same order as goal_scorers. None when only the names are known.
 
         Returns:
             None
@@ -32,56 +40,218 @@ class GameSimulationOutcome:
         self.home_goals: int = home_goals
         self.away_goals: int = away_goals
         self.goal_scorers: ArrayList[str] = goal_scorers
+        self.scorer_players: ArrayList[Player] | None = scorer_players
 
         # You see how redundant the code above is? We take the argument, we set it on the object exactly as it is,
         # without even changing its name or anything. That's what dataclasses are for, as you can see in season.py.
         # We didn't use them for this class, so you can compare the two approaches.
 
 
+class BatchSimulationOutcome:
+    """
+    Columnar results of GameSimulator.simulate_batch().
+
+    Game i was played between games[i].home_team and games[i].away_team. Its scorers are
+    scorers[scorer_offsets[i]:scorer_offsets[i + 1]]: the first home_goals[i] of them are indices
+    into the home team's roster, the rest into the away team's roster. Rosters are in
+    Team.get_players() order at the time of the batch.
+    """
+
+    def __init__(self, games: ArrayR, home_goals: array, away_goals: array,
+                 scorer_offsets: array, scorers: array, rosters: dict) -> None:
+        self.games = games
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.scorer_offsets = scorer_offsets
+        self.scorers = scorers
+        self._rosters = rosters
+
+    def __len__(self) -> int:
+        """ Returns the number of games in the batch. """
+        return len(self.games)
+
+    def roster(self, team: Team) -> ArrayR[Player]:
+        """ Returns the roster the scorer indices of this team refer to. """
+        return self._rosters[id(team)][0]
+
+    def outcome(self, index: int) -> GameSimulationOutcome:
+        """
+        Returns the result of a single game in the same form as GameSimulator.simulate().
+        :complexity: O(S) where S is the number of goals in the game.
+        """
+        game = self.games[index]
+        home_roster = self.roster(game.home_team)
+        away_roster = self.roster(game.away_team)
+        start = self.scorer_offsets[index]
+        split = start + self.home_goals[index]
+        goal_scorers = ArrayList(self.scorer_offsets[index + 1] - start)
+        scorer_players = ArrayList(self.scorer_offsets[index + 1] - start)
+        for i in range(start, self.scorer_offsets[index + 1]):
+            roster = home_roster if i < split else away_roster
+            scorer_players.append(roster[self.scorers[i]])
+            goal_scorers.append(roster[self.scorers[i]].name)
+        return GameSimulationOutcome(self.home_goals[index], self.away_goals[index], goal_scorers, scorer_players)
+
+
 class GameSimulator:
 
+    # Goals scored by a team, with a higher likelihood of low scores: 30% 0 goals, 30% 1 goal,
+    # 20% 2 goals, 10% 3 goals, 5% 4 goals and 5% 5 goals.
+    GOAL_WEIGHTS: tuple[int, ...] = (30, 30, 20, 10, 5, 5)
+    # One cell per percent, drawn from uniformly, so a seeded draw gives the same goal count
+    # as picking from the original 100 entry list.
+    GOAL_DISTRIBUTION: tuple[int, ...] = (0,) * 30 + (1,) * 30 + (2,) * 20 + (3,) * 10 + (4,) * 5 + (5,) * 5
+    GOAL_SAMPLER: AliasSampler = AliasSampler((1,) * len(GOAL_DISTRIBUTION), GOAL_DISTRIBUTION)
+
     @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> GameSimulationOutcome:
+    def simulate(home_team: Team, away_team: Team, rng=RandomGen) -> GameSimulationOutcome:
         """
         Simulates a game between two teams, considering player stats for a more probabilistic outcome.
         Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
 
+        Scorers are picked with each team's cached scorer sampler (see Team.scorer_sampler()),
+        uniformly from the outfield players unless the team weights them by a stat.
+
         Args:
             home_team (Team): The home team.
             away_team (Team): The away team.
+            rng (RandomGen or RandomStream): The generator to draw from. Defaults to the shared RandomGen sequence.
 
         Returns:
             LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
                             'Goal Assists', 'Interceptions', 'Tacklers'
+
+        Raises:
+            ValueError: if a team scores but has no outfield players
         """
         # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
+        home_goals: int = GameSimulator.GOAL_SAMPLER.sample(rng)
+        away_goals: int = GameSimulator.GOAL_SAMPLER.sample(rng)
 
         # 2. Select goal scorers based on stats
-        goal_scorers = ArrayList[str]()
-        home_players: ArrayR[Player] = home_team.get_players()
-        away_players: ArrayR[Player] = away_team.get_players()
+        goal_scorers = ArrayList[str](home_goals + away_goals)
+        scorer_players = ArrayList[Player](home_goals + away_goals)
+        for team, goals in ((home_team, home_goals), (away_team, away_goals)):
+            if goals == 0:
+                continue
+            sampler = team.scorer_sampler()
+            if sampler is None:
+                raise ValueError(f"{team.name} has no outfield players to score.")
+            for _ in range(goals):
+                scorer: Player = sampler.sample(rng)
+                goal_scorers.append(scorer.name)
+                scorer_players.append(scorer)
 
-        # Get a list of outfield player from both teams
-        home_outfield: list[Player] = [player for player in home_players if player.position != PlayerPosition.GOALKEEPER]
-        away_outfield: list[Player] = [player for player in away_players if player.position != PlayerPosition.GOALKEEPER]
+        return GameSimulationOutcome(home_goals, away_goals, goal_scorers, scorer_players)
 
-        all_players: ArrayR[Player] = ArrayR(len(home_players) + len(away_players))
+    @staticmethod
+    def _outfield_indices(team: Team) -> tuple[ArrayR[Player], array, AliasSampler | None]:
+        """
+        Returns the roster of a team, the roster indices of its outfield players in the order
+        simulate() picks scorers from, and the team's scorer sampler over those players.
+        :complexity: O(P) where P is the number of players in the team.
+        """
+        players = team.get_players()
+        roster: ArrayR[Player] = ArrayR(len(players))
+        outfield = array('H')
+        for i, player in enumerate(players):
+            roster[i] = player
+            if player.position != PlayerPosition.GOALKEEPER:
+                outfield.append(i)
+        return roster, outfield, team.scorer_sampler()
+
+    @staticmethod
+    def simulate_batch(games, exact: bool = False, rng=RandomGen) -> BatchSimulationOutcome:
+        """
+        Simulates many games at once.
 
-        for i in range(len(home_players)):
-            all_players[i] = home_players[i]
+        Rosters are read once per team for the whole batch instead of once per game, and the
+        generator is not called once per draw. Goal counts and scorer cells are drawn in two
+        bulk passes with the generator's batch methods, all goal counts first and then all
+        scorers, and mapped to outcomes through the alias samplers.
+
+        Args:
+            games: A WeekOfGames, any iterable of games, or an iterable of weeks (such as a full schedule).
+            exact (bool): If True, draws are made in the same order as calling simulate() on each
+                game in turn, so a seeded run gives exactly the same results as the scalar path.
+            rng (RandomGen or RandomStream): The generator to draw from. Its seed is left where the
+                same number of scalar draws would leave it.
+
+        Returns:
+            BatchSimulationOutcome: The goals and scorers of every game, as columns.
+
+        Complexity:
+            Best Case Complexity: O(G + T*P + S), where G is the number of games, T the number of teams
+              playing, P the players per team and S the total number of goals
+            Worst Case Complexity: O(G + T*P + S)
+        """
+        flat = ArrayList()
+        for item in games:
+            if hasattr(item, "home_team"):
+                flat.append(item)
+            else:
+                for game in item:
+                    flat.append(game)
+        batch = ArrayR(len(flat))
+        for i in range(len(flat)):
+            batch[i] = flat[i]
 
-        for i in range(len(away_players)):
-            all_players[i + len(home_players)] = away_players[i]
+        rosters = {}
+        for game in batch:
+            for team in (game.home_team, game.away_team):
+                if id(team) not in rosters:
+                    rosters[id(team)] = GameSimulator._outfield_indices(team)
 
-        for _ in range(home_goals):
-            scorer: Player = RandomGen.random_choice(home_outfield)
-            goal_scorers.append(scorer.name)
+        goal_sampler = GameSimulator.GOAL_SAMPLER
+        home_goals = array('B', [0]) * len(batch)
+        away_goals = array('B', [0]) * len(batch)
+        scorer_offsets = array('L', [0]) * (len(batch) + 1)
+        scorers = array('H')
 
-        for _ in range(away_goals):
-            scorer: Player = RandomGen.random_choice(away_outfield)
-            goal_scorers.append(scorer.name)
+        if exact:
+            goal_cells = goal_sampler.cells
+            multiplier, increment, modulus = RandomGen.A, RandomGen.C, RandomGen.MOD
+            seed = rng.seed
+            for g in range(len(batch)):
+                game = batch[g]
+                seed = (multiplier * seed + increment) % modulus
+                home = goal_sampler.value_of_cell((seed >> 16) % goal_cells)
+                seed = (multiplier * seed + increment) % modulus
+                away = goal_sampler.value_of_cell((seed >> 16) % goal_cells)
+                home_goals[g] = home
+                away_goals[g] = away
+                for team, goals in ((game.home_team, home), (game.away_team, away)):
+                    if goals == 0:
+                        continue
+                    _, outfield, sampler = rosters[id(team)]
+                    if sampler is None:
+                        raise ValueError(f"{team.name} has no outfield players to score.")
+                    for _ in range(goals):
+                        seed = (multiplier * seed + increment) % modulus
+                        scorers.append(outfield[sampler.index_of_cell((seed >> 16) % sampler.cells)])
+                scorer_offsets[g + 1] = len(scorers)
+            rng.seed = seed
+        else:
+            goals = array('L', [0]) * (2 * len(batch))
+            rng.randint_batch(0, goal_sampler.cells - 1, goals)
+            for g in range(len(batch)):
+                home_goals[g] = goal_sampler.value_of_cell(goals[2 * g])
+                away_goals[g] = goal_sampler.value_of_cell(goals[2 * g + 1])
+                scorer_offsets[g + 1] = scorer_offsets[g] + home_goals[g] + away_goals[g]
+            draws = array('L', [0]) * scorer_offsets[len(batch)]
+            rng.random_batch(draws)
+            scorers = array('H', [0]) * len(draws)
+            for g in range(len(batch)):
+                game = batch[g]
+                position = scorer_offsets[g]
+                for team, count in ((game.home_team, home_goals[g]), (game.away_team, away_goals[g])):
+                    if count == 0:
+                        continue
+                    _, outfield, sampler = rosters[id(team)]
+                    if sampler is None:
+                        raise ValueError(f"{team.name} has no outfield players to score.")
+                    for _ in range(count):
+                        scorers[position] = outfield[sampler.index_of_cell(draws[position] % sampler.cells)]
+                        position += 1
 
-        return GameSimulationOutcome(home_goals, away_goals, goal_scorers)
+        return BatchSimulationOutcome(batch, home_goals, away_goals, scorer_offsets, scorers, rosters)
@@ -6,6 +6,8 @@ It inherits from `LinearProbeTable` and features a custom hash function
 that intelligently parses date strings in various formats (e.g., YYYY/MM/DD,
 DD-MM-YYYY). This tailored function ensures a uniform distribution of date
 keys across the table, minimizing collisions and maintaining performance.
+The same parsing is exposed as `parse_date` and `date_key`, so dates written in
+different formats can also be compared and ordered.
 """
 
 from __future__ import annotations
@@ -13,6 +15,27 @@ from __future__ import annotations
 from data_structures.hash_table_linear_probing import LinearProbeTable
 
 
+def parse_date(date: str) -> tuple[int, int, int]:
+    """
+    Splits a date in any of the formats DD/MM/YYYY, DD-MM-YYYY, YYYY/MM/DD or YYYY-MM-DD
+    into (year, month, day).
+    :complexity: O(1), the date is always 10 characters long.
+    """
+    if date[4] in ('/', '-'):
+        return int(date[0:4]), int(date[5:7]), int(date[8:10])
+    return int(date[6:10]), int(date[3:5]), int(date[0:2])
+
+
+def date_key(date: str) -> int:
+    """
+    Returns the date as the integer YYYYMMDD, which orders dates chronologically whatever
+    format they were written in.
+    :complexity: O(1)
+    """
+    year, month, day = parse_date(date)
+    return year * 10000 + month * 100 + day
+
+
 class HashyDateTable(LinearProbeTable[str]):
     """
     HashyDateTable assumed the keys are strings representing dates, and therefore tries to
@@ -60,14 +83,7 @@ class HashyDateTable(LinearProbeTable[str]):
         MIN_YEAR = 1970
         non_leap_cumulative = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
         leap_cumulative = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
-        if key[4] in ('/', '-'):
-            year = int(key[0:4])
-            month = int(key[5:7]) 
-            day = int(key[8:10])
-        else:
-            day = int(key[0:2])
-            month = int(key[3:5])
-            year = int(key[6:10])
+        year, month, day = parse_date(key)
         if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
             cumulative = leap_cumulative
         else:
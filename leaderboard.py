@@ -0,0 +1,252 @@
+"""
+This module defines the `Leaderboard` class, which keeps the teams of a season
+ordered by their standing.
+
+Teams are held in an order statistic `AVLTree` keyed by (negated points, name rank),
+which is the same order `Team.__le__` describes. The leaderboard keeps its own table
+of name ranks, dense ranks of the team names in name order, so the tree compares
+integers only and the teams themselves are left untouched. When a team's points
+change only that team is moved, in O(log N), instead of re-sorting the whole table.
+"""
+
+from __future__ import annotations
+
+from algorithms import mergesort
+from data_structures.array_list import ArrayList
+from data_structures.avl_tree import AVLTree
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from team import Team
+
+
+def _by_name(team: Team) -> str:
+    return team.name
+
+
+def _by_points(team: Team) -> int:
+    return -team.points
+
+
+class Leaderboard:
+
+    def __init__(self, teams: ArrayR[Team] | ArrayList[Team]) -> None:
+        """
+        Constructor for the Leaderboard class
+
+        Args:
+            teams (ArrayR[Team]): The teams to rank
+
+        Complexity:
+            Best Case Complexity: O(NlogN*S), where N is len(teams) and S is comp(str) between team names
+            Worst Case Complexity: O(NlogN*S + N^2*K), where K is the cost of hashing a name, when the
+              rank table probes past every name
+            Explanation:
+            - the names are ranked once with __rank_names(), sorting the teams by name with mergesort
+            - the teams in name order are then sorted by points with mergesort, O(NlogN) integer comparisons;
+              mergesort is stable, so teams with equal points stay in name order
+            - the sorted teams are then turned into a balanced tree in O(N)
+        """
+        self.__ranks, ordered = self.__rank_names(teams)
+        ordered = mergesort.mergesort(ordered, key=_by_points)
+        keys = ArrayR(len(ordered))
+        for i in range(len(ordered)):
+            keys[i] = self._key(ordered[i].points, ordered[i])
+        self.__tree = AVLTree.from_sorted(keys, ordered)
+
+    @classmethod
+    def from_ranked(cls, teams: ArrayR[Team] | ArrayList[Team]) -> Leaderboard:
+        """
+        Builds a leaderboard from teams that are already in standings order (points, then name),
+        without sorting them again.
+
+        Raises:
+            ValueError: if the teams are not in standings order
+
+        Complexity:
+            Best Case Complexity: O(NlogN*S), where N is len(teams) and S is comp(str) between team names,
+              to rank the names
+            Worst Case Complexity: O(NlogN*S + N^2*K), where K is the cost of hashing a name, see __init__()
+        """
+        board = cls.__new__(cls)
+        board.__ranks, _ = board.__rank_names(teams)
+        keys = ArrayR(len(teams))
+        values = ArrayR(len(teams))
+        for i, team in enumerate(teams):
+            keys[i] = board._key(team.points, team)
+            values[i] = team
+            if i > 0 and keys[i] <= keys[i - 1]:
+                raise ValueError("The teams are not in standings order.")
+        board.__tree = AVLTree.from_sorted(keys, values)
+        return board
+
+    @staticmethod
+    def __rank_names(teams: ArrayR[Team] | ArrayList[Team]) -> tuple[LinearProbeTable, ArrayList[Team]]:
+        """
+        Gives every distinct name among the teams a dense rank in name order, teams with equal
+        names sharing a rank.
+
+        Returns:
+            tuple[LinearProbeTable, ArrayList[Team]]: The table from name to rank, and the teams in name order
+
+        Complexity:
+            Best Case Complexity: O(NlogN*S), where N is len(teams) and S is comp(str) between team names
+            Worst Case Complexity: O(NlogN*S + N^2*K), where K is the cost of hashing a name, when the
+              table probes past every name
+        """
+        ordered = ArrayList(max(len(teams), 1))
+        for team in teams:
+            ordered.append(team)
+        ordered = mergesort.mergesort(ordered, key=_by_name)
+        ranks = LinearProbeTable()
+        for i in range(len(ordered)):
+            if i == 0 or ordered[i].name != ordered[i - 1].name:
+                ranks[ordered[i].name] = len(ranks)
+        return ranks, ordered
+
+    def _key(self, points: int, team: Team) -> tuple[int, int]:
+        """
+        Returns the tree key of a team holding the given points.
+        Points are negated so that the highest points come first.
+
+        Raises:
+            KeyError: if no team of that name was ranked by the leaderboard
+        """
+        return -points, self.__ranks[team.name]
+
+    def __rank_new_name(self, team: Team) -> None:
+        """
+        Ranks the names again with a team whose name the leaderboard has not seen, and re-keys
+        the tree with the new ranks. The ranks follow name order, so the order of the tree is kept.
+        A new table is built, since copies of the leaderboard may share the old one.
+        :complexity: O(NlogN*S), see __rank_names()
+        """
+        teams = ArrayList(len(self.__tree) + 1)
+        for member in self.__tree:
+            teams.append(member)
+        teams.append(team)
+        ranks, _ = self.__rank_names(teams)
+        keys = ArrayR(len(self.__tree))
+        values = ArrayR(len(self.__tree))
+        for i, member in enumerate(self.__tree):
+            keys[i] = (self.__tree.key_at(i)[0], ranks[member.name])
+            values[i] = member
+        self.__tree = AVLTree.from_sorted(keys, values)
+        self.__ranks = ranks
+
+    def add(self, team: Team) -> None:
+        """
+        Adds a team to the leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(K + logN), where K is the cost of hashing the name, when a team of
+              that name was ranked by the leaderboard
+            Worst Case Complexity: O(NlogN*S), where S is comp(str) between team names, when the name is
+              new and the names are ranked again, see __rank_new_name()
+        """
+        if team.name not in self.__ranks:
+            self.__rank_new_name(team)
+        self.__tree.insert(self._key(team.points, team), team)
+
+    def remove(self, team: Team) -> None:
+        """
+        Removes a team from the leaderboard.
+
+        Raises:
+            KeyError: if the team is not in the leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(K + logN), where K is the cost of hashing the team's name
+            Worst Case Complexity: O(K + logN)
+        """
+        self.__tree.remove(self._key(team.points, team), team)
+
+    def reposition(self, team: Team, old_points: int) -> None:
+        """
+        Moves a team after its points changed from `old_points` to `team.points`.
+
+        Args:
+            team (Team): The team whose points changed
+            old_points (int): The points of the team when it was last placed on the leaderboard
+
+        Complexity:
+            Best Case Complexity: O(1), when the points did not change
+            Worst Case Complexity: O(K + logN), where N is the number of teams and K the cost of hashing the name
+            Explanation:
+            - the name rank is looked up in the rank table, O(K)
+            - the team is removed using its old key and inserted using its new key,
+              each is a single root to leaf walk of the tree comparing integer keys
+        """
+        if old_points == team.points:
+            return
+        self.__tree.remove(self._key(old_points, team), team)
+        self.__tree.insert(self._key(team.points, team), team)
+
+    def replace(self, old: Team, new: Team) -> None:
+        """
+        Puts `new` where `old` is. Both teams must have the same name and points, as a team and
+        its forks do.
+
+        Raises:
+            KeyError: if `old` is not in the leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(K + logN), where K is the cost of hashing the team's name
+            Worst Case Complexity: O(K + logN)
+        """
+        self.__tree.remove(self._key(old.points, old), old)
+        self.__tree.insert(self._key(new.points, new), new)
+
+    def copy(self) -> Leaderboard:
+        """
+        Returns an independent leaderboard holding the same teams.
+        :complexity: O(1), the tree nodes and the rank table are shared; the table is never changed in place.
+        """
+        board = Leaderboard.__new__(Leaderboard)
+        board.__ranks = self.__ranks
+        board.__tree = self.__tree.copy()
+        return board
+
+    def index(self, team: Team) -> int:
+        """
+        Returns the position of the team in the leaderboard, 0 being first.
+
+        Complexity:
+            Best Case Complexity: O(K + logN), where K is the cost of hashing the team's name
+            Worst Case Complexity: O(K + logN)
+        """
+        return self.__tree.rank(self._key(team.points, team))
+
+    def to_array_list(self) -> ArrayList[Team]:
+        """
+        Returns the teams in leaderboard order.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N)
+        """
+        result = ArrayList(len(self))
+        for team in self.__tree:
+            result.append(team)
+        return result
+
+    def __getitem__(self, index: int) -> Team:
+        """
+        Returns the team at a given position of the leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(logN)
+            Worst Case Complexity: O(logN)
+        """
+        return self.__tree[index]
+
+    def __len__(self) -> int:
+        return len(self.__tree)
+
+    def __iter__(self):
+        return iter(self.__tree)
+
+    def __str__(self) -> str:
+        return "Leaderboard [" + ", ".join(f"{team.name}: {team.points}" for team in self) + "]"
+
+    def __repr__(self) -> str:
+        return str(self)
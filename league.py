@@ -0,0 +1,277 @@
+"""
+This module provides `League`, which runs several divisions (tiers) season after
+season and moves teams between them at the end of each season.
+
+Each division plays a double round-robin `Season`. Divisions with the same
+number of teams share one schedule template (round_robin.schedule_template()),
+so a schedule is generated once per division size rather than once per season.
+The games of a week are simulated for all divisions together with
+parallel_week.run_week(), optionally spread over one pool of worker processes
+kept for the whole run, and each division's results are applied in game order,
+so the outcome does not depend on the number of workers.
+
+At the end of a season the bottom `promoted` teams of each division swap places
+with the top `promoted` teams of the division below. The same `Team` objects
+move, keeping their rosters, players and goals; only their points and result
+histories are cleared for the next season. Each division keeps its teams in
+name order, which is also the standings order when every team has 0 points,
+so a new season's standings are built without sorting.
+
+Usage:
+```
+league = League((("Premier", premier_teams), ("Championship", championship_teams)), seed=7)
+for standings in league.simulate(10, workers=4):
+    ...
+```
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from algorithms import mergesort
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+import parallel_week
+from random_gen import RandomGen
+import round_robin
+from season import Season
+from team import Team
+
+# The seasons of a league draw from substreams of the league seed this far apart,
+# which leaves room for SEASON_STREAM_WEEKS weeks of parallel_week game substreams
+# each, and for 2^18 seasons of all divisions together before the period runs out.
+SEASON_STREAM_WEEKS = 2 ** 8
+SEASON_STREAM_STRIDE = SEASON_STREAM_WEEKS * parallel_week.WEEK_STREAM_GAMES * parallel_week.GAME_STREAM_STRIDE
+
+
+def _by_name(team: Team) -> str:
+    return team.name
+
+
+class Division:
+    """
+    One tier of a league: its teams, in name order, and the season they are playing.
+    """
+
+    def __init__(self, name: str, teams: ArrayR[Team]) -> None:
+        self.name = name
+        self.teams = teams
+        self.season: Season | None = None
+
+    def __len__(self) -> int:
+        """ Returns the number of teams in the division. """
+        return len(self.teams)
+
+    def __str__(self) -> str:
+        return f"{self.name} ({len(self)} teams)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class League:
+
+    def __init__(self, divisions, promoted: int = 2, seed: int = 0, schedule_seed: int | None = None) -> None:
+        """
+        Args:
+            divisions: (name, teams) for each division, the top division first
+            promoted (int): The number of teams that move between two adjacent divisions each season
+            seed (int): The seed of the league. The same seed gives the same seasons for any number of workers.
+            schedule_seed (int or None): Seed for the order of teams in the schedule templates
+
+        Raises:
+            ValueError: if there are no divisions, a team name appears twice, or a division has too few
+              teams to promote and relegate `promoted` teams
+
+        Complexity:
+            Best Case Complexity: O(T*K + D*NlogN), where T is the number of teams, K the length of a
+              name, D the number of divisions and N the teams per division
+            Worst Case Complexity: O(T^2*K + D*NlogN*K), when the name table probes past every team
+        """
+        if len(divisions) == 0:
+            raise ValueError("A league needs at least one division.")
+        if promoted < 0:
+            raise ValueError("The number of promoted teams cannot be negative.")
+        self.promoted = promoted
+        self.seed = seed
+        self.schedule_seed = schedule_seed
+        self.year = 0
+        self.templates = LinearProbeTable()
+        self.divisions = ArrayR(len(divisions))
+
+        names = LinearProbeTable()
+        for index, (name, teams) in enumerate(divisions):
+            moving = promoted * ((index > 0) + (index < len(divisions) - 1))
+            if len(teams) < 2 or len(teams) < moving:
+                raise ValueError(f"Division {name} has too few teams.")
+            ordered = ArrayR(len(teams))
+            for i, team in enumerate(teams):
+                if team.name in names:
+                    raise ValueError(f"{team.name} is in the league twice.")
+                names[team.name] = index
+                ordered[i] = team
+            self.divisions[index] = Division(name, mergesort.mergesort(ordered, key=_by_name))
+
+    def template(self, num_teams: int) -> ArrayR[ArrayR[tuple[int, int]]]:
+        """
+        Returns the schedule template for divisions of num_teams teams, generating it the first time.
+        :complexity: O(K) when the template exists, where K is the number of digits of num_teams,
+            O(N^2) when it is generated.
+        """
+        key = str(num_teams)
+        if key not in self.templates:
+            self.templates[key] = round_robin.schedule_template(num_teams, self.schedule_seed)
+        return self.templates[key]
+
+    def start_season(self) -> None:
+        """
+        Clears every team's points and history and builds each division's season from its template.
+
+        Complexity:
+            Best Case Complexity: O(T + G), where T is the number of teams and G the number of games,
+              when every template exists
+            Worst Case Complexity: O(T*K + G + D*N^2), when the templates are generated
+        """
+        for division in self.divisions:
+            for team in division.teams:
+                team.new_season()
+            division.season = Season.from_template(division.teams, self.template(len(division)), ranked=True)
+
+    def play_season(self, executor=None, workers: int = 1) -> ArrayR[ArrayR[Team]]:
+        """
+        Plays a season in every division, then promotes and relegates teams.
+
+        Args:
+            executor: A thread or process pool from concurrent.futures, or None to run in this thread
+            workers (int): The number of chunks each week's games are split into for the executor
+
+        Returns:
+            ArrayR[ArrayR[Team]]: The final standings of each division, top division first. The teams
+              keep their points until the next season starts.
+
+        Raises:
+            ValueError: if a division's season has more than SEASON_STREAM_WEEKS weeks, or the league
+              has played so many seasons that their substreams would run past the generator's period
+
+        Complexity:
+            Best Case Complexity: O(G * (logW + P + logN*K + S) + T), where G is the number of games,
+              see Season.simulate_week_parallel(), and T the number of teams
+            Worst Case Complexity: the same, plus O(D*N^2) if templates are generated
+        """
+        self.start_season()
+        count = len(self.divisions)
+        for index in range(count):
+            if len(self.divisions[index].season.schedule) > SEASON_STREAM_WEEKS:
+                raise ValueError(f"A league season can have at most {SEASON_STREAM_WEEKS} weeks.")
+        seeds = ArrayR(count)
+        for index in range(count):
+            seeds[index] = RandomGen.substream_seed(self.seed, self.year * count + index, SEASON_STREAM_STRIDE)
+
+        active = ArrayList(count)
+        while True:
+            active.clear()
+            games = 0
+            for index in range(count):
+                season = self.divisions[index].season
+                if season.current_week < len(season.schedule):
+                    teams, tasks = season._parallel_week_tasks(seeds[index])
+                    active.append((season, teams, tasks))
+                    games += len(tasks)
+            if len(active) == 0:
+                break
+            all_tasks = ArrayR(games)
+            offset = 0
+            for _, _, tasks in active:
+                for task in tasks:
+                    all_tasks[offset] = task
+                    offset += 1
+            outcomes = parallel_week.run_week(tuple(all_tasks), executor, workers)
+            offset = 0
+            for season, teams, tasks in active:
+                season._apply_parallel_week(teams, outcomes[offset:offset + len(tasks)])
+                offset += len(tasks)
+
+        standings = ArrayR(count)
+        for index in range(count):
+            board = self.divisions[index].season.standings
+            table = ArrayR(len(board))
+            for place, team in enumerate(board):
+                table[place] = team
+            standings[index] = table
+        self.promote_and_relegate(standings)
+        self.year += 1
+        return standings
+
+    def promote_and_relegate(self, standings: ArrayR[ArrayR[Team]]) -> None:
+        """
+        Moves the bottom `promoted` teams of each division down and the top `promoted` teams of the
+        division below up, keeping each division's teams in name order.
+
+        Complexity:
+            Best Case Complexity: O(T*K + D*PlogP), where T is the number of teams, K the length of a name,
+              D the number of divisions and P the number of promoted teams
+            Worst Case Complexity: O(T^2*K + D*PlogP*K), when the table of moving teams probes past
+              every other name
+            Explanation:
+            - each division's remaining teams are filtered in name order, the teams arriving are
+              sorted, and the two are merged, so no division is sorted again in full
+        """
+        count = len(self.divisions)
+        if self.promoted == 0 or count < 2:
+            return
+        leaving = LinearProbeTable()
+        arriving = ArrayR(count)
+        for index in range(count):
+            arriving[index] = ArrayList(2 * self.promoted)
+        for index in range(count - 1):
+            upper = standings[index]
+            lower = standings[index + 1]
+            for place in range(self.promoted):
+                relegated = upper[len(upper) - 1 - place]
+                winner = lower[place]
+                leaving[relegated.name] = index
+                leaving[winner.name] = index + 1
+                arriving[index + 1].append(relegated)
+                arriving[index].append(winner)
+
+        for index in range(count):
+            division = self.divisions[index]
+            staying = ArrayList(len(division))
+            for team in division.teams:
+                if team.name not in leaving:
+                    staying.append(team)
+            merged = mergesort.merge(staying, mergesort.mergesort(arriving[index], key=_by_name), key=_by_name)
+            teams = ArrayR(len(merged))
+            for i in range(len(merged)):
+                teams[i] = merged[i]
+            division.teams = teams
+
+    def simulate(self, seasons: int, workers: int = 1, processes: bool = True) -> ArrayList[ArrayR[ArrayR[Team]]]:
+        """
+        Plays a number of seasons, see play_season().
+
+        Args:
+            seasons (int): The number of seasons
+            workers (int): The number of workers. With 1, everything runs in this thread.
+            processes (bool): Whether to use a process pool rather than a thread pool
+
+        Returns:
+            ArrayList[ArrayR[ArrayR[Team]]]: The final standings of every season. Only the last season's
+              points are still held by the teams.
+
+        Complexity:
+            Best Case Complexity: O(Y * C), where Y is seasons and C the cost of play_season()
+            Worst Case Complexity: O(Y * C)
+        """
+        results = ArrayList(max(seasons, 1))
+        if workers <= 1:
+            for _ in range(seasons):
+                results.append(self.play_season())
+            return results
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with pool(max_workers=workers) as executor:
+            for _ in range(seasons):
+                results.append(self.play_season(executor, workers))
+        return results
@@ -0,0 +1,262 @@
+"""
+This module plays a `Season` on a match-day clock and streams the results to any
+number of subscribers over local TCP or Unix sockets, with asyncio.
+
+`LiveSeasonServer` plays one `WeekOfGames` per tick. The week is simulated in an
+executor, so the event loop keeps accepting and serving subscribers meanwhile;
+the games are reported through an `EventSink` and encoded there, off the loop.
+Each message is one line of JSON, encoded once and shared by every subscriber:
+
+    {"type": "game", "week": 3, "home": "Sharks", "away": "Wolves",
+     "home_goals": 2, "away_goals": 1, "scorers": ["..."], "sent": 1234.5}
+    {"type": "standings", "week": 3, "table": [["Sharks", 9], ...], "sent": 1234.5}
+    {"type": "end", "sent": 1234.5}
+
+"week" is the position the week was played at and "sent" is time.monotonic()
+when the message was encoded, so a local client can measure its latency.
+
+Every subscriber has its own bounded queue. Publishing only appends to the
+queues and never waits, and each subscriber's writer task waits on its own
+socket, so a slow client cannot stall the simulation or the other clients. When
+a subscriber's queue is full, its oldest message is dropped and counted in
+`Subscriber.dropped`; a client sees the gap as a missing week or game. A client
+that connects after the season has ended gets only the end message.
+
+Usage:
+```
+server = LiveSeasonServer(season, tick=1.0)
+host, port = await server.start_tcp("127.0.0.1", 8765)
+await server.run()
+await server.close()
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import time
+
+from data_structures.array_list import ArrayList
+from data_structures.circular_queue import CircularQueue
+from game_simulator import GameSimulationOutcome
+from match_log import EventSink
+from season import Season
+from team import Team
+
+
+def encode(message: dict) -> bytes:
+    """
+    Stamps a message with the time and encodes it as one line of JSON.
+    :complexity: O(B) where B is the size of the message.
+    """
+    message["sent"] = time.monotonic()
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+class _WeekCollector(EventSink):
+    """
+    Encodes the games of a week as they are played. Runs in the executor thread.
+    """
+
+    def __init__(self, week: int) -> None:
+        self.week = week
+        self.messages = ArrayList()
+
+    def record_game(self, week: int, home_team: Team, away_team: Team, outcome: GameSimulationOutcome) -> None:
+        self.messages.append(encode({
+            "type": "game",
+            "week": self.week,
+            "home": home_team.name,
+            "away": away_team.name,
+            "home_goals": outcome.home_goals,
+            "away_goals": outcome.away_goals,
+            "scorers": tuple(outcome.goal_scorers),
+        }))
+
+
+class Subscriber:
+    """
+    A connected client: its socket writer and the queue of messages not yet written to it.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int) -> None:
+        self.writer = writer
+        self.queue = CircularQueue(queue_size)
+        self.ready = asyncio.Event()
+        self.closing = False
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, message: bytes) -> None:
+        """
+        Queues a message, dropping the oldest queued one if the queue is full. Never waits.
+        :complexity: O(1)
+        """
+        if self.queue.is_full():
+            self.queue.serve()
+            self.dropped += 1
+        self.queue.append(message)
+        self.ready.set()
+
+    def finish(self) -> None:
+        """ Lets the writer task end once the queue is empty. """
+        self.closing = True
+        self.ready.set()
+
+    async def pump(self) -> None:
+        """
+        Writes queued messages until finish() is called and the queue is empty, or the client
+        goes away. Every message queued when the task wakes is written before waiting for the
+        socket to drain, so a client that keeps up gets one drain per batch rather than per message.
+        """
+        while True:
+            if self.queue.is_empty():
+                if self.closing:
+                    return
+                self.ready.clear()
+                await self.ready.wait()
+                continue
+            while not self.queue.is_empty():
+                self.writer.write(self.queue.serve())
+                self.sent += 1
+            await self.writer.drain()
+
+
+class LiveSeasonServer:
+
+    def __init__(self, season: Season, tick: float = 1.0, queue_size: int = 1024,
+                 executor=None, close_timeout: float = 5.0) -> None:
+        """
+        Args:
+            season (Season): The season to play, from its current week
+            tick (float): Seconds between the starts of two weeks. With 0, weeks are played back to back.
+            queue_size (int): The number of messages each subscriber can fall behind before its
+              oldest messages are dropped
+            executor: The concurrent.futures executor weeks are simulated in, or None for the
+              event loop's default thread pool
+            close_timeout (float): Seconds subscribers get to receive their queued messages at the end
+
+        Raises:
+            ValueError: if tick is negative or queue_size is less than 1
+        """
+        if tick < 0:
+            raise ValueError("The tick cannot be negative.")
+        if queue_size < 1:
+            raise ValueError("A subscriber queue must hold at least one message.")
+        self.season = season
+        self.tick = tick
+        self.queue_size = queue_size
+        self.executor = executor
+        self.close_timeout = close_timeout
+        self.subscribers = ArrayList()
+        self.weeks_played = 0
+        self.__end_message: bytes | None = None
+        self.__servers = ArrayList()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """
+        Listens for subscribers on a TCP port. Port 0 picks a free port.
+
+        Returns:
+            tuple[str, int]: The address the server listens on
+        """
+        server = await asyncio.start_server(self.__on_connect, host, port)
+        self.__servers.append(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str) -> None:
+        """ Listens for subscribers on a Unix socket. """
+        server = await asyncio.start_unix_server(self.__on_connect, path)
+        self.__servers.append(server)
+
+    async def __on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        sock = writer.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        subscriber = Subscriber(writer, self.queue_size)
+        if self.__end_message is not None:
+            # The season is over, so nothing else will be published or finish() this subscriber.
+            subscriber.offer(self.__end_message)
+            subscriber.finish()
+        self.subscribers.append(subscriber)
+        try:
+            await subscriber.pump()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.subscribers.remove(subscriber)
+            writer.close()
+
+    def publish(self, line: bytes) -> None:
+        """
+        Queues an encoded message for every subscriber, see encode().
+        :complexity: O(C) where C is the number of subscribers, the bytes being shared.
+        """
+        for subscriber in tuple(self.subscribers):
+            subscriber.offer(line)
+
+    def _play_week(self) -> ArrayList[bytes] | None:
+        """
+        Simulates the next week and returns its encoded messages, or None when the season is over.
+        Runs in the executor; the event loop does not touch the season meanwhile.
+        :complexity: O(G * (logN*K + S)) for the week, see Season.simulate_week(), plus O(N) for the table.
+        """
+        collector = _WeekCollector(self.season.current_week + 1)
+        previous_sink = self.season.event_sink
+        self.season.event_sink = collector
+        try:
+            if not self.season.simulate_week():
+                return None
+        finally:
+            self.season.event_sink = previous_sink
+        table = tuple((team.name, team.points) for team in self.season.leaderboard)
+        collector.messages.append(encode({"type": "standings", "week": collector.week, "table": table}))
+        return collector.messages
+
+    async def run(self) -> None:
+        """
+        Plays the rest of the season, one week per tick, publishing each week's games and standings,
+        then publishes the end message and waits up to close_timeout for subscribers to receive
+        what is queued for them. Subscribers that connect after that get the end message alone.
+        A week that takes longer than a tick delays the next one rather than being followed by a burst.
+        """
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_tick = max(next_tick + self.tick, loop.time())
+            messages = await loop.run_in_executor(self.executor, self._play_week)
+            if messages is None:
+                break
+            self.weeks_played += 1
+            for message in messages:
+                self.publish(message)
+        self.__end_message = encode({"type": "end"})
+        self.publish(self.__end_message)
+        await self.__drain_subscribers()
+
+    async def __drain_subscribers(self) -> None:
+        for subscriber in tuple(self.subscribers):
+            subscriber.finish()
+        deadline = asyncio.get_running_loop().time() + self.close_timeout
+        while len(self.subscribers) > 0 and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.01)
+        # Whoever is still connected is not reading, so a graceful close would wait for them too.
+        for subscriber in tuple(self.subscribers):
+            subscriber.writer.transport.abort()
+
+    async def close(self) -> None:
+        """ Stops listening and disconnects every subscriber, dropping what is still queued for them. """
+        for server in self.__servers:
+            server.close()
+        for subscriber in tuple(self.subscribers):
+            subscriber.queue.clear()
+            subscriber.finish()
+            subscriber.writer.transport.abort()
+        for server in self.__servers:
+            await server.wait_closed()
+        self.__servers.clear()
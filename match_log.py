@@ -0,0 +1,379 @@
+"""
+This module provides an append-only binary log of simulated games, and a reader
+that replays it without re-running the random number generator.
+
+`EventSink` is the interface a `Season` reports every game to. `MatchLogWriter`
+is a sink that appends one fixed-width record per game to a log file:
+
+    week (u32), home team id (u32), away team id (u32), home goals (u8),
+    away goals (u8), offset of the first scorer in the side buffer (u64)
+
+and the game's scorers to a side file (`<path>.scorers`) as u16 ids, home
+scorers first. Both files are written through large write buffers. The log
+starts with a header holding the team names and rosters; a team id is the
+team's index in it and a scorer id is the player's index in its team's roster.
+
+`MatchLogReader` memory-maps both files, so records are read in place, and can
+replay them onto fresh teams to rebuild points, result histories and goals.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+
+from binary_io import BinaryReader, BinaryWriter
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulationOutcome
+from team import Team
+from enums import TeamGameResult
+
+
+class EventSink(ABC):
+    """
+    Receives every game a season simulates, after its result has been applied.
+    """
+
+    @abstractmethod
+    def record_game(self, week: int, home_team: Team, away_team: Team, outcome: GameSimulationOutcome) -> None:
+        """ Called once per game, in the order the games are applied. """
+        pass
+
+    def close(self) -> None:
+        """ Called when no more games will be recorded. """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+MAGIC = b"SSML"
+VERSION = 1
+RECORD = struct.Struct("<IIIBBQ")
+SCORER_ID = "H"
+SCORER_SIZE = 2
+
+
+def _side_path(path: str) -> str:
+    return path + ".scorers"
+
+
+def _header(teams) -> bytes:
+    """
+    Returns the header for a log of games between `teams`.
+    :complexity: O(P) where P is the number of players in all teams.
+    """
+    writer = BinaryWriter(MAGIC, VERSION)
+    writer.pack("<I", len(teams))
+    for team in teams:
+        writer.write_str(team.name)
+        players = team.get_players()
+        writer.pack("<I", len(players))
+        for player in players:
+            writer.write_str(player.name)
+    return bytes(writer.buffer)
+
+
+class MatchLogWriter(EventSink):
+    """
+    Appends every game reported to it to a match log.
+
+    Usage:
+    ```
+    with MatchLogWriter("season.log", season.teams) as log:
+        season.simulate_season(event_sink=log)
+    ```
+    """
+
+    def __init__(self, path: str, teams, buffer_size: int = 1 << 16) -> None:
+        """
+        Opens a log for appending. A new log starts with the header for `teams`; an existing
+        log must have been started with the same teams and rosters.
+
+        Args:
+            path (str): The log file. Scorers go to path + ".scorers".
+            teams: The teams of the season, in the order that gives their ids
+            buffer_size (int): The size of the write buffer of each file, in bytes
+
+        Raises:
+            ValueError: if an existing log was written for other teams, or is damaged
+
+        Complexity:
+            Best Case Complexity: O(P + T*K), where P is the number of players in all teams, T the number
+              of teams and K the length of a name
+            Worst Case Complexity: O(P + T^2*K), when the team tables probe past every team
+        """
+        header = _header(teams)
+        self.path = path
+        self.__team_ids = LinearProbeTable()
+        # Each team's roster is indexed the first time one of its players scores, see __scorer_id().
+        self.__roster_ids = LinearProbeTable()
+        for index, team in enumerate(teams):
+            self.__team_ids[team.name] = index
+            self.__roster_ids[team.name] = None
+
+        existing = os.path.exists(path) and os.path.getsize(path) > 0
+        side_size = os.path.getsize(_side_path(path)) if os.path.exists(_side_path(path)) else 0
+        if existing:
+            with open(path, "rb") as file:
+                if file.read(len(header)) != header:
+                    raise ValueError("The log was started for other teams.")
+            if (os.path.getsize(path) - len(header)) % RECORD.size != 0 or side_size % SCORER_SIZE != 0:
+                raise ValueError("The log ends with a partial record.")
+        else:
+            side_size = 0
+        self.__scorer_count = side_size // SCORER_SIZE
+        self.__log = open(path, "ab", buffering=buffer_size)
+        self.__scorers = open(_side_path(path), "wb" if not existing else "ab", buffering=buffer_size)
+        if not existing:
+            self.__log.write(header)
+
+    def __scorer_id(self, team: Team, player, name: str) -> int:
+        """
+        Returns the index of a player in its team's roster, found by identity if `player` is
+        given and by name otherwise. Rosters are indexed once, and again when a player is not
+        found, e.g. after a forked season copied it; a copied player is then found by name.
+        :complexity: O(K) amortised, where K is the length of the key hashed, O(P*K) when the
+            roster is indexed.
+        """
+        ids = self.__roster_ids[team.name]
+        if ids is not None:
+            index = self.__find_scorer(ids, player, name)
+            if index is not None:
+                return index
+        ids = self.__index_roster(team)
+        self.__roster_ids[team.name] = ids
+        index = self.__find_scorer(ids, player, name)
+        if index is None and player is not None:
+            index = self.__find_scorer(ids, None, name)
+        if index is None:
+            raise ValueError(f"{name} is not in the roster of {team.name}.")
+        return index
+
+    @staticmethod
+    def __find_scorer(ids: tuple[LinearProbeTable[int], LinearProbeTable[int]], player, name: str) -> int | None:
+        """
+        Returns the roster index of `player` by identity if it is given, or of the first player
+        called `name` otherwise, or None if there is none.
+        :complexity: O(K), where K is the length of the key hashed
+        """
+        by_identity, by_name = ids
+        table, key = (by_identity, str(id(player))) if player is not None else (by_name, name)
+        return table[key] if key in table else None
+
+    @staticmethod
+    def __index_roster(team: Team) -> tuple[LinearProbeTable[int], LinearProbeTable[int]]:
+        """
+        Returns tables from the identity of each player of the team, and from each player name
+        (its first holder), to the player's index in the roster.
+        :complexity: O(P*K), where P is the number of players in the team
+        """
+        by_identity = LinearProbeTable()
+        by_name = LinearProbeTable()
+        for index, member in enumerate(team.get_players()):
+            by_identity[str(id(member))] = index
+            if member.name not in by_name:
+                by_name[member.name] = index
+        return by_identity, by_name
+
+    def record_game(self, week: int, home_team: Team, away_team: Team, outcome: GameSimulationOutcome) -> None:
+        """
+        Appends a game to the log.
+
+        Complexity:
+            Best Case Complexity: O(K + S*K), where S is the number of goals and K the length of a key hashed
+            Worst Case Complexity: O((S + P)*K), when a roster has to be indexed again
+        """
+        scorers = array(SCORER_ID)
+        for i in range(len(outcome.goal_scorers)):
+            team = home_team if i < outcome.home_goals else away_team
+            player = outcome.scorer_players[i] if outcome.scorer_players is not None else None
+            scorers.append(self.__scorer_id(team, player, outcome.goal_scorers[i]))
+        self.__log.write(RECORD.pack(
+            week, self.__team_ids[home_team.name], self.__team_ids[away_team.name],
+            outcome.home_goals, outcome.away_goals, self.__scorer_count,
+        ))
+        if len(scorers) > 0:
+            if sys.byteorder != "little":
+                scorers.byteswap()
+            self.__scorers.write(scorers.tobytes())
+            self.__scorer_count += len(scorers)
+
+    def flush(self) -> None:
+        """ Writes out everything buffered so far. """
+        self.__log.flush()
+        self.__scorers.flush()
+
+    def close(self) -> None:
+        """ Flushes and closes both files. """
+        if not self.__log.closed:
+            self.__log.close()
+            self.__scorers.close()
+
+
+class MatchLogReader:
+    """
+    Reads a match log in place through memory maps.
+
+    Usage:
+    ```
+    with MatchLogReader("season.log") as log:
+        log.replay(fresh_teams)
+    ```
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Raises:
+            ValueError: if the file is not a match log
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of players in the header
+            Worst Case Complexity: O(P)
+        """
+        self.__files = ArrayR(2)
+        self.__maps = ArrayR(2)
+        self.__records = None
+        self.__scorer_ids = None
+        for i, file_path in enumerate((path, _side_path(path))):
+            file = open(file_path, "rb")
+            self.__files[i] = file
+            self.__maps[i] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(file_path) > 0 else None
+        if self.__maps[0] is None:
+            self.close()
+            raise ValueError("Not a match log.")
+
+        try:
+            header = BinaryReader(self.__maps[0], MAGIC, VERSION)
+            self.team_names = ArrayR(header.unpack("<I")[0])
+            self.roster_sizes = ArrayR(len(self.team_names))
+            for index in range(len(self.team_names)):
+                self.team_names[index] = header.read_str()
+                self.roster_sizes[index] = header.unpack("<I")[0]
+                for _ in range(self.roster_sizes[index]):
+                    header.read_str()
+        except ValueError:
+            self.close()
+            raise
+        self.__start = header.offset
+
+        self.__records = memoryview(self.__maps[0])[self.__start:]
+        self.__count = len(self.__records) // RECORD.size
+        self.__scorer_ids = memoryview(self.__maps[1] if self.__maps[1] is not None else b"").cast(SCORER_ID)
+
+    def __len__(self) -> int:
+        """ Returns the number of games in the log. """
+        return self.__count
+
+    def __getitem__(self, index: int) -> tuple:
+        """
+        Returns game `index` as (week, home id, away id, home goals, away goals, scorer ids).
+        :complexity: O(S) where S is the number of goals in the game.
+        """
+        if index < 0:
+            index += self.__count
+        if index < 0 or index >= self.__count:
+            raise IndexError("Game out of bounds.")
+        week, home, away, home_goals, away_goals, offset = RECORD.unpack_from(self.__records, index * RECORD.size)
+        return week, home, away, home_goals, away_goals, tuple(self.__scorer_ids[offset:offset + home_goals + away_goals])
+
+    def __iter__(self):
+        """ Yields every game in the order it was logged. """
+        for index in range(self.__count):
+            yield self[index]
+
+    def team_points(self) -> ArrayR[int]:
+        """
+        Returns the points every team earned in the logged games, by team id.
+        :complexity: O(G) where G is the number of games.
+        """
+        points = ArrayR(len(self.team_names))
+        for index in range(len(points)):
+            points[index] = 0
+        for _, home, away, home_goals, away_goals, _ in RECORD.iter_unpack(self.__records[:self.__count * RECORD.size]):
+            if home_goals > away_goals:
+                points[home] += TeamGameResult.WIN.value
+            elif home_goals < away_goals:
+                points[away] += TeamGameResult.WIN.value
+            else:
+                points[home] += TeamGameResult.DRAW.value
+                points[away] += TeamGameResult.DRAW.value
+        return points
+
+    def replay(self, teams) -> None:
+        """
+        Applies every logged game to `teams`: results (points and history) and goals.
+
+        Args:
+            teams: Teams with the names and rosters the log was written for, in the state they
+              were in when logging started (usually freshly built). They may be in any order.
+
+        Raises:
+            ValueError: if a team of the log is missing or its roster has a different size
+
+        Complexity:
+            Best Case Complexity: O(G + S + P + T*K), where G is the number of games, S the number of goals,
+              P the number of players, T the number of teams and K the length of a team name
+            Worst Case Complexity: O(G + S + P + T^2*K), when the name table probes past every team
+        """
+        by_name = LinearProbeTable()
+        for team in teams:
+            by_name[team.name] = team
+        resolved = ArrayR(len(self.team_names))
+        rosters = ArrayR(len(self.team_names))
+        for index in range(len(self.team_names)):
+            if self.team_names[index] not in by_name:
+                raise ValueError(f"{self.team_names[index]} is missing.")
+            team = by_name[self.team_names[index]]
+            players = team.get_players()
+            if len(players) != self.roster_sizes[index]:
+                raise ValueError(f"The roster of {team.name} does not match the log.")
+            roster = ArrayR(len(players))
+            for i, player in enumerate(players):
+                roster[i] = player
+            resolved[index] = team
+            rosters[index] = roster
+
+        scorer_ids = self.__scorer_ids
+        for _, home, away, home_goals, away_goals, offset in RECORD.iter_unpack(self.__records[:self.__count * RECORD.size]):
+            if home_goals > away_goals:
+                home_result, away_result = TeamGameResult.WIN, TeamGameResult.LOSS
+            elif home_goals < away_goals:
+                home_result, away_result = TeamGameResult.LOSS, TeamGameResult.WIN
+            else:
+                home_result = away_result = TeamGameResult.DRAW
+            resolved[home].add_result(home_result)
+            resolved[away].add_result(away_result)
+            for i in range(home_goals):
+                rosters[home][scorer_ids[offset + i]].goals += 1
+            for i in range(home_goals, home_goals + away_goals):
+                rosters[away][scorer_ids[offset + i]].goals += 1
+
+    def close(self) -> None:
+        """ Releases the memory maps and closes the files. """
+        if self.__records is not None:
+            self.__records.release()
+            self.__scorer_ids.release()
+            self.__records = None
+            self.__scorer_ids = None
+        for i in range(2):
+            if self.__maps[i] is not None:
+                self.__maps[i].close()
+                self.__maps[i] = None
+            if self.__files[i] is not None:
+                self.__files[i].close()
+                self.__files[i] = None
+
+    def __enter__(self) -> MatchLogReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
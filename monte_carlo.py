@@ -0,0 +1,281 @@
+"""
+This module provides a Monte Carlo runner that replays the same league many
+times to estimate how likely each team is to finish in each position.
+
+Replications are split into contiguous blocks and spread over a pool of worker
+processes. Replication i draws from substream i of the master seed, so it makes
+the same draws whichever worker runs it. Histograms are merged by addition, so
+the result for a given master seed does not depend on the number of workers.
+
+`Team` and `Player` objects hold ctypes arrays, which cannot be pickled, so the
+rosters, with the players' stats and each team's scorer stat, are sent to the
+workers as plain tuples and rebuilt there.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition, ScheduleMethod
+from player import Player
+from random_gen import RandomGen
+from season import Season
+from team import Team
+
+
+def roster_from_teams(teams: ArrayR[Team]) -> tuple:
+    """
+    Converts teams into nested tuples of (team name, history length, scorer stat, players),
+    where each player is (name, position value, birth year, stats) and stats are
+    (statistic, value) pairs.
+
+    Complexity:
+        Best Case Complexity: O(P*M), where P is the number of players in all teams and M the size
+          of a player's stats table
+        Worst Case Complexity: O(P*M)
+    """
+    roster = ArrayR(len(teams))
+    for i, team in enumerate(teams):
+        team_players = team.get_players()
+        players = ArrayR(len(team_players))
+        for j, player in enumerate(team_players):
+            stats = tuple((statistic, player.stats[statistic]) for statistic in player.stats.keys())
+            players[j] = (player.name, player.position.value, player.born_year, stats)
+        roster[i] = (team.name, team.history_length, team.scorer_stat, tuple(players.to_list()))
+    return tuple(roster.to_list())
+
+
+def _build_teams(roster: tuple) -> ArrayR[Team]:
+    """
+    Builds fresh teams from a roster produced by roster_from_teams().
+
+    Complexity:
+        Best Case Complexity: O(P), where P is the number of players in the roster
+        Worst Case Complexity: O(P), where P is the number of players in the roster
+    """
+    teams = ArrayR(len(roster))
+    for i, (team_name, history_length, scorer_stat, player_specs) in enumerate(roster):
+        players = ArrayR(len(player_specs))
+        for j, (name, position, born_year, stats) in enumerate(player_specs):
+            players[j] = Player.from_record(name, PlayerPosition(position), born_year, stats)
+        teams[i] = Team(team_name, players, history_length)
+        teams[i].set_scorer_stat(scorer_stat)
+    return teams
+
+
+def _run_block(roster: tuple, schedule_method: str, master_seed: int, start: int, stop: int) -> tuple:
+    """
+    Runs replications start to stop - 1 and returns their finishing histograms.
+
+    The histogram is a flat tuple where entry team * N + position counts how often the team
+    at that roster index finished in that position. Team names are assumed to be unique.
+
+    Complexity:
+        Best Case Complexity: O(R * S), where R is stop - start and S is the cost of building and
+          simulating one season
+        Worst Case Complexity: O(R * S)
+    """
+    num_teams = len(roster)
+    counts = ArrayR(num_teams * num_teams)
+    for i in range(len(counts)):
+        counts[i] = 0
+    for replication in range(start, stop):
+        teams = _build_teams(roster)
+        index_of = LinearProbeTable()
+        for i in range(num_teams):
+            index_of[teams[i].name] = i
+        season = Season(teams, ScheduleMethod(schedule_method), rng=RandomGen.substream(master_seed, replication))
+        season.simulate_season()
+        for position, team in enumerate(season.standings):
+            counts[index_of[team.name] * num_teams + position] += 1
+    return tuple(counts.to_list())
+
+
+class MonteCarloResult:
+    """
+    Finishing position histograms of every team over a number of replications.
+    """
+
+    def __init__(self, team_names: ArrayR[str], replications: int, counts: ArrayR[int]) -> None:
+        """
+        Args:
+            team_names (ArrayR[str]): The names of the teams, in roster order
+            replications (int): The number of seasons simulated
+            counts (ArrayR[int]): Flat histogram, entry team * N + position counts how often
+              the team finished in that position (0 being first)
+        """
+        self.team_names = team_names
+        self.replications = replications
+        self.counts = counts
+
+    def __len__(self) -> int:
+        """ Returns the number of teams. """
+        return len(self.team_names)
+
+    def _team_index(self, team_name: str) -> int:
+        """
+        :complexity: O(N) where N is the number of teams.
+        :raises KeyError: if no team has that name.
+        """
+        for i in range(len(self.team_names)):
+            if self.team_names[i] == team_name:
+                return i
+        raise KeyError(team_name)
+
+    def histogram(self, team_name: str) -> ArrayR[int]:
+        """
+        Returns how often the team finished in each position.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams
+            Worst Case Complexity: O(N), where N is the number of teams
+        """
+        num_teams = len(self)
+        base = self._team_index(team_name) * num_teams
+        result = ArrayR(num_teams)
+        for position in range(num_teams):
+            result[position] = self.counts[base + position]
+        return result
+
+    def probability(self, team_name: str, best: int, worst: int) -> float:
+        """
+        Returns the fraction of replications in which the team finished between
+        positions `best` and `worst` inclusive, 0 being first.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams
+            Worst Case Complexity: O(N), where N is the number of teams
+        """
+        if self.replications == 0:
+            return 0.0
+        base = self._team_index(team_name) * len(self)
+        total = 0
+        for position in range(max(best, 0), min(worst, len(self) - 1) + 1):
+            total += self.counts[base + position]
+        return total / self.replications
+
+    def title_probability(self, team_name: str) -> float:
+        """ Returns the probability of the team finishing first. """
+        return self.probability(team_name, 0, 0)
+
+    def top_probability(self, team_name: str, places: int = 4) -> float:
+        """ Returns the probability of the team finishing in the top `places` positions. """
+        return self.probability(team_name, 0, places - 1)
+
+    def relegation_probability(self, team_name: str, places: int = 3) -> float:
+        """ Returns the probability of the team finishing in the bottom `places` positions. """
+        return self.probability(team_name, len(self) - places, len(self) - 1)
+
+    def merge(self, other: MonteCarloResult) -> MonteCarloResult:
+        """
+        Combines the histograms of two runs over the same teams.
+
+        Complexity:
+            Best Case Complexity: O(N^2), where N is the number of teams
+            Worst Case Complexity: O(N^2), where N is the number of teams
+        """
+        if len(self) != len(other):
+            raise ValueError("Cannot merge results for different leagues.")
+        counts = ArrayR(len(self.counts))
+        for i in range(len(counts)):
+            counts[i] = self.counts[i] + other.counts[i]
+        return MonteCarloResult(self.team_names, self.replications + other.replications, counts)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"{self.team_names[i]}: title {self.title_probability(self.team_names[i]):.3f}, "
+            f"top 4 {self.top_probability(self.team_names[i]):.3f}, "
+            f"relegation {self.relegation_probability(self.team_names[i]):.3f}"
+            for i in range(len(self))
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class MonteCarloSimulator:
+    """
+    Replays a league many times over a pool of worker processes.
+
+    Usage:
+    ```
+    simulator = MonteCarloSimulator(teams, workers=4)
+    result = simulator.run(10000, master_seed=123)
+    result.title_probability("Dragons")
+    ```
+    """
+
+    def __init__(
+        self,
+        teams: ArrayR[Team],
+        workers: int = 1,
+        schedule_method: ScheduleMethod = ScheduleMethod.GREEDY,
+    ) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams of the league. Only their rosters are used,
+              the team objects themselves are never simulated.
+            workers (int): The number of worker processes. With 1, everything runs in this process.
+            schedule_method (ScheduleMethod): How each replicated season builds its schedule
+        """
+        if workers < 1:
+            raise ValueError("At least one worker is needed.")
+        self.roster = roster_from_teams(teams)
+        self.team_names = ArrayR(len(self.roster))
+        for i in range(len(self.roster)):
+            self.team_names[i] = self.roster[i][0]
+        self.workers = workers
+        self.schedule_method = schedule_method
+
+    def run(self, replications: int, master_seed: int) -> MonteCarloResult:
+        """
+        Simulates `replications` seasons and merges their finishing histograms.
+
+        Raises:
+            ValueError: if there are more replications than substreams of the master seed,
+              see RandomGen.substream_seed()
+
+        Complexity:
+            Best Case Complexity: O(R * S / W + W * N^2), where R is replications, S the cost of
+              one season, W the number of workers and N the number of teams
+            Worst Case Complexity: O(R * S / W + W * N^2)
+        """
+        num_teams = len(self.roster)
+        counts = ArrayR(num_teams * num_teams)
+        for i in range(len(counts)):
+            counts[i] = 0
+        result = MonteCarloResult(self.team_names, 0, counts)
+        if replications <= 0:
+            return result
+        if replications > RandomGen.MOD // RandomGen.SUBSTREAM_STRIDE:
+            raise ValueError(f"At most {RandomGen.MOD // RandomGen.SUBSTREAM_STRIDE} replications have their own substream.")
+
+        workers = min(self.workers, replications)
+        bounds = ArrayR(workers)
+        for w in range(workers):
+            bounds[w] = (w * replications // workers, (w + 1) * replications // workers)
+
+        if workers == 1:
+            blocks = ArrayR(1)
+            blocks[0] = _run_block(self.roster, self.schedule_method.value, master_seed, 0, replications)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = ArrayR(workers)
+                for w in range(workers):
+                    start, stop = bounds[w]
+                    futures[w] = executor.submit(
+                        _run_block, self.roster, self.schedule_method.value, master_seed, start, stop
+                    )
+                blocks = ArrayR(workers)
+                for w in range(workers):
+                    blocks[w] = futures[w].result()
+
+        for w in range(len(blocks)):
+            start, stop = bounds[w]
+            block_counts = ArrayR(len(blocks[w]))
+            for i in range(len(block_counts)):
+                block_counts[i] = blocks[w][i]
+            result = result.merge(MonteCarloResult(self.team_names, stop - start, block_counts))
+        return result
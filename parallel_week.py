@@ -0,0 +1,152 @@
+"""
+This module simulates the games of a week in parallel.
+
+The games of a week are independent, as no team plays twice in a week. Each game
+draws from its own RandomGen substream, derived from the season seed, the week
+and the game's index in the week, so its outcome does not depend on which worker
+simulates it or when. Workers only compute outcomes, as goal counts and indices
+into the teams' scorer samplers. The season then applies them to its teams one
+game at a time, in schedule order, so the standings do not depend on the number
+of workers.
+
+`Team` and `Player` objects hold ctypes arrays, which cannot be pickled, so a
+game is sent to a worker as plain tuples: the scorer weights of both teams and
+the seed of its substream.
+"""
+
+from __future__ import annotations
+
+from alias_sampler import AliasSampler
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulator
+from random_gen import RandomGen, RandomStream
+
+# A game makes at most 12 draws (two goal counts and up to ten scorers), so game
+# substreams 2^10 draws apart never overlap. Each week has room for 2^12 games, so
+# a week spans 2^22 draws of the season's sequence.
+GAME_STREAM_STRIDE = 2 ** 10
+WEEK_STREAM_GAMES = 2 ** 12
+
+# Samplers built by this process, keyed by their weights. Teams keep the same
+# weights from week to week, so a worker builds each team's sampler once.
+_samplers = {}
+_MAX_CACHED_SAMPLERS = 4096
+
+
+def game_seed(season_seed: int, week_index: int, game_index: int) -> int:
+    """
+    Returns the seed of the substream a game draws from.
+
+    Args:
+        season_seed (int): The seed of the whole season
+        week_index (int): The index of the week in the original schedule (WeekOfGames.week - 1),
+          so a delayed week keeps its streams
+        game_index (int): The index of the game in its week
+
+    Complexity:
+        Best Case Complexity: O(log(W * G)), where W is week_index and G is WEEK_STREAM_GAMES
+        Worst Case Complexity: O(log(W * G))
+
+    Raises:
+        ValueError: if game_index is not below WEEK_STREAM_GAMES, or the week lies past the end
+          of the generator's period, see RandomGen.substream_seed()
+    """
+    if game_index < 0 or game_index >= WEEK_STREAM_GAMES:
+        raise ValueError(f"A week has room for {WEEK_STREAM_GAMES} game substreams, not game {game_index}.")
+    return RandomGen.substream_seed(season_seed, week_index * WEEK_STREAM_GAMES + game_index, GAME_STREAM_STRIDE)
+
+
+def _sampler(weights: tuple | None) -> AliasSampler | None:
+    """
+    Returns a sampler for the given weights, building it the first time they are seen.
+    :complexity: O(P) the first time, where P is len(weights), O(P) to hash the key after.
+    """
+    if weights is None:
+        return None
+    sampler = _samplers.get(weights)
+    if sampler is None:
+        if len(_samplers) >= _MAX_CACHED_SAMPLERS:
+            _samplers.clear()
+        sampler = AliasSampler(weights)
+        _samplers[weights] = sampler
+    return sampler
+
+
+def simulate_game(home_weights: tuple | None, away_weights: tuple | None, seed: int) -> tuple:
+    """
+    Simulates one game from its own substream.
+
+    The draws are made in the same order as GameSimulator.simulate(): both goal counts, then the
+    home scorers, then the away scorers.
+
+    Args:
+        home_weights (tuple or None): The scorer weights of the home team, None if it has no outfield players
+        away_weights (tuple or None): The scorer weights of the away team
+        seed (int): The seed of the game's substream, see game_seed()
+
+    Returns:
+        tuple: (home goals, away goals, home scorer indices, away scorer indices), the indices
+          being positions in the teams' scorer samplers
+
+    Raises:
+        ValueError: if a team scores but has no outfield players
+
+    Complexity:
+        Best Case Complexity: O(S), where S is the number of goals, when both samplers are cached
+        Worst Case Complexity: O(S + P), where P is the number of players, when a sampler is built
+    """
+    rng = RandomStream(seed)
+    home_goals = GameSimulator.GOAL_SAMPLER.sample(rng)
+    away_goals = GameSimulator.GOAL_SAMPLER.sample(rng)
+    scorers = ArrayR(2)
+    for side, (weights, goals) in enumerate(((home_weights, home_goals), (away_weights, away_goals))):
+        indices = ArrayR(goals)
+        if goals > 0:
+            sampler = _sampler(weights)
+            if sampler is None:
+                raise ValueError("A team with no outfield players cannot score.")
+            for i in range(goals):
+                indices[i] = sampler.sample_index(rng)
+        scorers[side] = tuple(indices)
+    return home_goals, away_goals, scorers[0], scorers[1]
+
+
+def simulate_games(tasks: tuple) -> tuple:
+    """
+    Simulates a run of games, given as (home weights, away weights, seed) tuples.
+    This is the function worker processes run.
+
+    Complexity:
+        Best Case Complexity: O(T + S), where T is the number of games and S the number of goals
+        Worst Case Complexity: O(T*P + S), when every sampler has to be built
+    """
+    results = ArrayR(len(tasks))
+    for i, (home_weights, away_weights, seed) in enumerate(tasks):
+        results[i] = simulate_game(home_weights, away_weights, seed)
+    return tuple(results)
+
+
+def run_week(tasks: tuple, executor=None, workers: int = 1) -> tuple:
+    """
+    Simulates the games of a week and returns their outcomes in the same order as `tasks`.
+
+    Args:
+        tasks (tuple): One (home weights, away weights, seed) tuple per game
+        executor: A concurrent.futures executor (thread or process pool), or None to run here
+        workers (int): The number of contiguous chunks to split the week into
+
+    Complexity:
+        Best Case Complexity: O(T + S), where T is the number of games and S the number of goals
+        Worst Case Complexity: O(T*P + S)
+    """
+    if executor is None or workers <= 1 or len(tasks) <= 1:
+        return simulate_games(tasks)
+    chunks = min(workers, len(tasks))
+    size = (len(tasks) + chunks - 1) // chunks
+    futures = ArrayR(chunks)
+    for c in range(chunks):
+        futures[c] = executor.submit(simulate_games, tasks[c * size:(c + 1) * size])
+    results = ()
+    for c in range(chunks):
+        results += futures[c].result()
+    return results
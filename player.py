@@ -127,6 +127,52 @@ class Player:
         """
         return self.stats[statistic]
 
+    def copy(self) -> Player:
+        """
+        Returns an independent copy of the player, with its own goals and stats.
+
+        Complexity:
+            Best Case Complexity: O(S*K), where S is the number of stats and K is the length of a stat name
+            Worst Case Complexity: O(S^2*K), when every insert into the new stats table has to probe
+        """
+        player = Player(self.name, self.position, 0)
+        player.born_year = self.born_year
+        player.goals = self.goals
+        for statistic in self.stats.keys():
+            player.stats[statistic] = self.stats[statistic]
+        return player
+
+    @classmethod
+    def from_record(cls, name: str, position: PlayerPosition, born_year: int, stats=None) -> Player:
+        """
+        Builds a player from a loaded record, e.g. a row of a roster file.
+
+        The stats table is created at a size that holds all the given stats without rehashing,
+        and the birth year is given directly, so bulk loaders can compute the current year once.
+
+        Args:
+            name (str): The name of the player
+            position (PlayerPosition): The position of the player
+            born_year (int): The year the player was born
+            stats: (statistic, value) pairs, or None
+
+        Complexity:
+            Best Case Complexity: O(S*K), where S is the number of stats and K is the length of a stat name
+            Worst Case Complexity: O(S^2*K), when every insert has to probe past the other stats
+        """
+        player = cls.__new__(cls)
+        player.name = name
+        player.born_year = born_year
+        player.position = position
+        player.goals = 0
+        if stats is None or len(stats) == 0:
+            player.stats = LinearProbeTable()
+            return player
+        player.stats = LinearProbeTable.for_items(len(stats))
+        for statistic, value in stats:
+            player.stats[statistic] = value
+        return player
+
     def get_age(self) -> int:
         """
         Get the age of the player
@@ -0,0 +1,158 @@
+"""
+This module provides `SeasonProfiler`, which collects how long each phase of a
+season's simulation takes, week by week.
+
+Attach a profiler to a season with `season.profiler = SeasonProfiler()`. The
+season then times every phase of every game it simulates and adds the time and
+a call to the phase's totals for that week. Without a profiler the season runs
+its usual loop, so profiling costs nothing when it is not used.
+
+The phases are:
+- schedule: fetching the week from the schedule and the teams of each game
+- simulate: GameSimulator.simulate()
+- record: adding the results to the teams
+- standings: moving the teams in the standings
+- scorers: crediting the goals to the players who scored them
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+
+
+class SeasonProfiler:
+
+    PHASES = ("schedule", "simulate", "record", "standings", "scorers")
+
+    def __init__(self) -> None:
+        self.clear()
+
+    @classmethod
+    def _phase_index(cls, phase: str) -> int:
+        """
+        :complexity: O(P) where P is the number of phases.
+        :raises ValueError: if the phase is not one of PHASES.
+        """
+        for i in range(len(cls.PHASES)):
+            if cls.PHASES[i] == phase:
+                return i
+        raise ValueError(f"Unknown phase {phase}.")
+
+    def add(self, week: int, phase: str, nanoseconds: int, calls: int = 1) -> None:
+        """
+        Adds time spent in a phase during a week.
+
+        Args:
+            week (int): The week number (WeekOfGames.week)
+            phase (str): One of SeasonProfiler.PHASES
+            nanoseconds (int): The time spent, from time.perf_counter_ns()
+            calls (int): How many calls the time covers
+
+        Raises:
+            ValueError: if the phase is not one of PHASES
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of phases
+            Worst Case Complexity: O(P + W), when the week table has to probe or grow,
+              where W is the number of weeks profiled
+        """
+        index = self._phase_index(phase)
+        key = str(week)
+        if key not in self.__totals:
+            totals = ArrayR(2 * len(self.PHASES))
+            for i in range(len(totals)):
+                totals[i] = 0
+            self.__totals[key] = totals
+            self.weeks.append(week)
+        totals = self.__totals[key]
+        totals[2 * index] += calls
+        totals[2 * index + 1] += nanoseconds
+
+    def clear(self) -> None:
+        """ Forgets everything collected so far. """
+        # The weeks in the order they were first profiled.
+        self.weeks = ArrayList()
+        # str(week) -> calls and nanoseconds of each phase, interleaved in PHASES order.
+        self.__totals = LinearProbeTable()
+
+    def week_totals(self, week: int, phase: str) -> tuple[int, float]:
+        """
+        Returns the calls and seconds of a phase during a week.
+
+        Raises:
+            KeyError: if the week was not profiled
+            ValueError: if the phase is not one of PHASES
+
+        :complexity: O(P) where P is the number of phases.
+        """
+        index = self._phase_index(phase)
+        totals = self.__totals[str(week)]
+        return totals[2 * index], totals[2 * index + 1] / 1e9
+
+    def totals(self) -> LinearProbeTable:
+        """
+        Returns the (calls, seconds) of each phase over all weeks, keyed by phase.
+        :complexity: O(W * P) where W is the number of weeks and P the number of phases.
+        """
+        calls = ArrayR(len(self.PHASES))
+        nanoseconds = ArrayR(len(self.PHASES))
+        for i in range(len(self.PHASES)):
+            calls[i] = nanoseconds[i] = 0
+        for week in self.weeks:
+            totals = self.__totals[str(week)]
+            for i in range(len(self.PHASES)):
+                calls[i] += totals[2 * i]
+                nanoseconds[i] += totals[2 * i + 1]
+        result = LinearProbeTable()
+        for i in range(len(self.PHASES)):
+            result[self.PHASES[i]] = (calls[i], nanoseconds[i] / 1e9)
+        return result
+
+    def rows(self) -> ArrayList[tuple[int, str, int, float]]:
+        """
+        Returns one (week, phase, calls, seconds) row per week and phase, weeks in the order they were played.
+        :complexity: O(W * P) where W is the number of weeks and P the number of phases.
+        """
+        result = ArrayList(max(1, len(self.weeks) * len(self.PHASES)))
+        for week in self.weeks:
+            totals = self.__totals[str(week)]
+            for i in range(len(self.PHASES)):
+                result.append((week, self.PHASES[i], totals[2 * i], totals[2 * i + 1] / 1e9))
+        return result
+
+    def to_csv(self, file=None) -> str | None:
+        """
+        Writes one week,phase,calls,seconds row per week and phase, weeks in the order they were played.
+
+        Args:
+            file: A path or an open text file to write to. If None, the CSV is returned as a string.
+
+        Complexity:
+            Best Case Complexity: O(W * P) where W is the number of weeks and P the number of phases
+            Worst Case Complexity: O(W * P)
+        """
+        if file is None:
+            buffer = io.StringIO()
+            self.to_csv(buffer)
+            return buffer.getvalue()
+        if isinstance(file, str):
+            with open(file, "w", newline="") as handle:
+                self.to_csv(handle)
+            return None
+        writer = csv.writer(file)
+        writer.writerow(("week", "phase", "calls", "seconds"))
+        for week, phase, calls, seconds in self.rows():
+            writer.writerow((week, phase, calls, f"{seconds:.9f}"))
+        return None
+
+    def __str__(self) -> str:
+        totals = self.totals()
+        return ", ".join(f"{phase}: {totals[phase][1]:.6f}s/{totals[phase][0]}" for phase in self.PHASES)
+
+    def __repr__(self) -> str:
+        return str(self)
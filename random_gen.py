@@ -1,11 +1,46 @@
 """
 Random number generator class. Uses LCG method with some reasonable initialisation.
+
+`RandomGen` holds a single sequence shared by the whole process. `RandomStream` objects
+offer the same methods but each holds its own seed, and `RandomGen.substream` splits a
+master seed into non-overlapping streams using an O(log k) jump ahead of the LCG.
 """
 __author__ = "Jackson Goerner"
 
 import time
 
 
+def _fill(seed: int, out, n: int, lo: int = 0, span: int = None, collection=None) -> int:
+    """
+    Writes n consecutive draws starting from `seed` into out[0:n] and returns the seed after the last draw.
+
+    Each value is what `random` would have returned, reduced to `lo + value % span` when span is
+    given, or to `collection[value % span]` when a collection is given as well.
+    :complexity: O(n)
+    :raises IndexError: if out holds fewer than n values.
+    :raises ValueError: if span is given but the range or the collection is empty.
+    """
+    multiplier, increment, mask = RandomGen.A, RandomGen.C, RandomGen.MOD - 1
+    if n > len(out):
+        raise IndexError("Buffer is too small for the requested draws.")
+    if span is not None and span <= 0:
+        raise ValueError("Cannot choose from an empty collection." if collection is not None
+                         else "The range to draw from is empty.")
+    if span is None:
+        for i in range(n):
+            seed = (multiplier * seed + increment) & mask
+            out[i] = seed >> 16
+    elif collection is None:
+        for i in range(n):
+            seed = (multiplier * seed + increment) & mask
+            out[i] = lo + (seed >> 16) % span
+    else:
+        for i in range(n):
+            seed = (multiplier * seed + increment) & mask
+            out[i] = collection[(seed >> 16) % span]
+    return seed
+
+
 class RandomGen:
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
@@ -24,6 +59,8 @@ class RandomGen:
     MOD: int = pow(2, 48)
     A: int = 25214903917
     C: int = 11
+    # Draws between the starts of consecutive substreams.
+    SUBSTREAM_STRIDE: int = pow(2, 32)
 
     seed = time.time_ns()
 
@@ -70,3 +107,179 @@ class RandomGen:
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+    @classmethod
+    def random_batch(cls, out, n: int = None) -> None:
+        """
+        Fills out[0:n] with the next n values of `random` (all of `out` if n is None).
+        `out` can be any writable buffer that supports __setitem__ and __len__, such as an
+        array('L') or a memoryview, and the seed is left where n calls to `random` would leave it.
+        :complexity: O(n)
+        """
+        n = len(out) if n is None else n
+        cls.seed = _fill(cls.seed, out, n)
+
+    @classmethod
+    def randint_batch(cls, lo: int, hi: int, out, n: int = None) -> None:
+        """
+        Fills out[0:n] with the next n values of `randint(lo, hi)`.
+        :complexity: O(n)
+        """
+        n = len(out) if n is None else n
+        cls.seed = _fill(cls.seed, out, n, lo, hi - lo + 1)
+
+    @classmethod
+    def random_choice_batch(cls, collection, out, n: int = None) -> None:
+        """
+        Fills out[0:n] with the next n values of `random_choice(collection)`.
+        :complexity: O(n)
+        """
+        n = len(out) if n is None else n
+        cls.seed = _fill(cls.seed, out, n, 0, len(collection), collection)
+
+    @classmethod
+    def jump(cls, seed: int, steps: int) -> int:
+        """
+        Returns the seed reached after `steps` calls to `random` starting from `seed`.
+
+        One LCG step is the affine map x -> A*x + C, so k steps are that map composed with
+        itself k times, computed by repeated squaring.
+        :complexity: O(log steps)
+        """
+        if steps < 0:
+            raise ValueError("Cannot jump backwards.")
+        acc_mult, acc_plus = 1, 0
+        cur_mult, cur_plus = cls.A, cls.C
+        while steps > 0:
+            if steps & 1:
+                acc_mult = acc_mult * cur_mult % cls.MOD
+                acc_plus = (acc_plus * cur_mult + cur_plus) % cls.MOD
+            cur_plus = (cur_mult + 1) * cur_plus % cls.MOD
+            cur_mult = cur_mult * cur_mult % cls.MOD
+            steps >>= 1
+        return (acc_mult * seed + acc_plus) % cls.MOD
+
+    @classmethod
+    def skip(cls, steps: int) -> None:
+        """
+        Advances the shared sequence as if `random` had been called `steps` times.
+        :complexity: O(log steps)
+        """
+        cls.seed = cls.jump(cls.seed, steps)
+
+    @classmethod
+    def substream_seed(cls, master_seed: int, index: int, stride: int = None) -> int:
+        """
+        Returns the starting seed of substream `index` of `master_seed`.
+
+        Substream i starts i * stride draws into the master sequence, so substreams never
+        overlap as long as each makes fewer than `stride` draws. The LCG repeats itself after
+        MOD draws, so only MOD // stride substreams fit (2^16 with the default stride); later
+        ones would replay earlier ones and are refused.
+        :complexity: O(log(index * stride))
+        :raises ValueError: if stride is not positive, or index is negative or at least MOD // stride.
+        """
+        stride = cls.SUBSTREAM_STRIDE if stride is None else stride
+        if stride <= 0:
+            raise ValueError("The substream stride must be positive.")
+        if index < 0 or index >= cls.MOD // stride:
+            raise ValueError(f"Substream {index} is out of range, only {cls.MOD // stride} fit in the period.")
+        return cls.jump(master_seed % cls.MOD, index * stride)
+
+    @classmethod
+    def substream(cls, master_seed: int, index: int, stride: int = None) -> 'RandomStream':
+        """
+        Returns an independent generator for substream `index` of `master_seed`.
+        :complexity: O(log(index * stride))
+        """
+        return RandomStream(cls.substream_seed(master_seed, index, stride))
+
+
+class RandomStream:
+    """
+    A generator with the same methods as RandomGen, holding its own seed.
+
+    Several streams can be used side by side without disturbing each other or the shared
+    RandomGen sequence. A stream seeded with s produces exactly the draws RandomGen does
+    after RandomGen.set_seed(s).
+
+    Usage:
+    ```
+    stream = RandomGen.substream(123, 4)
+    stream.randint(1, 10)
+    ```
+    """
+
+    MOD: int = RandomGen.MOD
+    A: int = RandomGen.A
+    C: int = RandomGen.C
+
+    def __init__(self, seed: int = None) -> None:
+        self.seed = time.time_ns() if seed is None else seed
+
+    def set_seed(self, seed: int = None) -> None:
+        """Seed all future calls to `random` on this stream."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    def skip(self, steps: int) -> None:
+        """
+        Advances the stream as if `random` had been called `steps` times.
+        :complexity: O(log steps)
+        """
+        self.seed = RandomGen.jump(self.seed, steps)
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
+
+    def random_float(self) -> float:
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def random_batch(self, out, n: int = None) -> None:
+        """
+        Fills out[0:n] with the next n values of `random` (all of `out` if n is None).
+        :complexity: O(n)
+        """
+        n = len(out) if n is None else n
+        self.seed = _fill(self.seed, out, n)
+
+    def randint_batch(self, lo: int, hi: int, out, n: int = None) -> None:
+        """
+        Fills out[0:n] with the next n values of `randint(lo, hi)`.
+        :complexity: O(n)
+        """
+        n = len(out) if n is None else n
+        self.seed = _fill(self.seed, out, n, lo, hi - lo + 1)
+
+    def random_choice_batch(self, collection, out, n: int = None) -> None:
+        """
+        Fills out[0:n] with the next n values of `random_choice(collection)`.
+        :complexity: O(n)
+        """
+        n = len(out) if n is None else n
+        self.seed = _fill(self.seed, out, n, 0, len(collection), collection)
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_shuffle(self, collection) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
+        :complexity: O(N * Log N) where N is the length of the collection.
+        """
+        positions = [(self.random(), i) for i in range(len(collection))]
+        positions.sort()
+        tmp = [collection[p[1]] for p in positions]
+        for x in range(len(collection)):
+            collection[x] = tmp[x]
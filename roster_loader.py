@@ -0,0 +1,230 @@
+"""
+This module loads a league from a roster file with one player per row, without
+reading the whole file into memory.
+
+Two formats are read, chosen by the file extension:
+- CSV (.csv) with a header row. The columns team, name, position and age are
+  required; every other column is a stat, and empty cells are skipped.
+- JSON Lines (.jsonl, .ndjson or .json), one object per line with the keys
+  team, name, position and age, and optionally "stats", an object of stat
+  values.
+
+A position is given by its value or its name, in any case ("Striker",
+"STRIKER"). Rows are parsed a chunk at a time, and the players of a team are
+grouped by position as they are read, so each team is built with
+Team.from_positions() and each player with Player.from_record(). Files sorted
+by team keep only one team's players pending at a time; a team whose rows
+appear again later gets the new players added one by one.
+
+Usage:
+```
+teams = load_league("league.csv", history_length=5)
+season = Season(teams, ScheduleMethod.CIRCLE)
+```
+"""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import gc
+import json
+import os
+
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.linked_list import LinkedList
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from player import Player
+from team import Team
+
+REQUIRED_COLUMNS = ("team", "name", "position", "age")
+CSV_EXTENSIONS = (".csv",)
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+
+
+def _position_table() -> dict:
+    """
+    Returns a dict from the lower case value and name of each position to (position, ordinal).
+    It is looked up once per row, so it uses the built-in hash rather than a LinearProbeTable.
+    :complexity: O(A) where A is len(PlayerPosition).
+    """
+    positions = {}
+    for ordinal, position in enumerate(PlayerPosition):
+        positions[position.value.lower()] = (position, ordinal)
+        positions[position.name.lower()] = (position, ordinal)
+    return positions
+
+
+def _csv_rows(file):
+    """
+    Yields (line number, team, name, position, age, stats) for each row of a CSV roster.
+    :raises ValueError: if a required column is missing.
+    """
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = tuple(column.strip() for column in header)
+    for column in REQUIRED_COLUMNS:
+        if column not in header:
+            raise ValueError(f"The roster has no {column} column.")
+    team_col, name_col, position_col, age_col = (header.index(column) for column in REQUIRED_COLUMNS)
+    stat_cols = tuple(index for index, column in enumerate(header) if column not in REQUIRED_COLUMNS)
+    for row in reader:
+        if len(row) == 0:
+            continue
+        if len(row) != len(header):
+            raise ValueError(f"Line {reader.line_num}: expected {len(header)} fields, found {len(row)}.")
+        stats = tuple((header[index], row[index]) for index in stat_cols if row[index] != "")
+        yield reader.line_num, row[team_col], row[name_col], row[position_col], row[age_col], stats
+
+
+def _json_lines_rows(file):
+    """
+    Yields (line number, team, name, position, age, stats) for each object of a JSON Lines roster.
+    :raises ValueError: if a line is not an object with the required keys.
+    """
+    for line_number, line in enumerate(file, 1):
+        if line.strip() == "":
+            continue
+        try:
+            record = json.loads(line)
+            team, name, position, age = (record[key] for key in REQUIRED_COLUMNS)
+            stats = tuple(record.get("stats", {}).items())
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            raise ValueError(f"Line {line_number}: not a player record ({error}).") from None
+        yield line_number, team, name, position, age, stats
+
+
+def read_roster_chunks(path: str, chunk_size: int = 4096):
+    """
+    Reads a roster file a chunk of rows at a time.
+
+    Args:
+        path (str): A CSV or JSON Lines roster, see the module docstring
+        chunk_size (int): The number of rows in each chunk
+
+    Yields:
+        tuple[ArrayR, int]: An array of (team name, player name, PlayerPosition, position ordinal,
+          age, stats) rows, and the number of rows filled in it. The same array is reused for
+          every chunk, so only chunk_size rows are held at a time.
+
+    Raises:
+        ValueError: if the format is not known, or a row is malformed
+
+    Complexity:
+        Best Case Complexity: O(B), where B is the size of the file
+        Worst Case Complexity: O(B)
+    """
+    if chunk_size < 1:
+        raise ValueError("A chunk must hold at least one row.")
+    extension = os.path.splitext(path)[1].lower()
+    if extension in CSV_EXTENSIONS:
+        parse = _csv_rows
+    elif extension in JSON_LINES_EXTENSIONS:
+        parse = _json_lines_rows
+    else:
+        raise ValueError(f"Unknown roster format {extension!r}.")
+
+    positions = _position_table()
+    chunk = ArrayR(chunk_size)
+    count = 0
+    with open(path, newline="", encoding="utf-8", buffering=1 << 16) as file:
+        for line_number, team, name, position, age, stats in parse(file):
+            found = positions.get(str(position).strip().lower())
+            if found is None:
+                raise ValueError(f"Line {line_number}: unknown position {position!r}.")
+            try:
+                age = int(age)
+                stats = tuple((str(stat), int(value)) for stat, value in stats)
+            except (TypeError, ValueError):
+                raise ValueError(f"Line {line_number}: ages and stats must be whole numbers.") from None
+            chunk[count] = (str(team), str(name)) + found + (age, stats)
+            count += 1
+            if count == chunk_size:
+                yield chunk, count
+                count = 0
+    if count > 0:
+        yield chunk, count
+
+
+def load_league(path: str, history_length: int, chunk_size: int = 4096, pause_gc: bool = False) -> ArrayList[Team]:
+    """
+    Builds the teams of a roster file, in the order they first appear in it.
+
+    Args:
+        path (str): A CSV or JSON Lines roster, see the module docstring
+        history_length (int): The history length of every team
+        chunk_size (int): The number of rows parsed at a time
+        pause_gc (bool): Whether to disable the garbage collector while loading. Everything built is
+          kept, so collection passes only rescan it, but gc.disable() affects the whole process:
+          other threads get no cyclic collection until the load ends. Only pass True when
+          nothing else is running.
+
+    Returns:
+        ArrayList[Team]: The teams
+
+    Raises:
+        ValueError: if the format is not known, a row is malformed, or a team has two players
+          with the same name
+
+    Complexity:
+        Best Case Complexity: O(B + P + T*K), where B is the size of the file, P the number of
+          players, T the number of teams and K the length of a team name
+        Worst Case Complexity: O(B + P*S + T^2*K), where S is the cost of inserting a player's
+          stats, when the team table probes past every other team
+        Explanation:
+        - every row is parsed once and its player built with its stats table already large enough
+        - players are appended to the list of their position, and each team is built once with
+          Team.from_positions() when its rows end; only a team whose rows come back later is
+          looked up in the team table again
+        - with pause_gc, the garbage collector does not rescan the objects built while loading
+    """
+    born = datetime.datetime.now().year
+    teams = ArrayList()
+    teams_by_name = LinearProbeTable()
+    pending_name = None
+    pending = None
+    collecting = pause_gc and gc.isenabled()
+    if collecting:
+        gc.disable()
+    try:
+        for chunk, count in read_roster_chunks(path, chunk_size):
+            for index in range(count):
+                team_name, name, position, ordinal, age, stats = chunk[index]
+                if team_name != pending_name:
+                    _add_team(teams, teams_by_name, pending_name, pending, history_length)
+                    pending_name = team_name
+                    pending = ArrayR(len(PlayerPosition))
+                    for slot in range(len(pending)):
+                        pending[slot] = LinkedList()
+                pending[ordinal].append(Player.from_record(name, position, born - age, stats))
+                chunk[index] = None
+        _add_team(teams, teams_by_name, pending_name, pending, history_length)
+    finally:
+        if collecting:
+            gc.enable()
+    return teams
+
+
+def _add_team(teams: ArrayList[Team], teams_by_name: LinearProbeTable[Team], name: str | None,
+              players_by_position: ArrayR[LinkedList[Player]] | None, history_length: int) -> None:
+    """
+    Builds the team of a run of rows, or adds the players to the team if it was built from
+    earlier rows. Does nothing before the first row.
+    :complexity: O(K + A) where K is the length of the name and A is len(PlayerPosition),
+        plus O(P) add_player() calls if the team already exists.
+    """
+    if name is None:
+        return
+    if name in teams_by_name:
+        team = teams_by_name[name]
+        for players in players_by_position:
+            for player in players:
+                team.add_player(player)
+        return
+    team = Team.from_positions(name, players_by_position, history_length)
+    teams_by_name[name] = team
+    teams.append(team)
@@ -0,0 +1,137 @@
+"""
+This module builds round-robin pairings with the polygon (circle) method.
+
+Teams are referred to by their index, so the same pairings can be turned into
+`Game`s for any set of teams. One team is fixed while the others rotate around
+it one step per round, which pairs every team with every other team exactly
+once in N-1 rounds. With an odd number of teams a dummy team is added and
+whoever meets it has a bye that round, giving N rounds.
+
+Any round can be computed on its own in O(N) without building the others.
+"""
+
+from __future__ import annotations
+
+from data_structures.referential_array import ArrayR
+from random_gen import RandomGen
+
+
+def number_of_rounds(num_teams: int) -> int:
+    """
+    Returns the number of rounds needed for every team to meet every other team once.
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    if num_teams < 2:
+        return 0
+    return num_teams - 1 if num_teams % 2 == 0 else num_teams
+
+
+def games_per_round(num_teams: int) -> int:
+    """
+    Returns the number of games played in every round.
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return num_teams // 2
+
+
+def circle_round(num_teams: int, round_index: int) -> ArrayR[tuple[int, int]]:
+    """
+    Returns the pairings of a single round as (home index, away index) tuples.
+
+    Args:
+        num_teams (int): The number of teams in the competition
+        round_index (int): The round to build, from 0 to number_of_rounds(num_teams) - 1
+
+    Returns:
+        ArrayR[tuple[int, int]]: The games of the round
+
+    Raises:
+        IndexError: if the round does not exist
+
+    Complexity:
+        Best Case Complexity: O(N), where N is num_teams
+        Worst Case Complexity: O(N), where N is num_teams
+        Explanation:
+        - each of the N/2 slots of the polygon is paired with the slot opposite it, O(1) per slot
+    """
+    rounds = number_of_rounds(num_teams)
+    if round_index < 0 or round_index >= rounds:
+        raise IndexError("Round out of bounds.")
+
+    # With an odd number of teams, index num_teams is the dummy team giving a bye.
+    slots = num_teams if num_teams % 2 == 0 else num_teams + 1
+    fixed = slots - 1
+    rotating = slots - 1
+    pairings = ArrayR(games_per_round(num_teams))
+    count = 0
+
+    # The fixed team meets whoever is in the first slot, switching home and away every round.
+    first = round_index % rotating
+    if fixed < num_teams:
+        pairings[count] = (fixed, first) if round_index % 2 == 0 else (first, fixed)
+        count += 1
+
+    for i in range(1, slots // 2):
+        home = (i + round_index) % rotating
+        away = (rotating - i + round_index) % rotating
+        if home < num_teams and away < num_teams:
+            pairings[count] = (home, away)
+            count += 1
+    return pairings
+
+
+def team_order(num_teams: int, seed: int | None = None) -> ArrayR[int]:
+    """
+    Returns the order in which teams are placed around the polygon.
+
+    Without a seed teams keep their given order. With a seed the order is a Fisher-Yates shuffle
+    driven by its own LCG sequence, so the same seed always gives the same schedule and the
+    shared RandomGen sequence is left untouched.
+
+    Complexity:
+        Best Case Complexity: O(N), where N is num_teams
+        Worst Case Complexity: O(N), where N is num_teams
+    """
+    order = ArrayR(num_teams)
+    for i in range(num_teams):
+        order[i] = i
+    if seed is None:
+        return order
+    state = seed
+    for i in range(num_teams - 1, 0, -1):
+        state = (RandomGen.A * state + RandomGen.C) % RandomGen.MOD
+        j = (state >> 16) % (i + 1)
+        order[i], order[j] = order[j], order[i]
+    return order
+
+
+def schedule_template(num_teams: int, seed: int | None = None) -> ArrayR[ArrayR[tuple[int, int]]]:
+    """
+    Returns a double round-robin schedule as (home index, away index) pairs, one array per week:
+    every circle_round() with the teams placed by team_order(), then the same rounds again with
+    home and away swapped. It refers to teams only by index, so one template can be shared by
+    every competition with num_teams teams.
+
+    Complexity:
+        Best Case Complexity: O(N^2), where N is num_teams
+        Worst Case Complexity: O(N^2)
+    """
+    rounds = number_of_rounds(num_teams)
+    order = team_order(num_teams, seed)
+    weeks = ArrayR(2 * rounds)
+    for round_index in range(rounds):
+        pairings = circle_round(num_teams, round_index)
+        week = ArrayR(len(pairings))
+        flipped = ArrayR(len(pairings))
+        for i, (home, away) in enumerate(pairings):
+            week[i] = (order[home], order[away])
+            flipped[i] = (order[away], order[home])
+        weeks[round_index] = week
+        weeks[rounds + round_index] = flipped
+    return weeks
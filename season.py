@@ -4,20 +4,39 @@ soccer league simulation.
 
 The class is responsible for generating a full round-robin schedule for all
 teams, simulating the season on a week-by-week basis, updating team statistics,
-and maintaining a dynamically sorted leaderboard using a Mergesort algorithm.
+and maintaining a leaderboard that moves a team whenever its points change.
+The games of a week can also be simulated in parallel (see `parallel_week`), and
+a `SeasonProfiler` can be attached to time each phase of the simulation. Once
+`Season.record_standings` is called, the standings after every week are kept
+compactly in a `StandingsHistory`.
+Very large leagues can use a `LazySchedule`, which builds each week from the
+team count and a seed only when it is played. A season in progress can be saved
+with `Season.checkpoint` and picked up again with `Season.resume`, and
+`Season.fork` branches it into copy-on-write copies for "what if" runs. Weeks
+are held in a `SequenceTree`, so postponing a week is O(log W).
 It integrates all other components like `Team`, `Player`, and `GameSimulator`.
 """
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from binary_io import BinaryReader, BinaryWriter
 from data_structures.array_set import ArraySet
 from data_structures.referential_array import ArrayR
 from data_structures.array_list import ArrayList
-from enums import TeamGameResult
+from enums import PlayerPosition, ScheduleMethod, TeamGameResult
 from game_simulator import GameSimulator, GameSimulationOutcome
+from player import Player
+from random_gen import RandomGen, RandomStream
 from dataclasses import dataclass
+from leaderboard import Leaderboard
+from match_log import EventSink
+import parallel_week
+from profiling import SeasonProfiler
+from standings_history import StandingsHistory
+import round_robin
+import time
 from team import Team
 from data_structures import *
-from algorithms import mergesort
 
 @dataclass
 class Game:
@@ -87,14 +106,211 @@ class WeekOfGames:
             raise StopIteration
 
 
+class LazySchedule:
+    """
+    A double round-robin schedule that builds each week only when it is asked for.
+
+    The weeks are the same as a CIRCLE schedule with the same seed: week k is computed
+    from the number of teams and the seed with round_robin.circle_round() in O(N), so
+    no more than one week of games exists at a time. Weeks can be read by position,
+    iterated, and moved around with the same delete_at_index, insert and append calls
+    as the SequenceTree an eager schedule is held in. Moves are recorded in a SequenceTree
+    of week indices, created the first time a week is moved.
+    """
+
+    def __init__(self, teams: ArrayR[Team] | ArrayList[Team], seed: int | None = None,
+                 order=None) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams of the season
+            seed (int or None): Seed for the order of teams around the polygon, see round_robin.team_order()
+            order (ArrayList[int] or None): The week index at each position, if weeks have been moved
+
+        Complexity:
+            Best Case Complexity: O(N + W), where N is the number of teams and W the number of weeks
+            Worst Case Complexity: O(N + W)
+        """
+        self.teams = teams
+        self.seed = seed
+        self.rounds = round_robin.number_of_rounds(len(teams))
+        self.__team_order = round_robin.team_order(len(teams), seed)
+        self.__order = SequenceTree.from_array(order) if order is not None else None
+
+    def __len__(self) -> int:
+        """ Returns the number of weeks. """
+        return len(self.__order) if self.__order is not None else 2 * self.rounds
+
+    def week_index(self, position: int) -> int:
+        """
+        Returns the index of the week played at a position, 0 being the first week
+        of the original schedule. Negative positions count from the end.
+
+        Raises:
+            IndexError: if there is no week at that position
+
+        Complexity:
+            Best Case Complexity: O(1), when no week has been moved
+            Worst Case Complexity: O(logW), where W is the number of weeks
+        """
+        if position < 0:
+            position += len(self)
+        if position < 0 or position >= len(self):
+            raise IndexError("Week out of bounds.")
+        return self.__order[position] if self.__order is not None else position
+
+    def week_indices(self):
+        """
+        Yields the index of the week at each position, in order.
+        :complexity: O(W) for a full iteration, where W is the number of weeks.
+        """
+        if self.__order is None:
+            yield from range(2 * self.rounds)
+        else:
+            yield from self.__order
+
+    def build_week(self, index: int) -> WeekOfGames:
+        """
+        Builds the week with the given index. The second half repeats the first with home
+        and away flipped.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams
+            Worst Case Complexity: O(N)
+        """
+        flipped = index >= self.rounds
+        pairings = round_robin.circle_round(len(self.teams), index - self.rounds if flipped else index)
+        games = ArrayR(len(pairings))
+        for i, (home, away) in enumerate(pairings):
+            if flipped:
+                home, away = away, home
+            games[i] = Game(self.teams[self.__team_order[home]], self.teams[self.__team_order[away]])
+        return WeekOfGames(index + 1, games)
+
+    def __getitem__(self, position: int) -> WeekOfGames:
+        """
+        Returns the week at a position.
+        :complexity: O(N + logW) where N is the number of teams and W the number of weeks.
+        """
+        return self.build_week(self.week_index(position))
+
+    def __iter__(self):
+        """
+        Yields the weeks in order, building each one as it is reached.
+        :complexity: O(N) per week, where N is the number of teams.
+        """
+        for index in self.week_indices():
+            yield self.build_week(index)
+
+    def __own_order(self) -> SequenceTree[int]:
+        """
+        Creates the order tree if the weeks have not been moved yet.
+        :complexity: O(W) the first time, where W is the number of weeks, O(1) after.
+        """
+        if self.__order is None:
+            self.__order = SequenceTree.from_array(range(2 * self.rounds))
+        return self.__order
+
+    def __index_of(self, week: WeekOfGames) -> int:
+        """
+        :raises ValueError: if the week is not a week of this schedule.
+        """
+        index = week.week - 1
+        if index < 0 or index >= 2 * self.rounds:
+            raise ValueError("Only weeks of this schedule can be put back into it.")
+        return index
+
+    def delete_at_index(self, position: int) -> WeekOfGames:
+        """
+        Removes the week at a position and returns it.
+        :complexity: O(N + logW) where N is the number of teams and W the number of weeks.
+        """
+        week = self[position]
+        self.__own_order().delete_at_index(position)
+        return week
+
+    def insert(self, position: int, week: WeekOfGames) -> None:
+        """
+        Puts a week of this schedule back at a position.
+        :complexity: O(logW) where W is the number of weeks, plus O(W) the first time a week is moved.
+        """
+        self.__own_order().insert(position, self.__index_of(week))
+
+    def append(self, week: WeekOfGames) -> None:
+        """
+        Puts a week of this schedule back at the end.
+        :complexity: O(logW) where W is the number of weeks, plus O(W) the first time a week is moved.
+        """
+        self.__own_order().append(self.__index_of(week))
+
+    def move(self, source: int, target: int) -> None:
+        """
+        Moves the week at position `source` to position `target`, without building it.
+        :complexity: O(logW) where W is the number of weeks, plus O(W) the first time a week is moved.
+        :raises IndexError: if either position is out of bounds.
+        """
+        self.__own_order().move(source, target)
+
+    def permute(self, positions: ArrayR[int]) -> None:
+        """
+        Reorders the weeks so that the week at position i is the one that was at positions[i].
+        :complexity: O(W) where W is the number of weeks.
+        """
+        current = ArrayR(len(self))
+        for position, index in enumerate(self.week_indices()):
+            current[position] = index
+        order = ArrayR(len(positions))
+        for position in range(len(positions)):
+            order[position] = current[positions[position]]
+        self.__order = SequenceTree.from_array(order)
+
+    def copy(self) -> LazySchedule:
+        """
+        Returns an independent schedule with the same weeks in the same order.
+        :complexity: O(1), the team order and the order tree are shared, see SequenceTree.copy().
+        """
+        schedule = LazySchedule.__new__(LazySchedule)
+        schedule.teams = self.teams
+        schedule.seed = self.seed
+        schedule.rounds = self.rounds
+        schedule.__team_order = self.__team_order
+        schedule.__order = self.__order.copy() if self.__order is not None else None
+        return schedule
+
+
+class _ForkLayer:
+    """
+    The team copies a season had made when it was forked. Once frozen a layer is never
+    changed again, so the season and its forks can all read through it.
+    """
+
+    def __init__(self, teams: LinearProbeTable, parent: _ForkLayer | None) -> None:
+        self.teams = teams
+        self.parent = parent
+
+
 class Season:
 
-    def __init__(self, teams: ArrayR[Team] | ArrayList[Team]) -> None:
+    CHECKPOINT_MAGIC = b"SSCK"
+    CHECKPOINT_VERSION = 2
+
+    def __init__(
+        self,
+        teams: ArrayR[Team] | ArrayList[Team],
+        schedule_method: ScheduleMethod = ScheduleMethod.GREEDY,
+        schedule_seed: int | None = None,
+        rng=RandomGen,
+    ) -> None:
         """
         Initializes the season with a schedule.
 
         Args:
             teams (ArrayR[Team]): The teams played in this season.
+            schedule_method (ScheduleMethod): How the schedule is generated. CIRCLE is much faster for
+              large leagues and always uses the minimum number of weeks. LAZY gives the CIRCLE weeks
+              without building them up front, see LazySchedule.
+            schedule_seed (int or None): Seed for the order of teams in a CIRCLE or LAZY schedule.
+            rng (RandomGen or RandomStream): The generator games are simulated with. Defaults to the
+              shared RandomGen sequence; give each season a RandomStream to run several side by side.
 
         Complexity:
             Best Case Complexity: O(N + N + NlogN + N^2 + 2W) = O(N^2), where N is len(teams) or len(self.teams) or len(self.leaderboard)
@@ -106,18 +322,18 @@ class Season:
             Explanation:
             Both best and worst case:
             - the assignment of self.teams is constant time, O(1)
-            - the initialisation of self.leaderboard is O(N) where N is the len(teams) from initialisation of ArraySortedList
-              where it will need to assign len(teams) empty spaces to it
-            - the for loop iterates N times where N is the len(self.teams)
-            - the _generate_schedule is always O(N^2) complexity where n is the number of teams in the season
+            - the initialisation of self.standings copies the N teams into an ArrayList, O(N), and builds
+              a balanced tree from the sorted teams, O(N)
+            - the _generate_schedule or _generate_circle_schedule is always O(N^2) complexity where n is the number of teams in the season
             - initialisation of schedule ArrayList allocated len(schedule) or number of games week value memory space, O(W)
             - the second for loop loops through the number of games week in schedule to set them to Week of Games object O(W)
             Best case:
-            - the mergesort.mergesort(self.leaderboard) is O(NlogN) complexity where N is the number of teams in the season
-              or len(self.leaderboard) as we assume that comparison happen between points of Team (int) is constant time O(1)
+            - the Leaderboard sorts the teams once with mergesort, O(NlogN) complexity where N is the number of teams in the season
+              as we assume that comparison happen between points of Team (int) is constant time O(1)
             Worst case:
-            - the mergesort.mergesort(self.leaderboard) is O(NlogN*S) complexity where N is the number of teams in the season
-              or len(self.leaderboard) as we assume that comparison happens between names of Team (str) is O(S)
+            - the Leaderboard ranks the team names once with mergesort, O(NlogN*S) complexity where N is the number of teams
+              in the season as we assume that comparison happens between names of Team (str) is O(S); the teams are then
+              sorted on their points, see Leaderboard.__init__()
             Assumption:
             - in the final worst case complexity, we retain the complexity NlogN*S because approaching infinity, practically
               the string length of team name will not be infinitely long BUT factually, it is not impossible to be very long,
@@ -125,15 +341,71 @@ class Season:
             - we drop the complexity of W in the final complexity because the number of game weeks increases linearly 
               with number of teams so although we use W not N to represent it, its complexity is similar to O(N)
         """
+        self._init_state(teams, rng, Leaderboard(teams))
+        if schedule_method == ScheduleMethod.LAZY:
+            self.schedule = LazySchedule(teams, schedule_seed)
+            return
+        if schedule_method == ScheduleMethod.CIRCLE:
+            schedule = self._generate_circle_schedule(schedule_seed)
+        else:
+            schedule = self._generate_schedule()
+        self._set_weeks(schedule)
+
+    def _init_state(self, teams: ArrayR[Team] | ArrayList[Team], rng, standings: Leaderboard, current_week: int = 0) -> None:
+        """
+        Sets everything but the schedule, for a season that has played `current_week` weeks.
+        :complexity: O(N*K) where N is the number of teams and K the length of a name, see _index_teams().
+        """
         self.teams = teams
-        self.leaderboard = ArrayList(len(teams))
-        for team in self.teams:
-            self.leaderboard.append(team)
-        self.leaderboard = mergesort.mergesort(self.leaderboard)
-        schedule = self._generate_schedule()
-        self.schedule = ArrayList(len(schedule))
+        self.rng = rng
+        self.standings = standings
+        self._leaderboard_view = None
+        self.current_week = current_week
+        self._team_index = self._index_teams(teams)
+        self.history: StandingsHistory | None = None
+        self.profiler: SeasonProfiler | None = None
+        self.event_sink: EventSink | None = None
+        self._overlay = None
+        self._frozen = None
+        self._schedule_view = None
+
+    @classmethod
+    def from_template(cls, teams: ArrayR[Team] | ArrayList[Team], template: ArrayR[ArrayR[tuple[int, int]]],
+                      rng=RandomGen, ranked: bool = False) -> Season:
+        """
+        Builds a season whose schedule comes from a template made by round_robin.schedule_template(),
+        so seasons with the same number of teams can share one template instead of each generating
+        its schedule.
+
+        Args:
+            teams (ArrayR[Team]): The teams played in this season
+            template (ArrayR[ArrayR[tuple[int, int]]]): (home index, away index) pairs of each week,
+              indices into teams
+            rng (RandomGen or RandomStream): The generator games are simulated with
+            ranked (bool): Whether teams are already in standings order (points, then name), in which
+              case the standings are built without sorting
+
+        Complexity:
+            Best Case Complexity: O(N + W*G), where N is the number of teams, W the number of weeks and
+              G the games per week, when the teams are ranked
+            Worst Case Complexity: O(NlogN*S + W*G), when the standings are sorted, S being comp(str)
+              between team names
+        """
+        season = cls.__new__(cls)
+        season._init_state(teams, rng, Leaderboard.from_ranked(teams) if ranked else Leaderboard(teams))
+        schedule = cls._games_from_template(teams, template)
+        season._set_weeks(schedule)
+        return season
+
+    def _set_weeks(self, schedule: ArrayList[ArrayList[Game]]) -> None:
+        """
+        Numbers the weeks of a generated schedule and stores them in order.
+        :complexity: O(W) where W is the number of weeks.
+        """
+        weeks = ArrayR(len(schedule))
         for index, games_week in enumerate(schedule):
-            self.schedule.append(WeekOfGames(index+1, games_week))
+            weeks[index] = WeekOfGames(index + 1, games_week)
+        self.schedule = weeks
 
     def _generate_schedule(self) -> ArrayList[ArrayList[Game]]:
         """
@@ -187,70 +459,587 @@ class Season:
         
         return weekly_games
 
-    def simulate_season(self) -> None:
+    def _generate_circle_schedule(self, seed: int | None = None) -> ArrayList[ArrayList[Game]]:
         """
-        Simulates the season.
+        Generates a double round-robin schedule with the polygon (circle) method.
+
+        The first half has N-1 weeks (N weeks with a bye for odd N) in which every team meets every
+        other team once, and the second half repeats it with home and away flipped.
+
+        Args:
+            seed (int or None): If given, shuffles the order teams are placed around the polygon.
+                The same seed always produces the same schedule.
+
+        Return:
+            ArrayList[ArrayList[Game]]: The schedule of the season, in the same shape as _generate_schedule().
+
+        Complexity:
+            Best Case Complexity: O(N^2) where N is the number of teams in the season.
+            Worst Case Complexity: O(N^2) where N is the number of teams in the season.
+            Explanation:
+            - round_robin.schedule_template() builds the pairings of the O(N) weeks in O(N) each
+            - _games_from_template() turns the O(N^2) pairings into games
+        """
+        return self._games_from_template(self.teams, round_robin.schedule_template(len(self.teams), seed))
+
+    @staticmethod
+    def _games_from_template(teams: ArrayR[Team] | ArrayList[Team],
+                             template: ArrayR[ArrayR[tuple[int, int]]]) -> ArrayList[ArrayList[Game]]:
+        """
+        Turns the (home index, away index) pairs of a schedule template into games between `teams`.
+        :complexity: O(W*G) where W is the number of weeks and G the number of games per week.
+        """
+        weekly_games: ArrayList[ArrayList[Game]] = ArrayList(max(len(template), 1))
+        for pairings in template:
+            current_week: ArrayList[Game] = ArrayList(max(len(pairings), 1))
+            for home, away in pairings:
+                current_week.append(Game(teams[home], teams[away]))
+            weekly_games.append(current_week)
+        return weekly_games
+
+    def simulate_season(self, event_sink: EventSink | None = None) -> None:
+        """
+        Simulates the season, from the first week that has not been played yet to the end.
+
+        Args:
+            event_sink (EventSink or None): Receives every game played during this call, e.g. a
+              match_log.MatchLogWriter. Set self.event_sink to report games played week by week.
 
         Complexity:
             Assume GameSimulator.simulate() is O(1)
             Remember to define your variables in your complexity.
 
-            Best Case Complexity: O(W * G * (NlogN + S * 2(Q*(H*K + P) + T))) = O(W*G*(NlogN + S*(Q*(H*K + P) + T)))
+            Best Case Complexity: O(W * G * (logN + S)) = O(W*G*(logN + S))
                 where W is the number of weeks in self.schedule, G is the number of games in each week, 
-                N is the number of teams in self.leaderboard, S is the number of scorers in game_outcome.goal_scorers, 
-                Q is len(PlayerPosition), H is position.value which is the key, K is the number of items in self.players 
-                (number of linkedlist for positions) and P is the average length of self.players[position.value] LinkedList
-                T is the average number of players in a team
-            Worst Case Complexity: O(W * G * (NlogN*K + S * 2(Q*(H*K + P) + T))) = O(W*G*(NlogN*K + S*(Q*(H*K + P) + T)))
+                N is the number of teams in self.leaderboard, S is the number of scorers in game_outcome.goal_scorers
+            Worst Case Complexity: O(W * G * (logN + K + S)) = O(W*G*(logN + K + S))
                 where W is the number of weeks in self.schedule, G is the number of games in each week, 
                 N is the number of teams in self.leaderboard, S is the number of scorers in game_outcome.goal_scorers,
-                K is comp(str) is the comparison between string objects of self.name and other.name which depends on the length 
-                of the string in __le__() in Team, Q is len(PlayerPosition), H is position.value which is the key, 
-                K is the number of items in self.players (number of linkedlist for positions) and P is the average length of 
-                self.players[position.value] LinkedList, T is the average number of players in a team
+                K is the cost of hashing a team name to find its name rank in the leaderboard, which depends on the length
+                of the string
             Explanation:
             Both best and worst case:
             - the first for loop loops through the weeks in self.schedule, where W is the number of weeks (object) in self.schedule
             - the second for loop loops through the games in each week, where G is the number of games in each week
             - the GameSimulator.simulate() is O(1)
-            - the third for loop loops through the scorers in game_outcome.goal_scorers, where S is the number of scorers in game_outcome.goal_scorers
-            - the get_players() method is O(Q*(H*K + P)) and it obtains all players from a team
-            - the for loop loops through the players in a team, where T is the average number of players in a team
-              from home team and away team, O(T)
+            - _credit_scorers() adds one goal to each of the S scorers through their Player references, O(S)
             - we assume all assignment operations and math operations are constant time, O(1)
             - we assume all comparison operations between integers are constant time, O(1)
             Best case:
-            - the mergesort.mergesort(self.leaderboard) is O(NlogN) complexity where N is the number of teams in the season
-              or len(self.leaderboard) as we assume that comparison happen between points of Team (int) is constant time O(1)
+            - _record_result() moves the team within self.standings in O(logN) where N is the number of teams in the season
+              as we assume that comparison happen between points of Team (int) is constant time O(1)
             Worst case:
-            - the mergesort.mergesort(self.leaderboard) is O(NlogN*K) complexity where N is the number of teams in the season
-              or len(self.leaderboard) as we assume that comparison happens between names of Team (str) is O(K)
+            - _record_result() looks up the team's name rank in O(K) and moves the team within self.standings in O(logN)
+              where N is the number of teams in the season, as the tree keys are pairs of integers
             Assumptions:
             - the final complexity of best and worst case are simplified based on factual considerations as some of 
               these variables are practically bounded and not infinite in real world scenarios but factually they can be infinite
             - and since they do not relate are are independent from each other, their complexities are retained in 
               the final complexity.
         """
-        for week in self.schedule:                                                      #O(W)
-            for game in week:                                                           #O(G)
-                game_outcome = GameSimulator.simulate(game.home_team, game.away_team)   #O(1)
-                if game_outcome.home_goals > game_outcome.away_goals:                   #O(1)
-                    game.home_team.add_result(TeamGameResult.WIN)                       #O(1)
-                    game.away_team.add_result(TeamGameResult.LOSS)                      #O(1)
-                elif game_outcome.home_goals < game_outcome.away_goals:                 #O(1)
-                    game.home_team.add_result(TeamGameResult.LOSS)                      #O(1)
-                    game.away_team.add_result(TeamGameResult.WIN)                       #O(1)
-                else:
-                    game.home_team.add_result(TeamGameResult.DRAW)                      #O(1)
-                    game.away_team.add_result(TeamGameResult.DRAW)                      #O(1)
-                self.leaderboard = mergesort.mergesort(self.leaderboard)                #O(NlogN)*comp(object)
-                for scorer in game_outcome.goal_scorers:                                #O(S)
-                    for player in game.home_team.get_players():                         #O(Q*(H*K + P)) + O(T)
-                        if player.name == scorer:                                       #O(1)
-                            player.goals += 1                                           #O(1)
-                    for player in game.away_team.get_players():                         #O(Q*(H*K + P)) + O(T)
-                        if player.name == scorer:                                       #O(1)
-                            player.goals += 1                                           #O(1)
+        previous_sink = self.event_sink
+        if event_sink is not None:
+            self.event_sink = event_sink
+        try:
+            while self.simulate_week():                                                 #O(W)
+                pass
+        finally:
+            self.event_sink = previous_sink
+
+    def simulate_week(self) -> bool:
+        """
+        Simulates the next week of games and moves self.current_week past it.
+
+        Returns:
+            bool: False if every week had already been played, True otherwise
+
+        Complexity:
+            Best Case Complexity: O(1), when the season is over
+            Worst Case Complexity: O(G * (logN + K + S)), where G is the number of games in the week,
+              N is the number of teams, K is the cost of hashing a team name and S is the number of scorers
+              in a game, see simulate_season(); plus O(N*K) when the standings are recorded, see _finish_week()
+        """
+        if self.current_week >= len(self._weeks):
+            return False
+        if self.profiler is not None:
+            return self._simulate_week_profiled()
+        week = self._weeks[self.current_week]
+        for game in week:                                                               #O(G)
+            home_team = self._writable(game.home_team)                                  #O(1) unless forked
+            away_team = self._writable(game.away_team)                                  #O(1) unless forked
+            game_outcome = GameSimulator.simulate(home_team, away_team, self.rng)        #O(1)
+            self._apply_outcome(week.week, home_team, away_team, game_outcome)          #O(logN + K + S)
+        self._finish_week()
+        return True
+
+    def _simulate_week_profiled(self) -> bool:
+        """
+        Does the same as simulate_week(), adding the time spent in each phase to self.profiler.
+        Each phase is timed around the helpers _apply_outcome() is made of, so a profiled week
+        records results exactly as an unprofiled one does.
+
+        Complexity:
+            Best Case Complexity: O(G * (logN + S)), the same as simulate_week()
+            Worst Case Complexity: O(G * (logN + K + S)), plus O(N*K) when the standings are recorded
+        """
+        profiler = self.profiler
+        clock = time.perf_counter_ns
+        start = clock()
+        week = self._weeks[self.current_week]
+        games = len(week.games)
+        times = ArrayR(len(SeasonProfiler.PHASES))
+        for phase in range(len(times)):
+            times[phase] = 0
+        times[0] += clock() - start
+
+        for game in week:
+            start = clock()
+            home_team = self._writable(game.home_team)
+            away_team = self._writable(game.away_team)
+            after_schedule = clock()
+            game_outcome = GameSimulator.simulate(home_team, away_team, self.rng)
+            after_simulate = clock()
+            times[0] += after_schedule - start
+            times[1] += after_simulate - after_schedule
+            for team, result in self._game_results(home_team, away_team, game_outcome):
+                before_record = clock()
+                old_points = self._add_result(team, result)
+                after_record = clock()
+                self._place(team, old_points)
+                times[2] += after_record - before_record
+                times[3] += clock() - after_record
+            before_scorers = clock()
+            self._report_goals(week.week, home_team, away_team, game_outcome)
+            times[4] += clock() - before_scorers
+
+        calls = (games + 1, games, 2 * games, 2 * games, games)
+        start = clock()
+        self._finish_week()
+        times[3] += clock() - start
+        for phase in range(len(times)):
+            profiler.add(week.week, SeasonProfiler.PHASES[phase], times[phase], calls[phase])
+        return True
+
+    def _finish_week(self) -> None:
+        """
+        Moves past the week just played and records the standings after it, if they are recorded.
+        :complexity: O(1) when the standings are not recorded, O(N*K) otherwise, where N is the number of
+            teams and K the length of a name, see _standings_state() and StandingsHistory.record().
+        """
+        self.current_week += 1
+        if self.history is not None:
+            self.history.record(*self._standings_state())
+
+    def record_standings(self, keyframe_interval: int = 8) -> None:
+        """
+        Starts keeping the standings after every week from now on, so that standings_at() can
+        rebuild the table after any of them. Recording is off by default, as it walks the whole
+        table after every week. Does nothing if the standings are already recorded.
+
+        Args:
+            keyframe_interval (int): The number of weeks between two full tables, see StandingsHistory
+
+        Complexity:
+            Best Case Complexity: O(1), when the standings are already recorded
+            Worst Case Complexity: O(N*K), where N is the number of teams and K the length of a name
+        """
+        if self.history is None:
+            self.history = StandingsHistory(*self._standings_state(), start_week=self.current_week,
+                                            keyframe_interval=keyframe_interval)
+
+    @staticmethod
+    def _index_teams(teams: ArrayR[Team] | ArrayList[Team]) -> LinearProbeTable:
+        """
+        Returns a table from team name to the team's index in teams.
+        :complexity: O(N*K) where N is the number of teams and K the length of a name.
+        """
+        team_index = LinearProbeTable()
+        for index, team in enumerate(teams):
+            team_index[team.name] = index
+        return team_index
+
+    def _standings_state(self) -> tuple[ArrayR[int], ArrayR[int]]:
+        """
+        Returns the points of each team by team index, and the index of the team in each place.
+        :complexity: O(N*K) where N is the number of teams and K the length of a name.
+        """
+        points = ArrayR(len(self.teams))
+        order = ArrayR(len(self.teams))
+        for place, team in enumerate(self.standings):
+            index = self._team_index[team.name]
+            points[index] = team.points
+            order[place] = index
+        return points, order
+
+    def standings_at(self, week: int) -> ArrayR[tuple[Team, int]]:
+        """
+        Returns the table as it stood after a number of weeks had been played, as
+        (team, points) tuples with the leader first. Week 0 is the table before any games.
+
+        Args:
+            week (int): The number of weeks played, at most self.current_week
+
+        Raises:
+            IndexError: if the week has not been played, or was played before record_standings() was called
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams
+            Worst Case Complexity: O(N*D*K + C), where C is the number of changes replayed from the
+              nearest keyframe, see StandingsHistory.at(), and D*K is the cost of resolve() in a forked season
+        """
+        if self.history is None:
+            raise IndexError("The standings are not recorded, see record_standings().")
+        points, order = self.history.at(week)
+        table = ArrayR(len(order))
+        for place in range(len(order)):
+            index = order[place]
+            table[place] = (self.resolve(self.teams[index]), points[index])
+        return table
+
+    def simulate_week_parallel(self, seed: int, executor=None, workers: int = 1) -> bool:
+        """
+        Simulates the next week of games with each game drawing from its own substream, derived
+        from (seed, week, game index) by parallel_week.game_seed(). The outcomes are computed
+        first, optionally spread over an executor, and then applied to the teams in game order,
+        so the result does not depend on the executor or the number of workers.
+
+        The week is identified by WeekOfGames.week, so a delayed week plays out the same
+        wherever it ends up. self.rng is not used.
+
+        Args:
+            seed (int): The seed of the season
+            executor: A thread or process pool from concurrent.futures, or None to run in this thread
+            workers (int): The number of chunks to split the week into for the executor
+
+        Returns:
+            bool: False if every week had already been played, True otherwise
+
+        Complexity:
+            Best Case Complexity: O(1), when the season is over
+            Worst Case Complexity: O(G * (logW + P + logN + K + S)), where G is the number of games in the week,
+              W the week index (to derive the substreams), P the number of players in a team (to read the
+              scorer weights), N the number of teams, K the cost of hashing a team name and S the number of
+              goals; plus O(N*K) when the standings are recorded, see record_standings()
+        """
+        if self.current_week >= len(self._weeks):
+            return False
+        teams, tasks = self._parallel_week_tasks(seed)
+        self._apply_parallel_week(teams, parallel_week.run_week(tasks, executor, workers))
+        return True
+
+    def _parallel_week_tasks(self, seed: int) -> tuple[ArrayR[tuple], tuple]:
+        """
+        Returns the games of the next week as (home team, away team, home sampler, away sampler)
+        tuples, and the tasks parallel_week.run_week() simulates them from. The week must exist.
+        :complexity: O(G * (logW + P)), see simulate_week_parallel().
+        """
+        week = self._weeks[self.current_week]
+        teams = ArrayR(len(week.games))
+        tasks = ArrayR(len(week.games))
+        for index, game in enumerate(week):
+            home_team = self._writable(game.home_team)
+            away_team = self._writable(game.away_team)
+            home_sampler = home_team.scorer_sampler()
+            away_sampler = away_team.scorer_sampler()
+            teams[index] = (home_team, away_team, home_sampler, away_sampler)
+            tasks[index] = (
+                tuple(home_sampler.weights) if home_sampler is not None else None,
+                tuple(away_sampler.weights) if away_sampler is not None else None,
+                parallel_week.game_seed(seed, week.week - 1, index),
+            )
+        return teams, tuple(tasks)
+
+    def _apply_parallel_week(self, teams: ArrayR[tuple], outcomes: tuple) -> None:
+        """
+        Applies the outcomes parallel_week.run_week() gave for the tasks of _parallel_week_tasks(),
+        in game order, and moves past the week.
+        :complexity: O(G * (logN + K + S)), plus O(N*K) when the standings are recorded, see simulate_week_parallel().
+        """
+        week = self._weeks[self.current_week]
+        for index in range(len(teams)):
+            home_team, away_team, home_sampler, away_sampler = teams[index]
+            home_goals, away_goals, home_scorers, away_scorers = outcomes[index]
+            goal_scorers = ArrayList(home_goals + away_goals)
+            scorer_players = ArrayList(home_goals + away_goals)
+            for sampler, scorers in ((home_sampler, home_scorers), (away_sampler, away_scorers)):
+                for scorer in scorers:
+                    player = sampler.values[scorer]
+                    goal_scorers.append(player.name)
+                    scorer_players.append(player)
+            game_outcome = GameSimulationOutcome(home_goals, away_goals, goal_scorers, scorer_players)
+            self._apply_outcome(week.week, home_team, away_team, game_outcome)
+        self._finish_week()
+
+    def simulate_season_parallel(self, seed: int, workers: int = 1, processes: bool = True) -> None:
+        """
+        Simulates the rest of the season one week at a time with simulate_week_parallel().
+
+        Args:
+            seed (int): The seed of the season. The same seed gives the same standings for any
+              number of workers.
+            workers (int): The number of workers. With 1, everything runs in this thread.
+            processes (bool): Whether to use a process pool rather than a thread pool. Game simulation
+              is pure Python, so only processes run games at the same time.
+
+        Complexity:
+            Best Case Complexity: O(W * G * (logW + P + logN + K + S)), see simulate_week_parallel()
+            Worst Case Complexity: O(W * (G * (logW + P + logN + K + S) + N*K)), when the standings are recorded
+        """
+        if workers <= 1:
+            while self.simulate_week_parallel(seed):
+                pass
+            return
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with pool(max_workers=workers) as executor:
+            while self.simulate_week_parallel(seed, executor, workers):
+                pass
+
+    def _apply_outcome(self, week: int, home_team: Team, away_team: Team, game_outcome: GameSimulationOutcome) -> None:
+        """
+        Records the result of a game for both teams, credits its scorers and reports the game
+        to self.event_sink, if there is one.
+
+        Complexity:
+            Best Case Complexity: O(logN + S), where N is the number of teams and S the number of scorers
+            Worst Case Complexity: O(logN + K + S), where K is the cost of hashing a team name
+        """
+        for team, result in self._game_results(home_team, away_team, game_outcome):   #O(1), two results
+            self._record_result(team, result)                                           #O(logN + K)
+        self._report_goals(week, home_team, away_team, game_outcome)                    #O(S)
+
+    @staticmethod
+    def _game_results(home_team: Team, away_team: Team,
+                      game_outcome: GameSimulationOutcome) -> tuple[tuple[Team, TeamGameResult], ...]:
+        """
+        Returns the (team, result) pairs of a game, home team first.
+        :complexity: O(1)
+        """
+        if game_outcome.home_goals > game_outcome.away_goals:
+            return (home_team, TeamGameResult.WIN), (away_team, TeamGameResult.LOSS)
+        if game_outcome.home_goals < game_outcome.away_goals:
+            return (home_team, TeamGameResult.LOSS), (away_team, TeamGameResult.WIN)
+        return (home_team, TeamGameResult.DRAW), (away_team, TeamGameResult.DRAW)
+
+    def _report_goals(self, week: int, home_team: Team, away_team: Team, game_outcome: GameSimulationOutcome) -> None:
+        """
+        Credits the scorers of a game and reports the game to self.event_sink, if there is one.
+        :complexity: O(S) where S is the number of scorers, see _credit_scorers().
+        """
+        self._credit_scorers(home_team, away_team, game_outcome)
+        if self.event_sink is not None:
+            self.event_sink.record_game(week, home_team, away_team, game_outcome)
+
+    def _credit_scorers(self, home_team: Team, away_team: Team, game_outcome: GameSimulationOutcome) -> None:
+        """
+        Adds the goals of a game to the players who scored them.
+
+        When the outcome carries Player references they are incremented directly. Otherwise the
+        scorer names are counted in a hash table and both rosters are walked once. In a forked
+        season the players are copied first (see Team.own_player()).
+
+        Args:
+            home_team (Team): The home team, as this season holds it
+            away_team (Team): The away team, as this season holds it
+            game_outcome (GameSimulationOutcome): The result of the game
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the number of scorers, when Player references are given
+            Worst Case Complexity: O(S*L + T*L), when only names are given, where L is the length
+              of a player name and T is the number of players in both teams, walked through the
+              cached Team.get_players() lists
+        """
+        forked = self._overlay is not None
+        if game_outcome.scorer_players is not None:
+            for i, player in enumerate(game_outcome.scorer_players):
+                if forked:
+                    player = (home_team if i < game_outcome.home_goals else away_team).own_player(player)
+                player.goals += 1
+            return
+        if len(game_outcome.goal_scorers) == 0:
+            return
+        goals_by_name = LinearProbeTable()
+        for scorer in game_outcome.goal_scorers:
+            goals_by_name[scorer] = goals_by_name[scorer] + 1 if scorer in goals_by_name else 1
+        for team in (home_team, away_team):
+            for player in team.get_players():
+                if player.name in goals_by_name:
+                    if forked:
+                        player = team.own_player(player)
+                    player.goals += goals_by_name[player.name]
+
+    def _record_result(self, team: Team, result: TeamGameResult) -> None:
+        """
+        Adds a result to a team and moves the team to its new place in the standings.
+
+        Args:
+            team (Team): The team the result belongs to
+            result (TeamGameResult): The result of the game for that team
+
+        Complexity:
+            Best Case Complexity: O(1), when the result gives no points (a loss)
+            Worst Case Complexity: O(logN*S), where N is the number of teams in the season
+              and S is comp(str) between team names
+            Explanation:
+            - add_result() is O(1)
+            - reposition() removes and re-inserts the team in the standings tree, O(logN*S)
+        """
+        self._place(team, self._add_result(team, result))
+
+    @staticmethod
+    def _add_result(team: Team, result: TeamGameResult) -> int:
+        """
+        Adds a result to a team and returns the points the team had before it.
+        :complexity: O(1)
+        """
+        old_points = team.points
+        team.add_result(result)
+        return old_points
+
+    def _place(self, team: Team, old_points: int) -> None:
+        """
+        Moves a team in the standings after its points changed from `old_points`.
+        :complexity: O(1) if the points did not change, O(logN*S) otherwise, see _record_result().
+        """
+        if team.points != old_points:
+            self.standings.reposition(team, old_points)
+            self._leaderboard_view = None
+
+    def resolve(self, team: Team) -> Team:
+        """
+        Returns this season's version of a team. A forked season holds its own copy of every
+        team it has played with since the fork, while self.teams and the schedule still refer
+        to the teams the season was created with. For a season that was never forked this is
+        the team itself.
+
+        Complexity:
+            Best Case Complexity: O(1), when the season was never forked
+            Worst Case Complexity: O(D*K), where D is the number of forks between this season and
+              the season the team was created in and K is the length of the team name
+        """
+        if self._overlay is None:
+            return team
+        if team.name in self._overlay:
+            return self._overlay[team.name]
+        layer = self._frozen
+        while layer is not None:
+            if team.name in layer.teams:
+                return layer.teams[team.name]
+            layer = layer.parent
+        return team
+
+    def _writable(self, team: Team) -> Team:
+        """
+        Returns a version of the team this season can change. In a forked season the team is
+        copied (see Team.fork()) the first time it is changed, and the copy takes the place of
+        the shared team in the standings.
+
+        Complexity:
+            Best Case Complexity: O(1), when the season was never forked
+            Worst Case Complexity: O(D*K + H + logN*S), when the team has to be copied, where H is
+              history_length, see resolve() and Leaderboard.replace()
+        """
+        if self._overlay is None:
+            return team
+        if team.name in self._overlay:
+            return self._overlay[team.name]
+        shared = self.resolve(team)
+        copy = shared.fork()
+        self._overlay[team.name] = copy
+        self.standings.replace(shared, copy)
+        self._leaderboard_view = None
+        return copy
+
+    def fork(self, rng=None) -> Season:
+        """
+        Returns a branch of the season, which can be simulated on without affecting this season.
+
+        The branch shares the schedule, the teams, their players and the standings tree with this
+        season. Each season copies a team the first time it changes it, and a player the first
+        time it changes that player, so a branch costs memory for the teams and players it
+        touches rather than for the whole league. The schedule tree is shared too, see SequenceTree.copy().
+
+        Args:
+            rng (RandomGen or RandomStream or None): The generator the branch simulates with. By default
+              a new RandomStream continuing from this season's generator state, so a branch replays
+              what this season would do. Pass e.g. RandomGen.substream(seed, i) for independent branches.
+
+        Returns:
+            Season: The branch, at the same week as this season
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+            Explanation:
+            - the team copies this season has made so far are frozen into a shared layer, and both
+              seasons start a new empty table of copies
+            - the standings tree and the schedule are copied in O(1), their nodes are never modified
+            - the recorded standings, if any, are shared in O(1) until either season records its next
+              week, see StandingsHistory.copy()
+        """
+        if self._overlay is not None and len(self._overlay) > 0:
+            self._frozen = _ForkLayer(self._overlay, self._frozen)
+        self._overlay = LinearProbeTable()
+
+        branch = Season.__new__(type(self))
+        branch.teams = self.teams
+        branch.rng = rng if rng is not None else RandomStream(self.rng.seed)
+        branch.standings = self.standings.copy()
+        branch._leaderboard_view = None
+        branch.current_week = self.current_week
+        branch.history = self.history.copy() if self.history is not None else None
+        branch._team_index = self._team_index
+        branch.profiler = None
+        branch.event_sink = None
+        branch._overlay = LinearProbeTable()
+        branch._frozen = self._frozen
+        branch._weeks = self._weeks.copy()
+        branch._schedule_view = self._schedule_view
+        return branch
+
+    @property
+    def leaderboard(self) -> ArrayList[Team]:
+        """
+        The teams ordered by points (highest first), then by name.
+
+        The list is only rebuilt from self.standings when a result has changed the standings
+        since it was last read. For a single position, self.standings[index] is O(logN).
+
+        Complexity:
+            Best Case Complexity: O(1), when the standings did not change since the last call
+            Worst Case Complexity: O(N), where N is the number of teams in the season
+        """
+        if self._leaderboard_view is None:
+            self._leaderboard_view = self.standings.to_array_list()
+        return self._leaderboard_view
+
+    @property
+    def schedule(self) -> ArrayR[WeekOfGames] | LazySchedule:
+        """
+        The weeks of the season in the order they are played.
+
+        The weeks are held in a SequenceTree so that they can be moved in O(logW); this is a
+        read-only array of them that is only rebuilt when a week has moved since it was last read.
+        Setting a week in it raises TypeError, use delay_week_of_games() or reschedule() to move
+        weeks. A LazySchedule is returned as it is, and is moved by its own methods.
+        Assigning an ArrayList, ArrayR or LazySchedule of weeks replaces the schedule.
+
+        Complexity:
+            Best Case Complexity: O(1), when no week moved since the last call
+            Worst Case Complexity: O(W), where W is the number of weeks
+        """
+        if isinstance(self._weeks, LazySchedule):
+            return self._weeks
+        if self._schedule_view is None:
+            self._schedule_view = ArrayR.read_only(self._weeks)
+        return self._schedule_view
+
+    @schedule.setter
+    def schedule(self, weeks) -> None:
+        if isinstance(weeks, LazySchedule):
+            self._weeks = weeks
+        else:
+            self._weeks = SequenceTree.from_array(weeks)
+        self._schedule_view = None
 
     def delay_week_of_games(self, orig_week: int, new_week: int | None = None) -> None:
         """
@@ -260,27 +1049,246 @@ class Season:
             orig_week (int): The original week to move the games from.
             new_week (int or None): The new week to move the games to. If this is None, it moves the games to the end of the season.
 
+        Raises:
+            IndexError: if either week is not in the schedule
+
         Complexity:
-            Best Case Complexity: O(1)
-            Worst Case Complexity: O(N + N) = O(N), where N is the length of self.schedule
+            Best Case Complexity: O(logW), where W is the length of the schedule
+            Worst Case Complexity: O(logW)
             Explanation:
             Both best and worst case:
-            Best case:
-            - in the best case, we obtain the original week from the last index of self.schedule
-            - this causes delete_at_index to be O(1) as no shuffling of items is needed
-            - Then new_week is None, which means we append the original week to the end of self.schedule
-            Worst case:
-            - in the worst case, we obtain the original week from the first index of self.schedule
-            - this causes delete_at_index to be O(N) as shuffling of rest of the items in schedule is needed
-            - Then new_week is the first week in self.schedule, which means we insert the original week to the first index of self.schedule
-            - this causes insert to be O(N) as shuffling of rest of the items in schedule is needed
-            Both the best and worst case are unlikely but possible as new week can be >= original week (Ed Forum #1309)
-        """
-        original_week = self.schedule.delete_at_index(orig_week-1)
-        if new_week is not None:
-            self.schedule.insert(new_week-1, original_week)
+            - the weeks are held in a SequenceTree, in which every node knows the number of weeks below it,
+              so the week at any position is found, removed and inserted again by walking one path of the
+              tree, O(logW), and no other week is shifted
+            - a fork shares the tree with this season but never sees the move, as the nodes on the path
+              are copied rather than changed
+            - a lazy schedule moves the index of the week in its own SequenceTree, without building the week
+        """
+        last = len(self._weeks)
+        if new_week is not None and (new_week < 1 or new_week > last):
+            raise IndexError(f"Week {new_week} is not in the schedule.")
+        if orig_week < 1 or orig_week > last:
+            raise IndexError(f"Week {orig_week} is not in the schedule.")
+        self._weeks.move(orig_week - 1, last - 1 if new_week is None else new_week - 1)
+        self._schedule_view = None
+
+    def reschedule(self, moves) -> None:
+        """
+        Moves many weeks at once. Each moved week ends up at its new position, and the weeks
+        that are not moved fill the remaining positions in the order they were in.
+        A single move gives the same schedule as delay_week_of_games().
+
+        Args:
+            moves: A mapping from current week to new week (anything with items(), such as a dict),
+              or an iterable of (current week, new week) pairs. Weeks are numbered from 1 like
+              delay_week_of_games().
+
+        Raises:
+            IndexError: if a week is not in the schedule
+            ValueError: if a week is moved twice, or two weeks are moved to the same position
+
+        Complexity:
+            Best Case Complexity: O(W + M), where W is the length of the schedule and M the number of moves
+            Worst Case Complexity: O(W + M)
+            Explanation:
+            - the moves are checked and placed into an array of positions in O(M), and the unmoved
+              weeks fill the gaps in one pass, O(W)
+            - the tree is rebuilt from the new order in one O(W) pass, rather than M moves of O(logW)
+        """
+        if hasattr(moves, "items"):
+            moves = moves.items()
+        count = len(self._weeks)
+        positions = ArrayR(count)
+        moved = ArrayR(count)
+        for orig_week, new_week in moves:
+            for week in (orig_week, new_week):
+                if week < 1 or week > count:
+                    raise IndexError(f"Week {week} is not in the schedule.")
+            if moved[orig_week - 1] is not None:
+                raise ValueError(f"Week {orig_week} is moved twice.")
+            if positions[new_week - 1] is not None:
+                raise ValueError(f"Two weeks are moved to week {new_week}.")
+            moved[orig_week - 1] = True
+            positions[new_week - 1] = orig_week - 1
+
+        source = 0
+        for target in range(count):
+            if positions[target] is not None:
+                continue
+            while moved[source] is not None:
+                source += 1
+            positions[target] = source
+            source += 1
+
+        if isinstance(self._weeks, LazySchedule):
+            self._weeks.permute(positions)
+        else:
+            current = ArrayR(count)
+            for position, week in enumerate(self._weeks):
+                current[position] = week
+            weeks = ArrayR(count)
+            for target in range(count):
+                weeks[target] = current[positions[target]]
+            self._weeks = SequenceTree.from_array(weeks)
+        self._schedule_view = None
+
+    def checkpoint(self, path: str) -> None:
+        """
+        Saves the season as it is now, so it can be picked up later with Season.resume().
+
+        The file holds the index of the next week to play, the generator state, every team with
+        its points, result history and players (with their goals and stats), and the schedule
+        in its current order, games being stored as pairs of team indices. A LazySchedule is
+        stored as its seed and the order of its weeks instead. Team blog posts are not saved.
+        Team names are assumed to be unique.
+
+        The file is built in memory and written with a single write.
+
+        Args:
+            path (str): The file to write
+
+        Raises:
+            TypeError: if a player stat is not an integer
+
+        Complexity:
+            Best Case Complexity: O(P + H + W*G), where P is the number of players and stats,
+              H the total length of the result histories, W the number of weeks and G the games per week
+            Worst Case Complexity: O(P + H + W*G*N*K), when every lookup in the team index table
+              has to probe the whole table, where N is the number of teams and K the length of a name
+        """
+        writer = BinaryWriter(Season.CHECKPOINT_MAGIC, Season.CHECKPOINT_VERSION)
+        shared = self.rng is RandomGen
+        writer.pack("<IBQ", self.current_week, 0 if shared else 1, self.rng.seed)
+
+        team_index = LinearProbeTable()
+        writer.pack("<I", len(self.teams))
+        for index, team in enumerate(self.teams):
+            team = self.resolve(team)
+            team_index[team.name] = index
+            writer.write_str(team.name)
+            writer.write_str(team.scorer_stat if team.scorer_stat is not None else "")
+            writer.pack("<Iq", team.history_length, team.points)
+            # Serve and re-append every result, which leaves the queue as it was.
+            writer.pack("<I", len(team.results))
+            for _ in range(len(team.results)):
+                result = team.results.serve()
+                writer.pack("<B", result.value)
+                team.results.append(result)
+            players = team.get_players()
+            writer.pack("<I", len(players))
+            for player in players:
+                writer.write_str(player.name)
+                writer.pack("<BiI", player.position.ordinal, player.born_year, player.goals)
+                stat_names = player.stats.keys()
+                writer.pack("<H", len(stat_names))
+                for stat in stat_names:
+                    value = player.stats[stat]
+                    if not isinstance(value, int):
+                        raise TypeError(f"Stat {stat} of {player.name} is not an integer.")
+                    writer.write_str(stat)
+                    writer.pack("<q", value)
+
+        if isinstance(self._weeks, LazySchedule):
+            # Only the seed and the order of the weeks are needed to rebuild a lazy schedule.
+            writer.pack("<B?Q", 1, self._weeks.seed is not None, self._weeks.seed or 0)
+            writer.pack("<I", len(self._weeks))
+            for index in self._weeks.week_indices():
+                writer.pack("<I", index)
+            writer.save(path)
+            return
+        writer.pack("<B", 0)
+        writer.pack("<I", len(self._weeks))
+        for week in self._weeks:
+            writer.pack("<II", week.week, len(week.games))
+            for game in week:
+                writer.pack("<II", team_index[game.home_team.name], team_index[game.away_team.name])
+        writer.save(path)
+
+    @classmethod
+    def resume(cls, path: str, rng=None) -> Season:
+        """
+        Loads a season saved with Season.checkpoint(). The teams and players are rebuilt from the
+        file and the schedule is read back as it was saved, without generating a new one.
+
+        Args:
+            path (str): The file to read
+            rng (RandomGen or RandomStream or None): The generator to continue with, set to the saved
+              state. By default the season continues on the shared RandomGen sequence if it was using
+              it when saved, and on a new RandomStream otherwise.
+
+        Returns:
+            Season: The season, ready to simulate from the week it was saved at
+
+        Raises:
+            ValueError: if the file is not a season checkpoint or is cut short
+
+        Complexity:
+            Best Case Complexity: O(P + H + W*G + NlogN), where P is the number of players and stats,
+              H the total length of the result histories, W the number of weeks, G the games per week
+              and N the number of teams, the last term being the sort of the standings
+            Worst Case Complexity: O(P*K' + H + W*G + NlogN*S), where K' is the cost of probing a
+              player's position list and S is comp(str) between team names
+        """
+        reader = BinaryReader.load(path, Season.CHECKPOINT_MAGIC, Season.CHECKPOINT_VERSION)
+        current_week, rng_kind, seed = reader.unpack("<IBQ")
+        if rng is None:
+            rng = RandomGen if rng_kind == 0 else RandomStream(seed)
+        rng.seed = seed
+
+        positions = ArrayR(len(PlayerPosition))
+        for code, position in enumerate(PlayerPosition):
+            positions[code] = position
+
+        teams = ArrayR(reader.unpack("<I")[0])
+        for index in range(len(teams)):
+            name = reader.read_str()
+            scorer_stat = reader.read_str()
+            history_length, points = reader.unpack("<Iq")
+            results = ArrayR(reader.unpack("<I")[0])
+            for i in range(len(results)):
+                results[i] = TeamGameResult(reader.unpack("<B")[0])
+            players = ArrayR(reader.unpack("<I")[0])
+            for i in range(len(players)):
+                player_name = reader.read_str()
+                code, born_year, goals = reader.unpack("<BiI")
+                player = Player(player_name, positions[code], 0)
+                player.born_year = born_year
+                player.goals = goals
+                for _ in range(reader.unpack("<H")[0]):
+                    stat = reader.read_str()
+                    player[stat] = reader.unpack("<q")[0]
+                players[i] = player
+            team = Team(name, players, history_length)
+            team.points = points
+            for result in results:
+                team.results.append(result)
+            if scorer_stat:
+                team.set_scorer_stat(scorer_stat)
+            teams[index] = team
+
+        if reader.unpack("<B")[0] == 1:
+            has_seed, schedule_seed = reader.unpack("<?Q")
+            num_weeks = reader.unpack("<I")[0]
+            order = ArrayList(max(num_weeks, 1))
+            for _ in range(num_weeks):
+                order.append(reader.unpack("<I")[0])
+            schedule = LazySchedule(teams, schedule_seed if has_seed else None, order)
         else:
-            self.schedule.append(original_week)
+            num_weeks = reader.unpack("<I")[0]
+            schedule = ArrayList(num_weeks)
+            for _ in range(num_weeks):
+                week_number, num_games = reader.unpack("<II")
+                games = ArrayR(num_games)
+                for i in range(num_games):
+                    home, away = reader.unpack("<II")
+                    games[i] = Game(teams[home], teams[away])
+                schedule.append(WeekOfGames(week_number, games))
+
+        # The schedule is already known, so __init__ (which would generate one) is skipped.
+        season = cls.__new__(cls)
+        season._init_state(teams, rng, Leaderboard(teams), current_week)
+        season.schedule = schedule
+        return season
 
     def __len__(self) -> int:
         """
@@ -0,0 +1,369 @@
+"""
+This module exports the results of seasons as column files.
+
+A table is written by a `ColumnWriter` to a CSV file (`<path>.csv`), a typed
+binary column file (`<path>.cols`), or both. Rows are collected into one array
+per column and written out every `chunk_size` rows through buffered files, so
+memory stays bounded by the chunk size however many rows are exported.
+
+The binary column format is:
+
+    header: magic b"SSCO", version (u16), number of columns (u16), then for
+            each column its name (u16 length + UTF-8) and its type code (u8)
+    chunks: number of rows (u32), then each column in turn: a numeric column
+            as rows little-endian values of its type, a text column as rows
+            u32 byte lengths followed by the UTF-8 bytes of all its values
+
+A type code is a fixed-size `array` type code (one of "bBhHiIqQfd"), or "s" for text.
+`ColumnReader` reads the chunks back one at a time.
+
+Three tables can be exported:
+- games, streamed while seasons are simulated by a `GameExporter`, which is an
+  `EventSink`; the run column tells Monte Carlo replications apart
+- standings, by `export_standings()`
+- players, with their goals and every stat any player has, by `export_players()`
+"""
+
+from __future__ import annotations
+
+import csv
+import struct
+import sys
+from array import array
+
+from binary_io import BinaryWriter
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulationOutcome
+from match_log import EventSink
+from team import Team
+
+MAGIC = b"SSCO"
+VERSION = 1
+TEXT = "s"
+CSV = "csv"
+BINARY = "cols"
+CHUNK_ROWS = struct.Struct("<I")
+
+GAME_COLUMNS = (
+    ("run", "I"), ("week", "I"), ("home_team", TEXT), ("away_team", TEXT),
+    ("home_goals", "B"), ("away_goals", "B"), ("scorers", TEXT),
+)
+STANDINGS_COLUMNS = (("place", "I"), ("team", TEXT), ("points", "q"))
+PLAYER_COLUMNS = (("team", TEXT), ("player", TEXT), ("position", TEXT), ("age", "I"), ("goals", "I"))
+
+
+class ColumnWriter:
+    """
+    Writes rows of a fixed set of typed columns, a chunk at a time.
+
+    Usage:
+    ```
+    with ColumnWriter("out/standings", (("team", "s"), ("points", "q"))) as table:
+        table.write_row("Sharks", 12)
+    ```
+    """
+
+    def __init__(self, path: str, columns: tuple, formats: tuple = (CSV, BINARY),
+                 chunk_size: int = 1 << 16, buffer_size: int = 1 << 20) -> None:
+        """
+        Args:
+            path (str): The path of the files, without extension
+            columns (tuple): (name, type code) of each column, see the module docstring
+            formats (tuple): The files to write, CSV and/or BINARY
+            chunk_size (int): The number of rows collected before they are written
+            buffer_size (int): The size of the write buffer of each file, in bytes
+
+        Raises:
+            ValueError: if there are no columns or formats, or a type code is unknown
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the number of columns
+            Worst Case Complexity: O(C)
+        """
+        if len(columns) == 0 or len(formats) == 0:
+            raise ValueError("A table needs at least one column and one format.")
+        if chunk_size < 1:
+            raise ValueError("A chunk must hold at least one row.")
+        for _, code in columns:
+            if code != TEXT and code not in "bBhHiIqQfd":
+                raise ValueError(f"Unknown column type {code!r}.")
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.__pending = 0
+        self.__values = ArrayR(len(columns))
+        self.__reset()
+
+        self.__csv_file = None
+        self.__csv = None
+        self.__binary = None
+        if CSV in formats:
+            self.__csv_file = open(f"{path}.{CSV}", "w", newline="", encoding="utf-8", buffering=buffer_size)
+            self.__csv = csv.writer(self.__csv_file)
+            self.__csv.writerow(name for name, _ in columns)
+        if BINARY in formats:
+            self.__binary = open(f"{path}.{BINARY}", "wb", buffering=buffer_size)
+            header = BinaryWriter(MAGIC, VERSION)
+            header.pack("<H", len(columns))
+            for name, code in columns:
+                header.write_str(name)
+                header.pack("<B", ord(code))
+            self.__binary.write(header.buffer)
+
+    def __reset(self) -> None:
+        """ Starts an empty chunk: one array per numeric column, a list of strings per text column. """
+        for index, (_, code) in enumerate(self.columns):
+            self.__values[index] = ArrayList(self.chunk_size) if code == TEXT else array(code)
+
+    def write_row(self, *values) -> None:
+        """
+        Adds a row, writing out the chunk when it is full.
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the number of columns
+            Worst Case Complexity: O(C*R + B), when the chunk is written, where R is chunk_size and
+              B the size of the chunk in bytes
+        """
+        if len(values) != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} values, got {len(values)}.")
+        for index in range(len(values)):
+            self.__values[index].append(values[index])
+        self.__pending += 1
+        self.rows += 1
+        if self.__pending == self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes out the rows collected so far.
+        :complexity: O(C*R + B) where C is the number of columns, R the number of rows and B their size in bytes.
+        """
+        if self.__pending == 0:
+            return
+        if self.__csv is not None:
+            self.__csv.writerows(zip(*(self.__values[index] for index in range(len(self.columns)))))
+        if self.__binary is not None:
+            self.__binary.write(CHUNK_ROWS.pack(self.__pending))
+            for index in range(len(self.columns)):
+                values = self.__values[index]
+                if isinstance(values, array):
+                    if sys.byteorder != "little":
+                        values.byteswap()
+                    self.__binary.write(values.tobytes())
+                    continue
+                lengths = array("I")
+                data = bytearray()
+                for value in values:
+                    encoded = str(value).encode("utf-8")
+                    lengths.append(len(encoded))
+                    data += encoded
+                if sys.byteorder != "little":
+                    lengths.byteswap()
+                self.__binary.write(lengths.tobytes())
+                self.__binary.write(data)
+        self.__pending = 0
+        self.__reset()
+
+    def close(self) -> None:
+        """ Writes out the last rows and closes the files. """
+        self.flush()
+        for file in (self.__csv_file, self.__binary):
+            if file is not None and not file.closed:
+                file.close()
+
+    def __enter__(self) -> ColumnWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ColumnReader:
+    """
+    Reads a binary column file written by a ColumnWriter, one chunk at a time.
+
+    Usage:
+    ```
+    with ColumnReader("out/games.cols") as games:
+        for chunk in games:
+            goals = sum(chunk[games.index("home_goals")])
+    ```
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Raises:
+            ValueError: if the file is not a column file
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the number of columns
+            Worst Case Complexity: O(C)
+        """
+        self.__file = open(path, "rb")
+        try:
+            if self.__file.read(len(MAGIC)) != MAGIC:
+                raise ValueError("Not a column file.")
+            version, count = self.__unpack("<HH")
+            if version != VERSION:
+                raise ValueError(f"Unsupported format version {version}, expected {VERSION}.")
+            names = ArrayR(count)
+            codes = ArrayR(count)
+            for index in range(count):
+                length = self.__unpack("<H")[0]
+                names[index] = self.__read(length).decode("utf-8")
+                codes[index] = chr(self.__unpack("<B")[0])
+        except ValueError:
+            self.close()
+            raise
+        self.names = names
+        self.codes = codes
+
+    def __read(self, size: int) -> bytes:
+        data = self.__file.read(size)
+        if len(data) != size:
+            raise ValueError("Unexpected end of data.")
+        return data
+
+    def __unpack(self, fmt: str) -> tuple:
+        return struct.unpack(fmt, self.__read(struct.calcsize(fmt)))
+
+    def index(self, name: str) -> int:
+        """
+        Returns the position of a column in each chunk.
+        :complexity: O(C) where C is the number of columns.
+        :raises KeyError: if there is no such column.
+        """
+        for index in range(len(self.names)):
+            if self.names[index] == name:
+                return index
+        raise KeyError(name)
+
+    def __iter__(self):
+        """
+        Yields each chunk as an ArrayR holding, for every column, an array of its values (a tuple
+        of str for a text column).
+        :complexity: O(B) per chunk, where B is the size of the chunk in bytes.
+        """
+        while True:
+            header = self.__file.read(CHUNK_ROWS.size)
+            if len(header) == 0:
+                return
+            if len(header) != CHUNK_ROWS.size:
+                raise ValueError("Unexpected end of data.")
+            rows = CHUNK_ROWS.unpack(header)[0]
+            chunk = ArrayR(len(self.names))
+            for index in range(len(self.names)):
+                code = self.codes[index]
+                if code != TEXT:
+                    values = array(code)
+                    values.frombytes(self.__read(rows * values.itemsize))
+                    if sys.byteorder != "little":
+                        values.byteswap()
+                    chunk[index] = values
+                    continue
+                lengths = array("I")
+                lengths.frombytes(self.__read(rows * lengths.itemsize))
+                if sys.byteorder != "little":
+                    lengths.byteswap()
+                data = self.__read(sum(lengths))
+                texts = ArrayR(rows)
+                offset = 0
+                for row in range(rows):
+                    texts[row] = data[offset:offset + lengths[row]].decode("utf-8")
+                    offset += lengths[row]
+                chunk[index] = texts
+            yield chunk
+
+    def close(self) -> None:
+        """ Closes the file. """
+        self.__file.close()
+
+    def __enter__(self) -> ColumnReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GameExporter(EventSink):
+    """
+    An event sink that exports every game as a row of the games table: run, week, home team,
+    away team, home goals, away goals, and the scorers separated by ";", home scorers first.
+
+    Usage:
+    ```
+    with GameExporter("out/games") as games:
+        for run in range(replications):
+            games.run = run
+            build_season(run).simulate_season(event_sink=games)
+    ```
+    """
+
+    def __init__(self, path: str, formats: tuple = (CSV, BINARY), chunk_size: int = 1 << 16) -> None:
+        """
+        Args:
+            path (str): The path of the files, without extension
+            formats (tuple): The files to write, CSV and/or BINARY
+            chunk_size (int): The number of games collected before they are written
+        """
+        self.table = ColumnWriter(path, GAME_COLUMNS, formats, chunk_size)
+        self.run = 0
+
+    def record_game(self, week: int, home_team: Team, away_team: Team, outcome: GameSimulationOutcome) -> None:
+        """
+        Adds a game to the table.
+        :complexity: O(S*L) where S is the number of goals and L the length of a player name.
+        """
+        self.table.write_row(
+            self.run, week, home_team.name, away_team.name, outcome.home_goals, outcome.away_goals,
+            ";".join(outcome.goal_scorers),
+        )
+
+    def close(self) -> None:
+        """ Writes out the last games and closes the files. """
+        self.table.close()
+
+
+def export_standings(season, path: str, formats: tuple = (CSV, BINARY), chunk_size: int = 1 << 16) -> None:
+    """
+    Exports the standings of a season: place (1 being first), team and points.
+
+    Complexity:
+        Best Case Complexity: O(N), where N is the number of teams
+        Worst Case Complexity: O(N*K), where K is the length of a team name
+    """
+    with ColumnWriter(path, STANDINGS_COLUMNS, formats, chunk_size) as table:
+        for place, team in enumerate(season.leaderboard, 1):
+            table.write_row(place, team.name, team.points)
+
+
+def export_players(season, path: str, formats: tuple = (CSV, BINARY), chunk_size: int = 1 << 16) -> None:
+    """
+    Exports every player of a season: team, name, position, age, goals, then one column per stat
+    that any player has, in the order the stats are first found. A player without a stat gets 0.
+
+    Complexity:
+        Best Case Complexity: O(P*S), where P is the number of players and S the number of stat columns
+        Worst Case Complexity: O(P*S*K), when the stat tables probe past every stat, K being the
+          length of a stat name
+        Explanation:
+        - the players are walked twice, once to find the stat columns and once to write the rows
+    """
+    stat_names = ArrayList()
+    seen = LinearProbeTable()
+    for team in season.teams:
+        for player in season.resolve(team).get_players():
+            for stat in player.stats.keys():
+                if stat not in seen:
+                    seen[stat] = len(stat_names)
+                    stat_names.append(stat)
+
+    columns = PLAYER_COLUMNS + tuple((stat, "q") for stat in stat_names)
+    with ColumnWriter(path, columns, formats, chunk_size) as table:
+        for team in season.teams:
+            team = season.resolve(team)
+            for player in team.get_players():
+                stats = tuple(player[stat] if stat in player.stats else 0 for stat in stat_names)
+                table.write_row(team.name, player.name, player.position.value, player.get_age(), player.goals, *stats)
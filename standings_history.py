@@ -0,0 +1,168 @@
+"""
+This module provides `StandingsHistory`, which records how the standings of a
+season change week by week.
+
+Teams are referred to by their index in the season. After each week only the
+changes are kept: the teams whose points changed, with the change, and the
+places whose team changed, with the new team. Every few weeks a keyframe holds
+the full table. The table after any week is rebuilt by copying the nearest
+keyframe before it and replaying at most `keyframe_interval` weeks of changes,
+so memory grows with the number of changes rather than with teams x weeks. A copy
+shares everything recorded so far, and only copies it when either history records
+its next week.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from data_structures.array_list import ArrayList
+from data_structures.referential_array import ArrayR
+
+
+class StandingsHistory:
+
+    def __init__(self, points: ArrayR[int], order: ArrayR[int], start_week: int = 0, keyframe_interval: int = 8) -> None:
+        """
+        Args:
+            points (ArrayR[int]): The points of each team, by team index
+            order (ArrayR[int]): The index of the team in each place, first place first
+            start_week (int): The number of weeks played when recording starts
+            keyframe_interval (int): The number of weeks between two full tables
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams
+            Worst Case Complexity: O(N)
+        """
+        if keyframe_interval < 1:
+            raise ValueError("Keyframes must be at least one week apart.")
+        self.start_week = start_week
+        self.keyframe_interval = keyframe_interval
+        self.__points = self.__to_array('q', points)
+        self.__order = self.__to_array('L', order)
+        self.__keyframes = ArrayList()
+        self.__keyframes.append((array('q', self.__points), array('L', self.__order)))
+        # Entry i holds the changes from week start_week + i to week start_week + i + 1.
+        self.__deltas = ArrayList()
+        self.__shared = False
+
+    @staticmethod
+    def __to_array(typecode: str, values) -> array:
+        result = array(typecode)
+        for value in values:
+            result.append(value)
+        return result
+
+    @property
+    def latest_week(self) -> int:
+        """ The number of weeks played when the last week was recorded. """
+        return self.start_week + len(self.__deltas)
+
+    def record(self, points: ArrayR[int], order: ArrayR[int]) -> None:
+        """
+        Records the standings after the next week.
+
+        Args:
+            points (ArrayR[int]): The points of each team, by team index
+            order (ArrayR[int]): The index of the team in each place, first place first
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams
+            Worst Case Complexity: O(N)
+            Explanation:
+            - both tables are compared with the previous week once, only the differences are stored,
+              and every keyframe_interval weeks the full table is copied
+            - the first week recorded after copy() also copies the shared state, O(N + W), see __own()
+        """
+        self.__own()
+        point_changes = array('q')
+        for team in range(len(self.__points)):
+            if points[team] != self.__points[team]:
+                point_changes.append(team)
+                point_changes.append(points[team] - self.__points[team])
+                self.__points[team] = points[team]
+        place_changes = array('L')
+        for place in range(len(self.__order)):
+            if order[place] != self.__order[place]:
+                place_changes.append(place)
+                place_changes.append(order[place])
+                self.__order[place] = order[place]
+        self.__deltas.append((point_changes, place_changes))
+        if len(self.__deltas) % self.keyframe_interval == 0:
+            self.__keyframes.append((array('q', self.__points), array('L', self.__order)))
+
+    def at(self, week: int) -> tuple[array, array]:
+        """
+        Returns the points of each team and the order of the teams after a week.
+
+        Args:
+            week (int): The number of weeks played, from start_week to latest_week
+
+        Returns:
+            tuple[array, array]: The points by team index, and the team index in each place
+
+        Raises:
+            IndexError: if the week was not recorded
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of teams, when the week has a keyframe
+            Worst Case Complexity: O(N + C), where C is the number of changes in the at most
+              keyframe_interval - 1 weeks replayed after the keyframe
+        """
+        if week < self.start_week or week > self.latest_week:
+            raise IndexError(f"No standings recorded after week {week}.")
+        offset = week - self.start_week
+        keyframe = offset // self.keyframe_interval
+        points, order = self.__keyframes[keyframe]
+        points = array('q', points)
+        order = array('L', order)
+        for delta in range(keyframe * self.keyframe_interval, offset):
+            point_changes, place_changes = self.__deltas[delta]
+            for i in range(0, len(point_changes), 2):
+                points[point_changes[i]] += point_changes[i + 1]
+            for i in range(0, len(place_changes), 2):
+                order[place_changes[i]] = place_changes[i + 1]
+        return points, order
+
+    def copy(self) -> StandingsHistory:
+        """
+        Returns a history that shares the weeks recorded so far and records new weeks on its own.
+        Nothing is copied until one of the two histories records a week, see __own().
+        :complexity: O(1)
+        """
+        history = StandingsHistory.__new__(StandingsHistory)
+        history.start_week = self.start_week
+        history.keyframe_interval = self.keyframe_interval
+        history.__points = self.__points
+        history.__order = self.__order
+        history.__keyframes = self.__keyframes
+        history.__deltas = self.__deltas
+        history.__shared = True
+        self.__shared = True
+        return history
+
+    def __own(self) -> None:
+        """
+        Gives this history its own copy of the latest tables and of the lists of keyframes and
+        changes, if they are shared with a copy. The keyframes and changes themselves are never
+        modified, so they stay shared.
+        :complexity: O(1) when nothing is shared, O(N + W) otherwise, where N is the number of teams
+            and W the number of weeks recorded.
+        """
+        if not self.__shared:
+            return
+        self.__points = array('q', self.__points)
+        self.__order = array('L', self.__order)
+        keyframes = ArrayList(len(self.__keyframes) + 1)
+        for keyframe in self.__keyframes:
+            keyframes.append(keyframe)
+        self.__keyframes = keyframes
+        deltas = ArrayList(len(self.__deltas) + 1)
+        for delta in self.__deltas:
+            deltas.append(delta)
+        self.__deltas = deltas
+        self.__shared = False
+
+    def __len__(self) -> int:
+        """ Returns the number of weeks recorded. """
+        return len(self.__deltas)
@@ -2,24 +2,78 @@
 This module defines the `Team` class, a complex data structure that manages
 all information related to a single soccer team.
 
-It uses a `LinearProbeTable` to store its roster, keyed by player position for
-efficient retrieval. It also tracks game history using a `CircularQueue` and manages
-date-stamped blog posts with a specialized `HashyDateTable`.
+It stores its roster in `PositionSlots`, one list of players per position, and
+keeps a `LinearProbeTable` from player name to the player's list node. It also
+tracks game history using a `CircularQueue` and manages date-stamped blog posts
+with a specialized `HashyDateTable`, alongside an `AVLTree` of the posts by date.
+The scorer sampler and the flat list of all players are cached until the roster
+changes. `Team.fork` gives a copy-on-write copy of a team that shares its roster
+until a player is changed. Teams are ordered by a cached `sort_key`, (negated
+points, name), refreshed whenever their points change.
 """
 
 from __future__ import annotations
 
+from alias_sampler import AliasSampler
 from data_structures.referential_array import ArrayR
 from enums import TeamGameResult, PlayerPosition
 from player import Player
 from typing import Collection, TypeVar
 from data_structures import *
-from hashy_date_table import HashyDateTable
+from hashy_date_table import HashyDateTable, date_key
 
 T = TypeVar("T")
 
 
+class PositionSlots:
+    """
+    The players of a team grouped by position: one LinkedList per PlayerPosition, held in an
+    array at the position's ordinal, so a position is found without hashing its value.
+    The number of players is kept up to date as players are added and removed.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    def __init__(self) -> None:
+        """ :complexity: O(A) where A is len(PlayerPosition). """
+        self.__slots = ArrayR(len(PlayerPosition))
+        for index in range(len(self.__slots)):
+            self.__slots[index] = LinkedList()
+        self.__count = 0
+
+    def __getitem__(self, position: PlayerPosition) -> LinkedList[Player]:
+        """ Returns the list of players in a position. Change it through add() and remove(). """
+        return self.__slots[position.ordinal]
+
+    def __setitem__(self, position: PlayerPosition, players: LinkedList[Player]) -> None:
+        """ Replaces the list of players in a position. """
+        self.__count += len(players) - len(self.__slots[position.ordinal])
+        self.__slots[position.ordinal] = players
+
+    def __len__(self) -> int:
+        """ Returns the number of players in all positions. """
+        return self.__count
+
+    def add(self, player: Player) -> DoubleNode[Player]:
+        """ Appends a player to the list of its position and returns the node holding it. """
+        self.__count += 1
+        return self.__slots[player.position.ordinal].append_node(player)
+
+    def remove(self, node: DoubleNode[Player]) -> Player:
+        """ Removes the node of a player, as returned by add(), and returns the player. """
+        self.__count -= 1
+        return self.__slots[node.item.position.ordinal].delete_node(node)
+
+    def __iter__(self):
+        """
+        Iterates through the lists of players, in the order of PlayerPosition.
+        :complexity: O(A) for a full iteration, where A is len(PlayerPosition).
+        """
+        return iter(self.__slots)
+
+
 class Team:
+
     def __init__(self, team_name: str, initial_players: ArrayR[Player], history_length: int) -> None:
         """
         Constructor for the Team class
@@ -33,39 +87,94 @@ class Team:
             None
 
         Complexity:
-            Best Case Complexity: O(A*K + B*K + C) = O(A*K + B*K + C), where A is len(PlayerPosition), K is value of position.value (key),
+            Best Case Complexity: O(A + B*K + C), where A is len(PlayerPosition), K is the length of a player's name,
+              B is len(initial_players) and C is history_length
+            Worst Case Complexity: O(A + B^2*K + C), where A is len(PlayerPosition), K is the length of a player's name,
               B is len(initial_players) and C is history_length
-            Worst Case Complexity: O(A*N*K + B*N*K + C) = O(A*N*K + B*N*K + C), where A is len(PlayerPosition), K is value of position.value (key),
-              B is len(initial_players) and C is history_length, N is number of items in self.players
             Explanation: 
             Both best and worst case:
             - assignment operation for team_name is considered constant time O(1)
-            - initialisation of players is considered constant time O(1)
-            - initialisation of points and post are considered constant time O(1)
+            - initialisation of players creates one empty list per position, O(A)
+            - initialisation of points, the sort key and post are considered constant time O(1)
             - the initialisation of self.results is O(history_length) or O(C) as the Circular Queue is initialised with capacity history_length
+            - each of the B players is appended to the list at its position's ordinal in O(1)
             Best case:
-            - in the best case complexity, we assume the setitem operation is always best case which is O(K)
-              happens when we hash the key and the position is empty
-            - thus in the first for loop, with A iterations where A is the length of PlayerPosition, the best case complexity is O(A*K)
-            - in the second for loop, with B iterations where B is the length of initial_players, the best case complexity is O(B*K)
+            - in the best case complexity, we assume the setitem operation of the name table is always best case which is O(K)
+              happens when we hash the name and the position is empty
             Worst case:
-            - in the worst case complexity, we assume the setitem operation is always worst case which is O(N*K)
-              happens when we hash the key but the position is taken and we have to search the entire table.
+            - in the worst case complexity, we assume the setitem operation of the name table is always worst case which is O(B*K)
+              happens when we hash the name but the position is taken and we have to search the entire table.
               For each position, we have to check if the key is equal to the one in the table, hence the K factor.
-            - thus in the first for loop, with A iterations where A is the length of PlayerPosition, the worst case complexity is O()
-            - in the second for loop, with B iterations where B is the length of initial_players, the worst case complexity is O(B*N*K)
             Assumptions: #1191 #1520 (Ed Forum)
         """
         self.name = team_name
-        self.players = LinearProbeTable() 
-        for position in PlayerPosition:   
-            self.players[position.value] = LinkedList() 
+        self.players = PositionSlots()
+        self.__players_by_name = LinearProbeTable()
         for player in initial_players:  
-            self.players[player.position.value].append(player)  
+            self.__index_player(self.players.add(player))
         self.points = 0
         self.history_length = history_length
         self.results = CircularQueue(history_length) 
         self.post = HashyDateTable()  
+        self.posts_by_date = AVLTree()
+        self.scorer_stat = None
+        self.__scorer_sampler = None
+        self.__scorer_sampler_valid = False
+        self.__roster_shared = False
+        self.__owned_players = None
+        self.__roster_view = None
+
+    @classmethod
+    def from_positions(cls, team_name: str, players_by_position: ArrayR[LinkedList[Player]], history_length: int) -> Team:
+        """
+        Builds a team from players already grouped by position, e.g. by a bulk loader. The lists
+        become the team's position lists as they are, so each position is looked up once rather
+        than once per player.
+
+        Args:
+            team_name (str): The name of the team
+            players_by_position (ArrayR[LinkedList[Player]]): The players of each position, in the
+              order of PlayerPosition. A None entry leaves the position empty.
+            history_length (int): The number of `GameResult`s to store in the history
+
+        Complexity:
+            Best Case Complexity: O(A + P*K + C), where A is len(PlayerPosition), P the number of players,
+              K the length of a name and C is history_length
+            Worst Case Complexity: O(A + P^2*K + C), when every name has to probe past the others
+        """
+        team = cls(team_name, ArrayR(0), history_length)
+        count = 0
+        for players in players_by_position:
+            count += len(players) if players is not None else 0
+        team.__players_by_name = LinearProbeTable.for_items(count)
+        for index, position in enumerate(PlayerPosition):
+            if players_by_position[index] is not None:
+                team.players[position] = players_by_position[index]
+                for node in players_by_position[index].nodes():
+                    team.__index_player(node)
+        return team
+
+    def __index_player(self, node) -> None:
+        """
+        Records the list node of a player under the player's name.
+        :complexity: O(K) where K is the length of the name, O(N*K) if the name table has to probe.
+        :raises ValueError: if another player of the team has the same name.
+        """
+        if node.item.name in self.__players_by_name:
+            raise ValueError(f"{self.name} already has a player called {node.item.name}.")
+        self.__players_by_name[node.item.name] = node
+
+    def find_player(self, name: str) -> Player | None:
+        """
+        Returns the player of the team with the given name, or None if there is none.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the name
+            Worst Case Complexity: O(N*K), where N is the number of players, when the name table has to probe
+        """
+        if name not in self.__players_by_name:
+            return None
+        return self.__players_by_name[name].item
 
     def add_player(self, player: Player) -> None:
         """
@@ -77,24 +186,30 @@ class Team:
         Returns:
             None
 
+        Raises:
+            ValueError: if the team already has a player with the same name
+
         Complexity:
-            Best Case Complexity: O(K), where K is the length of key
-            Worst Case Complexity: O(N*K), where N is the number of items in self.players and K is the length of key
-            - assignment operation for key is considered constant time O(1)
-            - append() method is considered constant time O(1)
-            - in the best case complexity, we assume the getitem operation is always best case which is O(K)
-              happens when we hash the key and the position is empty.
-            - in the worst case complexity, we assume the getitem operation is always worst case which is O(N*K)
-              happens when we hash the key but the position is taken and we have to
+            Best Case Complexity: O(K), where K is the length of the player's name
+            Worst Case Complexity: O(N*K), where N is the number of players in the team
+            - the list of the player's position is found by the position's ordinal and appended to in O(1)
+            - in the best case complexity, the name table operations are always best case which is O(K)
+              happens when we hash the name and the position is empty.
+            - in the worst case complexity, the name table operations are always worst case which is O(N*K)
+              happens when we hash the name but the position is taken and we have to
               search the entire table. For each position, we have to check if the key is equal to the one in the table,
               hence the K factor.
         """
-        key = player.position.value
-        self.players[key].append(player)
+        if player.name in self.__players_by_name:
+            raise ValueError(f"{self.name} already has a player called {player.name}.")
+        self.__own_roster()
+        self.__index_player(self.players.add(player))
+        self.__roster_changed()
 
     def remove_player(self, player: Player) -> None:
         """
-        Removes a player from the team.
+        Removes a player from the team. The player is found by name; a name that is not in the
+        team is ignored.
 
         Args:
             player (Player): The player to remove
@@ -103,38 +218,36 @@ class Team:
             None
 
         Complexity:
-            Best Case Complexity: O(K + P), where P is is the length of self.players[key] LinkedList, len(ll),
-             K is the length of key
-            Worst Case Complexity: O(N*K + P^2), where P is is the length of self.players[key] LinkedList, len(ll),
-             N is number of items in self.players and K is the length of key
+            Best Case Complexity: O(K), where K is the length of the player's name
+            Worst Case Complexity: O(N*K), where N is the number of players in the team
             Explanation:
             Both best and worst case:
-            - assignment operation for key is considered constant time O(1)
-            - the for loop loops through the linked list len(ll) times, O(P)
+            - the player's list node is looked up in the name table, and unlinked from its position's
+              doubly linked list in O(1), so the list is never walked
+            - the order of the other players in the position is kept
             Best case:
-            - in the best case complexity, we assume the getitem operation is always best case which is O(K)
-              happens when we hash the key and the position is empty.
-            - we assume the delete_at_index() method is always best case which is O(1) - removing item at index 1
-              and do not have to traverse the linked list
+            - the lookup and the deletion from the name table hash the name once, O(K)
             Worst case:
-            - in the worst case complexity, we assume the getitem operation is always worst case which is O(N*K)
-              happens when we hash the key but the position is taken and we have to
-              search the entire table. For each position, we have to check if the key is equal to the one in the table,
-              hence the K factor.
-            - we assume the delete_at_index() method is always worst case which is O(P) - removing item at the last index
-              and have to traverse to it
+            - the lookup probes past every other name, O(N*K), and so does the deletion when it
+              re-inserts the rest of the cluster
         """
-        key = player.position.value
-        ll = self.players[key]
-        for i, p in enumerate(ll):
-            if player.name == p.name:
-                ll.delete_at_index(i)
+        if player.name not in self.__players_by_name:
+            return
+        self.__own_roster()
+        node = self.__players_by_name[player.name]
+        self.players.remove(node)
+        del self.__players_by_name[player.name]
+        self.__roster_changed()
 
     def get_players(self, position: PlayerPosition | None = None) -> Collection[Player]:
         """
         Returns the players of the team that play in the specified position.
         If position is None, it should return ALL players in the team.
         You may assume the position will always be valid.
+
+        All players are returned as a read-only ArrayR in position order, which is built once and
+        cached until add_player(), remove_player() or own_player() changes the roster. It supports
+        iteration and indexing in O(1) per player; setting a player in it raises TypeError.
         Args:
             position (PlayerPosition or None): The position of the players to return
 
@@ -146,43 +259,222 @@ class Team:
             This includes the ArrayR, which was previously prohibited.
 
         Complexity:
-            Best Case Complexity: O(K), where K is the length of key
-            Worst Case Complexity: O(M * (N*K + P)), where M is len(PlayerPosition), 
-              K is position.value which is the key, N is the number of items in self.players and P is the average length of 
-              self.players[position.value] LinkedList
+            Best Case Complexity: O(1), when a position is given, or the roster has not changed since the last call
+            Worst Case Complexity: O(M + P), where M is len(PlayerPosition) and P is the number of players in the team
             Explanation:
             Both best and worst case:
             - we assume all assignment, return and comparison between integer operations are considered constant time O(1)
-            - initialisation of players LinkedList() is considered constant time, O(1)
             Best case:
-            - in the best case complexity, the position is not none
-            - the getitem method for players is considered best case which is O(1)
-            - happens when we hash the key and the position is empty, O(K)
-            - and len(self.players) is 0 which returns None, O(1)
+            - with a position, its list is found at the position's ordinal in self.players, O(1)
+            - without one, the cached list of all players is returned, O(1)
             Worst case:
-            - in the worst case complexity, the position is not none, and len(self.players) is not 0,
+            - in the worst case complexity, the position is None and the roster changed since the last call,
+              so the cached list is rebuilt
             - the outer for loop with M iterations where M is the length of PlayerPosition
-            - the __getitem__() method is considered worst case which is O(N*K)
-            -  happens when we hash the key but the position is taken and we have to
-              search the entire table. For each position, we have to check if the key is equal to the one in the table,
-              hence the K factor
-            - the inner for loop with P iterations where P is the average length of self.players[position.value] LinkedList
-            Assumption: 
-            - in this case, for the worst case complexity, it cannot be further simplified as the variables
-              are independent from one another
+            - the inner for loops copy each of the P players once
         """
         if position is not None:
-            players = self.players[position.value]
-            return players
-        else:
-            players = LinkedList()
-            for position in PlayerPosition:
-                pos = self.players[position.value]
-                if pos is not None:
-                    for player in pos:
-                        players.append(player)
+            players = self.players[position]
             return players
-        
+        if self.__roster_view is None:
+            self.__roster_view = ArrayR.read_only(player for pos in self.players for player in pos)
+        return self.__roster_view
+
+    def __roster_changed(self) -> None:
+        """
+        Drops the cached list of all players and the scorer sampler built from it.
+        :complexity: O(1)
+        """
+        self.__roster_view = None
+        self.invalidate_scorer_sampler()
+
+    def fork(self) -> Team:
+        """
+        Returns a copy-on-write copy of the team.
+
+        The copy gets its own points and result history, but shares the roster, the players and
+        the blog posts with this team. The roster is only copied when the copy adds, removes or
+        changes a player (see own_player()), and then only the players it changes are copied.
+        This team is also marked as sharing its roster, so it copies it before changing it too.
+
+        Complexity:
+            Best Case Complexity: O(H), where H is history_length
+            Worst Case Complexity: O(H)
+            Explanation:
+            - the result history is the only state copied up front, every other field is shared
+        """
+        branch = Team.__new__(Team)
+        branch.name = self.name
+        branch.players = self.players
+        branch.__players_by_name = self.__players_by_name
+        branch.points = self.points
+        branch.history_length = self.history_length
+        branch.results = CircularQueue(self.history_length)
+        for _ in range(len(self.results)):
+            result = self.results.serve()
+            branch.results.append(result)
+            self.results.append(result)
+        branch.post = self.post
+        branch.posts_by_date = self.posts_by_date
+        branch.scorer_stat = self.scorer_stat
+        branch.__scorer_sampler = self.__scorer_sampler
+        branch.__scorer_sampler_valid = self.__scorer_sampler_valid
+        branch.__roster_shared = True
+        branch.__owned_players = None
+        branch.__roster_view = self.__roster_view
+        self.__roster_shared = True
+        return branch
+
+    def __own_roster(self) -> None:
+        """
+        Gives the team its own position lists and name table if it shares them with a fork.
+        The players in the lists are still shared.
+        :complexity: O(P*K) where P is the number of players in the team and K the length of a name,
+            O(1) if the roster is not shared.
+        """
+        if not self.__roster_shared:
+            return
+        players = PositionSlots()
+        self.__players_by_name = LinearProbeTable.for_items(len(self.players))
+        for position_players in self.players:
+            for player in position_players:
+                self.__index_player(players.add(player))
+        self.players = players
+        self.__owned_players = LinkedList()
+        self.__roster_shared = False
+
+    def own_player(self, player: Player) -> Player:
+        """
+        Returns a version of `player` that only this team holds, so that it can be changed
+        without affecting forks of the team. For a team that was never forked this is the
+        player itself.
+
+        Args:
+            player (Player): A player of this team
+
+        Returns:
+            Player: The player to change
+
+        Raises:
+            ValueError: if the player is not in the team
+
+        Complexity:
+            Best Case Complexity: O(1), when the team has never been forked
+            Worst Case Complexity: O(P*K + C + S), where P is the number of players in the team, K the length
+              of a name, C the number of players this team has already copied and S the number of stats of the
+              player. The P*K term is paid once, when the team first gets its own roster.
+        """
+        if self.__owned_players is None and not self.__roster_shared:
+            return player
+        self.__own_roster()
+        # Copies are recorded with the player they replaced, so that a reference to
+        # the original held from before the copy still finds it.
+        for original, copy in self.__owned_players:
+            if player is copy:
+                return copy
+            if player is original:
+                return copy
+        if player.name in self.__players_by_name:
+            node = self.__players_by_name[player.name]
+            if node.item is player:
+                copy = player.copy()
+                node.item = copy
+                self.__owned_players.append((player, copy))
+                self.__roster_changed()
+                return copy
+        raise ValueError(f"{player.name} does not play for {self.name}.")
+
+    def set_scorer_stat(self, stat: str | None) -> None:
+        """
+        Weights goal scorers by a player stat. A player with stat value v is picked
+        with weight 1 + v (negative values count as 0), so players without the stat
+        can still score. None picks scorers uniformly, which is the default.
+
+        Args:
+            stat (str or None): The name of the stat to weight by
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.scorer_stat = stat
+        self.invalidate_scorer_sampler()
+
+    def invalidate_scorer_sampler(self) -> None:
+        """
+        Marks the cached scorer sampler as stale, so it is rebuilt on next use.
+        add_player() and remove_player() call this themselves; call it after changing
+        the stat that scorers are weighted by.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__scorer_sampler = None
+        self.__scorer_sampler_valid = False
+
+    def scorer_weight(self, player: Player) -> int:
+        """
+        Returns the weight of a player in the scorer sampler.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(K), where K is the length of the stat name
+        """
+        if self.scorer_stat is None or self.scorer_stat not in player.stats:
+            return 1
+        return 1 + max(0, int(player[self.scorer_stat]))
+
+    def scorer_sampler(self) -> AliasSampler | None:
+        """
+        Returns an alias sampler over the outfield players of the team, in the order of
+        get_players(). The sampler is built once and cached until the roster changes.
+
+        Returns:
+            AliasSampler or None: The sampler, or None if the team has no outfield players
+
+        Raises:
+            ValueError: if the scorer weights are too large for one draw, see alias_sampler.MAX_CELLS
+
+        Complexity:
+            Best Case Complexity: O(1), when the cached sampler is still valid
+            Worst Case Complexity: O(P), where P is the number of players in the team, when the
+              sampler has to be rebuilt, plus the cost of get_players() if the roster changed
+            Explanation:
+            - the players are walked twice, once to count the outfield players and once to
+              fill the values and weights, and the alias table is built in O(P)
+        """
+        if self.__scorer_sampler_valid:
+            return self.__scorer_sampler
+        players = self.get_players()
+        count = 0
+        for player in players:
+            if player.position != PlayerPosition.GOALKEEPER:
+                count += 1
+        sampler = None
+        if count > 0:
+            outfield = ArrayR(count)
+            weights = ArrayR(count)
+            i = 0
+            for player in players:
+                if player.position != PlayerPosition.GOALKEEPER:
+                    outfield[i] = player
+                    weights[i] = self.scorer_weight(player)
+                    i += 1
+            sampler = AliasSampler(weights, outfield)
+        self.__scorer_sampler = sampler
+        self.__scorer_sampler_valid = True
+        return sampler
+
+    def new_season(self) -> None:
+        """
+        Clears the points and result history of the team for a new season. The roster, the
+        players and their goals and stats are kept.
+        :complexity: O(1)
+        """
+        self.points = 0
+        self.results.clear()
+
     def add_result(self, result: TeamGameResult) -> None:
         """
         Add the `result` to this `Team`'s history
@@ -195,6 +487,7 @@ class Team:
             Worst Case Complexity: O(1)
             Explanation:
             - comparison operation between integers and increment operation of points are considered constant time, O(1)
+            - setting points refreshes the team's sort key, (negated points, name), in constant time, O(1)
             Best case:
             - in the best case complexity, the results has not reached the max capacity of history_length, if statement is False
             - append() method is considered constant time, O(1) as it only adds a new result to the end of Circular Queue
@@ -243,6 +536,10 @@ class Team:
        
         A `Team` can have one published post per day. Any duplicate
         posts should overwrite the original post for that day.
+        The post is also placed in self.posts_by_date, keyed by date_key(post_date), which
+        holds one post per day whatever format the date was written in. A post for a day that
+        already has one under a different date format replaces it in self.post as well, so
+        the table and the index always hold the same posts.
         
         Args:
             `post_date` (`str`) - The date of the post
@@ -265,36 +562,71 @@ class Team:
               we use the worst case of rehash which happens when all items need maximum probing to be inserted in the new table.
               This is assuming K here is representing an average key length, and is being used
               as the cost of comparing two keys as well as cost of hashing a key.
+            - in both cases the date index is updated in O(logP), where P is the number of days with a post:
+              the post of that day, if any, is removed and the new one inserted
+            - if that post was made under another date format, its key is deleted from self.post, which is
+              within the same bounds as the __setitem__() operation
         """
+        key = date_key(post_date)
+        if key in self.posts_by_date:
+            old_date, _ = self.posts_by_date[self.posts_by_date.rank(key)]
+            self.posts_by_date.remove(key)
+            if old_date != post_date:
+                del self.post[old_date]
         self.post[post_date] = post_content
+        self.posts_by_date.insert(key, (post_date, post_content))
+
+    def get_posts(self, start_date: str, end_date: str) -> ArrayList[tuple[str, str]]:
+        """
+        Returns the posts made from `start_date` to `end_date` inclusive, oldest first, as
+        (post_date, post_content) pairs. The dates can be in any format make_post() accepts.
+
+        Complexity:
+            Best Case Complexity: O(logP + k), where P is the number of days with a post and k the number returned
+            Worst Case Complexity: O(logP + k)
+            Explanation:
+            - the date index is walked down once to the first post on or after start_date,
+              then in order until the first post after end_date
+        """
+        posts = ArrayList()
+        for post in self.posts_by_date.between(date_key(start_date), date_key(end_date)):
+            posts.append(post)
+        return posts
+
+    def get_latest_posts(self, count: int) -> ArrayList[tuple[str, str]]:
+        """
+        Returns up to `count` of the most recent posts, newest first, as (post_date, post_content) pairs.
+
+        Raises:
+            ValueError: if count is negative
+
+        Complexity:
+            Best Case Complexity: O(1), when count is 0
+            Worst Case Complexity: O(logP + k), where P is the number of days with a post and k is count
+            Explanation:
+            - the date index is walked in reverse order, stopping after count posts
+        """
+        if count < 0:
+            raise ValueError("The number of posts cannot be negative.")
+        posts = ArrayList(max(1, min(count, len(self.posts_by_date))))
+        for post in reversed(self.posts_by_date):
+            if len(posts) == count:
+                break
+            posts.append(post)
+        return posts
 
     def __len__(self) -> int:
         """
         Returns the number of players in the team.
 
         Complexity:
-            Best Case Complexity: O(P*K), where P is len(PlayerPosition) and k is the len(key)
-            Worst Case Complexity: O(P*N*K), where P is the len(PlayerPosition),
-              K is length of key which is position.value, N is the number of items in self.players and
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
             Explanation:
-            - assignment, increment and return operation of sum are considered constant time O(1)
-            Best case complexity:
-            - in the best case, we consider the __setitem__ method called to be always best case which is O(K)
-            - happens when we hash the key and the position is empty
-            - the for loop with P iterations where P is the length of PlayerPosition
-            Worst case complexity:
-            - in the worst case, we consider the __setitem__ method to be always worst case which is O(K*N)
-            - this happens when all items need maximum probing to be inserted in the new table.
-              This is assuming K here is representing an average key length, and is being used
-              as the cost of comparing two keys as well as cost of hashing a key.
-            - the for loop with P iterations where P is the length of PlayerPosition
+            - self.players counts the players as they are added and removed, so the count is returned
+              without visiting the positions
         """
-        sum = 0
-        for position in PlayerPosition:
-            pos = self.players[position.value]
-            if pos is not None:
-                sum += len(pos)
-        return sum
+        return len(self.players)
 
     def __str__(self) -> str:
         """
@@ -316,35 +648,80 @@ class Team:
         """
         return str(self)
 
-    def __le__(self, other: Team) -> bool:
+    @property
+    def points(self) -> int:
+        """
+        The points of the team this season.
+        :complexity: O(1)
+        """
+        return self.__points
+
+    @points.setter
+    def points(self, points: int) -> None:
+        """
+        Sets the points of the team and refreshes its sort key.
+        :complexity: O(1)
+        """
+        self.__points = points
+        self.sort_key = (-points, self.name)
+
+    def __lt__(self, other: Team) -> bool:
         """
-        magic method to allow use of <less than or equal to> comparison operator between Team objects based on:
-        1) the points of the team
+        magic method to allow use of <less than> comparison operator between Team objects based on:
+        1) the points of the team, the most points coming first
         2) the alphabetical order of the team name
-        
+
         Args:
             `other` (`Team`) - another Team object that is placed after the comparison operator
-            eg) team1 > team2 - team2 is the other parameter
-        
+
         Returns:
-            bool: a boolean value that represents the truth value of the comparison between the Team objects
+            bool: whether this team is ranked strictly above `other`
 
         Complexity:
-            Best Case Complexity: O(1)
-            Worst Case Complexity: O(S), where S is comp(str) is the comparison between string objects of self.name and other.name
-              which depends on the length of the string.
+            Best Case Complexity: O(1), when the points differ
+            Worst Case Complexity: O(S), where S is comp(str) between the team names
             Explanation:
-            For both best and worst case:
-            - the methods points() and name() are both constant time O(1)
-            - return operations are constant time, O(1)
-            Best case:
-            - happens when self.points is not equal to other.points
-            - comparison between self.points and other.points which are integers is constant time, O(1)
-            Worst case:
-            - happens when the points are equal and comparison between names happen.
-            - the comparison between string object depends on the length of the string, comp(str) which we denote as O(S)
-        """ 
-        if self.points != other.points:
-            return self.points > other.points
-        else:
-            return self.name < other.name
+            - the cached sort keys are compared, which only compares the names when the points are equal
+        """
+        if not isinstance(other, Team):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __le__(self, other: Team) -> bool:
+        """
+        magic method to allow use of <less than or equal to> comparison operator between Team objects,
+        in the same order as __lt__(). This is the comparison mergesort uses.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), see __lt__()
+        """
+        if not isinstance(other, Team):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(self, other: Team) -> bool:
+        """
+        magic method to allow use of <greater than> comparison operator between Team objects,
+        in the same order as __lt__().
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), see __lt__()
+        """
+        if not isinstance(other, Team):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(self, other: Team) -> bool:
+        """
+        magic method to allow use of <greater than or equal to> comparison operator between Team objects,
+        in the same order as __lt__().
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), see __lt__()
+        """
+        if not isinstance(other, Team):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
@@ -25,6 +25,9 @@ from data_structures.referential_array import ArrayR
 
 from data_structures.hash_table_linear_probing import LinearProbeTable
 from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from enums import PlayerPosition
+from player import Player
+from team import Team
 
 T = TypeVar('T')
 
@@ -340,6 +343,27 @@ def test_bset() -> None:
     print("BSet test passed")
 
 
+TEAM_NAMES = ("Tornadoes", "Sharks", "Wolves", "Eagles", "Lions", "Dragons")
+
+
+def make_teams(names=TEAM_NAMES, players_per_position: int = 1, history_length: int = 5) -> ArrayR[Team]:
+    """
+    Builds one team per name for tests. Every team gets `players_per_position` players of each
+    position, named "<team> <POSITION> <j>" and aged 20 + j.
+    """
+    teams = ArrayR(len(names))
+    for i, name in enumerate(names):
+        players = [Player(f"{name} {position.name} {j}", position, 20 + j)
+                   for position in PlayerPosition for j in range(players_per_position)]
+        teams[i] = Team(name, ArrayR.from_list(players), history_length)
+    return teams
+
+
+def numbered_teams(count: int, players_per_position: int = 1, history_length: int = 5) -> ArrayR[Team]:
+    """ Builds `count` teams named "Team 000", "Team 001", ... with make_teams(). """
+    return make_teams(tuple(f"Team {i:03d}" for i in range(count)), players_per_position, history_length)
+
+
 if __name__ == "__main__":
     test_queue()
     test_stack()
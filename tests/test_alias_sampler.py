@@ -0,0 +1,125 @@
+from unittest import TestCase
+
+from alias_sampler import MAX_CELLS, AliasSampler
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from game_simulator import GameSimulator
+from player import Player
+from random_gen import RandomStream
+from team import Team
+from tests.helper import make_teams
+
+
+class TestAliasSampler(TestCase):
+    def test_cells_match_weights(self):
+        """
+        #name(Test every outcome owns exactly its share of the cells)
+        """
+        for weights in ((30, 30, 20, 10, 5, 5), (1, 0, 3), (7,), (2, 9, 4, 1, 1)):
+            sampler = AliasSampler(weights)
+            counts = [0] * len(weights)
+            for cell in range(sampler.cells):
+                counts[sampler.index_of_cell(cell)] += 1
+            total = sum(weights)
+            self.assertEqual([count * total for count in counts],
+                             [weight * sampler.cells for weight in weights], f"{weights}")
+
+    def test_uniform_matches_random_choice(self):
+        """
+        #name(Test equal weights draw exactly like random_choice)
+        """
+        values = ArrayR.from_list(["a", "b", "c", "d", "e"])
+        sampler = AliasSampler(ArrayR.from_list([3] * 5), values)
+        first = RandomStream(11)
+        second = RandomStream(11)
+        for _ in range(50):
+            self.assertEqual(sampler.sample(first), second.random_choice(values))
+
+    def test_invalid_weights(self):
+        """
+        #name(Test empty, negative and all-zero weights are rejected)
+        """
+        for weights in ((), (1, -1), (0, 0), (1.5, 2)):
+            with self.assertRaises(ValueError):
+                AliasSampler(weights)
+        with self.assertRaises(ValueError):
+            AliasSampler((1, 2), ("only one",))
+
+    def test_cells_fit_one_draw(self):
+        """
+        #name(Test tables are limited to the cells one 32-bit draw can reach)
+        """
+        self.assertEqual(AliasSampler((1, 2 ** 31 - 1)).cells, MAX_CELLS)
+        with self.assertRaises(ValueError):
+            AliasSampler((1, 2 ** 31))
+        self.assertEqual(AliasSampler((2 ** 40, 2 ** 40)).cells, 2)
+
+    def test_goal_distribution(self):
+        """
+        #name(Test the goal sampler follows the goal weights and maps draws like the original goal list)
+        """
+        sampler = GameSimulator.GOAL_SAMPLER
+        original = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
+        self.assertEqual([sampler.value_of_cell(cell) for cell in range(sampler.cells)], original)
+        counts = [0] * len(GameSimulator.GOAL_WEIGHTS)
+        for cell in range(sampler.cells):
+            counts[sampler.value_of_cell(cell)] += 1
+        self.assertEqual([count * 100 // sampler.cells for count in counts], list(GameSimulator.GOAL_WEIGHTS))
+        stream = RandomStream(8)
+        draws = [sampler.sample(stream) for _ in range(200)]
+        stream = RandomStream(8)
+        self.assertEqual(draws, [stream.random_choice(original) for _ in range(200)])
+
+
+class TestScorerSampler(TestCase):
+    def setUp(self) -> None:
+        self.team = make_teams(("Sharks",), players_per_position=2)[0]
+
+    def test_cached_until_roster_changes(self):
+        """
+        #name(Test the scorer sampler is cached and rebuilt after roster changes)
+        """
+        sampler = self.team.scorer_sampler()
+        self.assertIs(self.team.scorer_sampler(), sampler)
+        self.assertEqual(len(sampler), 6)
+
+        newcomer = Player("New Striker", PlayerPosition.STRIKER, 19)
+        self.team.add_player(newcomer)
+        grown = self.team.scorer_sampler()
+        self.assertIsNot(grown, sampler)
+        self.assertEqual(len(grown), 7)
+
+        self.team.remove_player(newcomer)
+        self.assertEqual(len(self.team.scorer_sampler()), 6)
+
+    def test_goalkeepers_never_score(self):
+        """
+        #name(Test only outfield players are in the scorer sampler)
+        """
+        sampler = self.team.scorer_sampler()
+        for cell in range(sampler.cells):
+            self.assertNotEqual(sampler.values[sampler.index_of_cell(cell)].position, PlayerPosition.GOALKEEPER)
+
+    def test_weighted_by_stat(self):
+        """
+        #name(Test scorers can be weighted by a player stat)
+        """
+        star = self.team.get_players(PlayerPosition.STRIKER)[0]
+        for player in self.team.get_players():
+            player["Goals"] = 0
+        star["Goals"] = 9
+        self.team.set_scorer_stat("Goals")
+        sampler = self.team.scorer_sampler()
+        hits = 0
+        for cell in range(sampler.cells):
+            if sampler.values[sampler.index_of_cell(cell)] is star:
+                hits += 1
+        # 10 of the 15 units of weight belong to the star.
+        self.assertEqual(hits * 15, sampler.cells * 10)
+
+    def test_no_outfield_players(self):
+        """
+        #name(Test a team of goalkeepers has no scorer sampler)
+        """
+        keepers = Team("Keepers", ArrayR.from_list([Player("Keeper", PlayerPosition.GOALKEEPER, 30)]), 5)
+        self.assertIsNone(keepers.scorer_sampler())
@@ -0,0 +1,92 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from enums import PlayerPosition, ScheduleMethod
+from random_gen import RandomGen, RandomStream
+from season import LazySchedule, Season
+from tests.helper import make_teams, take_out_from_adt
+
+
+class TestCheckpointSetup(TestCase):
+    def setUp(self) -> None:
+        RandomGen.set_seed(2024)
+        self.teams = make_teams(players_per_position=2, history_length=4)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "season.ckpt")
+
+    @staticmethod
+    def summary(season: Season) -> list:
+        rows = []
+        for team in take_out_from_adt(season.leaderboard):
+            history = take_out_from_adt(team.get_history()) if team.get_history() is not None else []
+            goals = sorted((player.name, player.goals) for player in team.get_players())
+            rows.append((team.name, team.points, [result.value for result in history], goals))
+        return rows
+
+
+class TestCheckpoint(TestCheckpointSetup):
+    def test_resume_matches_uninterrupted_run(self):
+        """
+        #name(Test a resumed season finishes exactly like an uninterrupted one)
+        """
+        season = Season(self.teams)
+        season.delay_week_of_games(2, 7)
+        for _ in range(4):
+            season.simulate_week()
+        season.checkpoint(self.path)
+        season.simulate_season()
+        expected = self.summary(season)
+
+        RandomGen.set_seed(1)
+        resumed = Season.resume(self.path)
+        self.assertEqual(resumed.current_week, 4)
+        self.assertEqual(
+            [week.week for week in resumed.schedule],
+            [week.week for week in season.schedule],
+        )
+        resumed.simulate_season()
+        self.assertEqual(self.summary(resumed), expected)
+
+    def test_stats_and_stream_restored(self):
+        """
+        #name(Test player stats and a RandomStream state survive a checkpoint)
+        """
+        season = Season(self.teams, rng=RandomStream(77))
+        striker = self.teams[0].get_players(PlayerPosition.STRIKER)[0]
+        striker["Tackles"] = 5
+        season.simulate_week()
+        season.checkpoint(self.path)
+
+        resumed = Season.resume(self.path)
+        self.assertIsInstance(resumed.rng, RandomStream)
+        self.assertEqual(resumed.rng.seed, season.rng.seed)
+        restored = resumed.teams[0].get_players(PlayerPosition.STRIKER)[0]
+        self.assertEqual(restored.name, striker.name)
+        self.assertEqual(restored["Tackles"], 5)
+        self.assertEqual(restored.get_age(), striker.get_age())
+
+    def test_not_a_checkpoint(self):
+        """
+        #name(Test loading a file that is not a checkpoint raises ValueError)
+        """
+        with open(self.path, "wb") as file:
+            file.write(b"not a season")
+        with self.assertRaises(ValueError):
+            Season.resume(self.path)
+
+    def test_lazy_schedule_round_trip(self):
+        """
+        #name(Test a lazy schedule is saved as its seed and week order)
+        """
+        season = Season(self.teams, ScheduleMethod.LAZY, 17, rng=RandomStream(3))
+        season.delay_week_of_games(1, 4)
+        season.simulate_week()
+        season.checkpoint(self.path)
+        resumed = Season.resume(self.path)
+        self.assertIsInstance(resumed.schedule, LazySchedule)
+        self.assertEqual([week.week for week in resumed.schedule], [week.week for week in season.schedule])
+        season.simulate_season()
+        resumed.simulate_season()
+        self.assertEqual(self.summary(resumed), self.summary(season))
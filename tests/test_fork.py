@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from random_gen import RandomGen, RandomStream
+from season import Season
+from tests.helper import make_teams, take_out_from_adt
+
+
+class TestForkSetup(TestCase):
+    def setUp(self) -> None:
+        RandomGen.set_seed(31)
+        self.teams = make_teams(players_per_position=2, history_length=4)
+        self.season = Season(self.teams, rng=RandomStream(8))
+        for _ in range(3):
+            self.season.simulate_week()
+
+    @staticmethod
+    def summary(season: Season) -> list:
+        rows = []
+        for team in take_out_from_adt(season.leaderboard):
+            history = take_out_from_adt(team.get_history())
+            goals = sorted((player.name, player.goals) for player in team.get_players())
+            rows.append((team.name, team.points, [result.value for result in history], goals))
+        return rows
+
+
+class TestFork(TestForkSetup):
+    def test_branch_does_not_change_parent(self):
+        """
+        #name(Test simulating a branch leaves its parent untouched)
+        """
+        before = self.summary(self.season)
+        branch = self.season.fork(RandomStream(1))
+        branch.simulate_season()
+        self.assertEqual(self.summary(self.season), before)
+        self.assertNotEqual(self.summary(branch), before)
+        self.assertEqual(self.season.current_week, 3)
+
+    def test_default_branch_replays_parent(self):
+        """
+        #name(Test a branch with the default generator finishes like its parent)
+        """
+        branch = self.season.fork()
+        branch.simulate_season()
+        self.season.simulate_season()
+        self.assertEqual(self.summary(branch), self.summary(self.season))
+
+    def test_only_touched_state_is_copied(self):
+        """
+        #name(Test a branch copies only the teams and players it changes)
+        """
+        branch = self.season.fork(RandomStream(5))
+        for team in self.teams:
+            self.assertIs(branch.resolve(team), team)
+
+        branch.simulate_week()
+        week = self.season.schedule[self.season.current_week]
+        playing = set()
+        for game in week:
+            playing.update((game.home_team.name, game.away_team.name))
+        for team in self.teams:
+            copy = branch.resolve(team)
+            if team.name not in playing:
+                self.assertIs(copy, team)
+                continue
+            self.assertIsNot(copy, team)
+            originals = take_out_from_adt(team.get_players())
+            shared = [player for player in copy.get_players() if any(player is p for p in originals)]
+            copied = [player for player in copy.get_players() if not any(player is p for p in originals)]
+            self.assertEqual(len(shared) + len(copied), len(originals))
+            for player in copied:
+                original = next(p for p in originals if p.name == player.name)
+                self.assertGreater(player.goals, original.goals)
+
+    def test_fork_of_fork_and_delays(self):
+        """
+        #name(Test forks of forks and delayed weeks stay independent)
+        """
+        branch = self.season.fork(RandomStream(2))
+        branch.simulate_week()
+        grandchild = branch.fork(RandomStream(3))
+        before = self.summary(branch)
+        grandchild.delay_week_of_games(5)
+        grandchild.simulate_season()
+        self.assertEqual(self.summary(branch), before)
+        self.assertEqual([week.week for week in branch.schedule], [week.week for week in self.season.schedule])
+        self.assertNotEqual([week.week for week in grandchild.schedule], [week.week for week in branch.schedule])
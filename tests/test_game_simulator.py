@@ -0,0 +1,112 @@
+from unittest import TestCase
+
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from game_simulator import GameSimulator
+from player import Player
+from random_gen import RandomGen
+from season import Season
+from team import Team
+from tests.helper import make_teams
+
+
+class TestSimulateBatchSetup(TestCase):
+    def setUp(self) -> None:
+        RandomGen.set_seed(321)
+        self.season = Season(make_teams(players_per_position=3))
+
+
+class TestSimulateBatch(TestSimulateBatchSetup):
+    def test_exact_mode_matches_scalar(self):
+        """
+        #name(Test exact batches reproduce the scalar RandomGen sequence)
+        """
+        RandomGen.set_seed(55)
+        expected = [
+            GameSimulator.simulate(game.home_team, game.away_team)
+            for week in self.season.schedule
+            for game in week
+        ]
+        seed_after = RandomGen.seed
+
+        RandomGen.set_seed(55)
+        batch = GameSimulator.simulate_batch(self.season.schedule, exact=True)
+        self.assertEqual(RandomGen.seed, seed_after)
+        self.assertEqual(len(batch), len(expected))
+        for i, outcome in enumerate(expected):
+            actual = batch.outcome(i)
+            self.assertEqual(actual.home_goals, outcome.home_goals)
+            self.assertEqual(actual.away_goals, outcome.away_goals)
+            self.assertEqual(list(actual.goal_scorers), list(outcome.goal_scorers))
+
+    def test_columns(self):
+        """
+        #name(Test the batch columns are consistent)
+        """
+        week = self.season.schedule[0]
+        batch = GameSimulator.simulate_batch(week)
+        self.assertEqual(len(batch), len(week.games))
+        self.assertEqual(batch.scorer_offsets[0], 0)
+        for i in range(len(batch)):
+            game = batch.games[i]
+            start, stop = batch.scorer_offsets[i], batch.scorer_offsets[i + 1]
+            self.assertEqual(stop - start, batch.home_goals[i] + batch.away_goals[i])
+            for j in range(start, stop):
+                team = game.home_team if j < start + batch.home_goals[i] else game.away_team
+                scorer = batch.roster(team)[batch.scorers[j]]
+                self.assertNotEqual(scorer.position, PlayerPosition.GOALKEEPER)
+
+    def test_bulk_mode_is_seeded(self):
+        """
+        #name(Test bulk batches are repeatable for a seed)
+        """
+        RandomGen.set_seed(9)
+        first = GameSimulator.simulate_batch(self.season.schedule)
+        RandomGen.set_seed(9)
+        second = GameSimulator.simulate_batch(self.season.schedule)
+        self.assertEqual(first.home_goals, second.home_goals)
+        self.assertEqual(first.away_goals, second.away_goals)
+        self.assertEqual(first.scorers, second.scorers)
+
+
+class TestScorerAttribution(TestSimulateBatchSetup):
+    def test_outcome_carries_players(self):
+        """
+        #name(Test outcomes carry the scoring Player objects)
+        """
+        game = self.season.schedule[0].games[0]
+        for _ in range(20):
+            outcome = GameSimulator.simulate(game.home_team, game.away_team)
+            self.assertEqual(len(outcome.scorer_players), outcome.home_goals + outcome.away_goals)
+            for i in range(len(outcome.scorer_players)):
+                self.assertEqual(outcome.scorer_players[i].name, outcome.goal_scorers[i])
+
+    def test_same_name_on_both_teams(self):
+        """
+        #name(Test goals are credited to the right player when names clash)
+        """
+        home = Team("Home", ArrayR.from_list([Player("Sam", PlayerPosition.STRIKER, 20)]), 5)
+        away = Team("Away", ArrayR.from_list([Player("Sam", PlayerPosition.STRIKER, 20)]), 5)
+        season = Season(ArrayR.from_list([home, away]))
+        RandomGen.set_seed(4)
+        season.simulate_season()
+        home_player = home.get_players()[0]
+        away_player = away.get_players()[0]
+        RandomGen.set_seed(4)
+        replay = Season(ArrayR.from_list([
+            Team("Home", ArrayR.from_list([Player("Sam", PlayerPosition.STRIKER, 20)]), 5),
+            Team("Away", ArrayR.from_list([Player("Sam", PlayerPosition.STRIKER, 20)]), 5),
+        ]))
+        total_for_home = 0
+        total_for_away = 0
+        for week in replay.schedule:
+            for game in week:
+                outcome = GameSimulator.simulate(game.home_team, game.away_team)
+                if game.home_team.name == "Home":
+                    total_for_home += outcome.home_goals
+                    total_for_away += outcome.away_goals
+                else:
+                    total_for_home += outcome.away_goals
+                    total_for_away += outcome.home_goals
+        self.assertEqual(home_player.goals, total_for_home)
+        self.assertEqual(away_player.goals, total_for_away)
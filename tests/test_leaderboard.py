@@ -0,0 +1,227 @@
+from unittest import TestCase
+
+import ast
+import inspect
+
+from algorithms import mergesort
+from data_structures.array_list import ArrayList
+from data_structures.avl_tree import AVLTree
+from data_structures.referential_array import ArrayR
+from tests.helper import TEAM_NAMES, make_teams, take_out_from_adt, CollectionsFinder
+from enums import TeamGameResult
+from leaderboard import Leaderboard
+from random_gen import RandomGen
+from season import Season
+from team import Team
+
+
+class TestLeaderboardSetup(TestCase):
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        self.teams = list(make_teams(TEAM_NAMES + ("Panthers", "Bears"), players_per_position=3))
+
+    def sorted_names(self) -> list:
+        teams = ArrayList(len(self.teams))
+        for team in self.teams:
+            teams.append(team)
+        teams = mergesort.mergesort(teams)
+        return [teams[i].name for i in range(len(teams))]
+
+
+class TestLeaderboard(TestLeaderboardSetup):
+    def test_initial_order(self):
+        """
+        #name(Test the leaderboard starts in Team.__le__ order)
+        """
+        leaderboard = Leaderboard(ArrayR.from_list(self.teams))
+        self.assertEqual([team.name for team in leaderboard], self.sorted_names())
+
+    def test_reposition_matches_full_sort(self):
+        """
+        #name(Test repositioning a team gives the same order as re-sorting)
+        """
+        leaderboard = Leaderboard(ArrayR.from_list(self.teams))
+        results = [TeamGameResult.WIN, TeamGameResult.DRAW, TeamGameResult.LOSS]
+        for _ in range(200):
+            team = RandomGen.random_choice(self.teams)
+            old_points = team.points
+            team.add_result(RandomGen.random_choice(results))
+            leaderboard.reposition(team, old_points)
+            self.assertEqual([team.name for team in leaderboard], self.sorted_names())
+
+    def test_indexing(self):
+        """
+        #name(Test indexing and positions in the leaderboard)
+        """
+        leaderboard = Leaderboard(ArrayR.from_list(self.teams))
+        self.teams[3].add_result(TeamGameResult.WIN)
+        leaderboard.reposition(self.teams[3], 0)
+        self.assertIs(leaderboard[0], self.teams[3])
+        self.assertEqual(leaderboard.index(self.teams[3]), 0)
+        self.assertEqual(leaderboard[-1].name, self.sorted_names()[-1])
+        with self.assertRaises(IndexError):
+            leaderboard[len(self.teams)]
+
+    def test_season_leaderboard(self):
+        """
+        #name(Test the season leaderboard after simulating)
+        """
+        season = Season(ArrayR.from_list(self.teams))
+        season.simulate_season()
+        leaderboard = take_out_from_adt(season.leaderboard)
+        self.assertEqual([leaderboard[i].name for i in range(len(leaderboard))], self.sorted_names())
+
+
+class TestTeamOrdering(TestLeaderboardSetup):
+    def test_sort_keys_follow_points(self):
+        """
+        #name(Test a team's sort key follows its points, in forks and new seasons too)
+        """
+        sharks = self.teams[1]
+        sharks.add_result(TeamGameResult.WIN)
+        self.assertEqual(sharks.sort_key, (-3, "Sharks"))
+        branch = sharks.fork()
+        self.assertEqual(branch.sort_key, sharks.sort_key)
+        sharks.new_season()
+        self.assertEqual(sharks.sort_key, (0, "Sharks"))
+        self.assertEqual(branch.sort_key, (-3, "Sharks"))
+
+    def test_rich_comparisons(self):
+        """
+        #name(Test every comparison operator agrees with the standings order)
+        """
+        for _ in range(40):
+            RandomGen.random_choice(self.teams).add_result(
+                RandomGen.random_choice([TeamGameResult.WIN, TeamGameResult.DRAW]))
+        for a in self.teams:
+            for b in self.teams:
+                expected = (-a.points, a.name) < (-b.points, b.name)
+                self.assertEqual(a < b, expected)
+                self.assertEqual(b > a, expected)
+                self.assertEqual(a >= b, not expected)
+                self.assertEqual(b <= a, not expected)
+        self.assertEqual(self.teams[0].__lt__("Sharks"), NotImplemented)
+        self.assertNotEqual(self.teams[0], self.teams[0].fork())
+
+    def test_leaderboards_rank_names_apart(self):
+        """
+        #name(Test leaderboards over overlapping teams keep their own name ranks and leave the teams alone)
+        """
+        first = Leaderboard(ArrayR.from_list(self.teams[:4]))
+        second = Leaderboard(ArrayR.from_list(self.teams[2:6]))
+        self.assertFalse(hasattr(self.teams[2], "name_rank"))
+        for team in self.teams:
+            team.add_result(RandomGen.random_choice([TeamGameResult.WIN, TeamGameResult.DRAW]))
+        for board, teams in ((first, self.teams[:4]), (second, self.teams[2:6])):
+            for team in teams:
+                board.reposition(team, 0)
+            self.assertEqual(list(board), sorted(teams, key=lambda team: (-team.points, team.name)))
+
+    def test_new_team_joins(self):
+        """
+        #name(Test a team with a new name joins between the others and the teams can be ranked again)
+        """
+        leaderboard = Leaderboard(ArrayR.from_list(self.teams[:4]))
+        snapshot = leaderboard.copy()
+        newcomer = Team("Ravens", ArrayR(0), 5)
+        for team in (self.teams[0], self.teams[1], newcomer):
+            old_points = team.points
+            team.add_result(TeamGameResult.DRAW)
+            if team is not newcomer:
+                leaderboard.reposition(team, old_points)
+        leaderboard.add(newcomer)
+        expected = sorted(self.teams[:4] + [newcomer], key=lambda team: (-team.points, team.name))
+        self.assertEqual(list(leaderboard), expected)
+        self.assertEqual(leaderboard.index(newcomer), expected.index(newcomer))
+        self.assertEqual(list(Leaderboard(ArrayR.from_list(expected))), expected)
+        self.assertEqual(list(Leaderboard.from_ranked(ArrayR.from_list(expected))), expected)
+
+        leaderboard.remove(self.teams[0])
+        self.assertEqual(list(leaderboard), [team for team in expected if team is not self.teams[0]])
+        self.assertEqual(len(snapshot), 4)
+        self.assertNotIn(newcomer, list(snapshot))
+
+
+class TestAVLTree(TestCase):
+    def test_insert_remove_and_rank(self):
+        """
+        #name(Test the order statistic tree against a sorted list)
+        """
+        RandomGen.set_seed(7)
+        tree = AVLTree()
+        expected = []
+        for _ in range(500):
+            if expected and RandomGen.random_chance(0.4):
+                key = RandomGen.random_choice(expected)
+                expected.remove(key)
+                tree.remove(key)
+            else:
+                key = RandomGen.randint(0, 50)
+                expected.append(key)
+                expected.sort()
+                tree.insert(key, key)
+            self.assertEqual(len(tree), len(expected))
+        self.assertEqual(list(tree), expected)
+        for i in range(len(expected)):
+            self.assertEqual(tree[i], expected[i])
+        for key in range(0, 50, 5):
+            self.assertEqual(tree.rank(key), len([k for k in expected if k < key]))
+
+    def test_copy_is_a_snapshot(self):
+        """
+        #name(Test copies are not affected by later updates)
+        """
+        tree = AVLTree()
+        for key in range(10):
+            tree.insert(key, key)
+        snapshot = tree.copy()
+        tree.remove(3)
+        tree.insert(20, 20)
+        self.assertEqual(list(snapshot), list(range(10)))
+        self.assertNotIn(3, tree)
+
+    def test_range_and_reverse_iteration(self):
+        """
+        #name(Test iterating a key range and iterating backwards match a sorted list)
+        """
+        RandomGen.set_seed(9)
+        keys = [RandomGen.randint(0, 100) for _ in range(300)]
+        tree = AVLTree()
+        for key in keys:
+            tree.insert(key, key)
+        keys.sort()
+        self.assertEqual(list(reversed(tree)), keys[::-1])
+        for low, high in ((10, 20), (0, 100), (50, 50), (60, 40), (-5, 3), (99, 200)):
+            self.assertEqual(list(tree.between(low, high)), [key for key in keys if low <= key <= high])
+
+    def test_remove_missing(self):
+        """
+        #name(Test removing a missing key raises KeyError)
+        """
+        tree = AVLTree()
+        tree.insert(1, "a")
+        with self.assertRaises(KeyError):
+            tree.remove(2)
+        with self.assertRaises(KeyError):
+            tree.remove(1, "b")
+
+
+class TestLeaderboardApproach(TestCase):
+    def test_python_built_ins_not_used(self):
+        """
+        #name(Test built-in collections not used)
+        #hurdle
+        """
+        import leaderboard
+        modules = [leaderboard]
+
+        for f in modules:
+            f_source = inspect.getsource(f)
+            filename = f.__file__
+
+            tree = ast.parse(f_source)
+            visitor = CollectionsFinder(filename)
+            visitor.visit(tree)
+
+            for failure in visitor.failures:
+                self.fail(failure[3])
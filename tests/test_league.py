@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition, ScheduleMethod
+import league
+from league import League
+from leaderboard import Leaderboard
+from random_gen import RandomGen
+from season import Season
+from team import Team
+import round_robin
+from tests.helper import make_teams
+
+
+def division(prefix: str, count: int) -> ArrayR[Team]:
+    """ Teams named "<prefix> A" to "<prefix> <count-th letter>", in reverse name order. """
+    return make_teams(tuple(f"{prefix} {chr(ord('A') + count - 1 - i)}" for i in range(count)))
+
+
+def make_league(seed: int = 3) -> League:
+    return League((("Top", division("Top", 6)), ("Middle", division("Middle", 6)), ("Bottom", division("Bottom", 5))),
+                  promoted=2, seed=seed)
+
+
+def summary(results) -> list:
+    return [[[(team.name, team.points) for team in table] for table in standings] for standings in results]
+
+
+class TestLeague(TestCase):
+    def test_template_matches_circle_schedule(self):
+        """
+        #name(Test a season built from a template has the circle method schedule)
+        """
+        teams = division("T", 7)
+        season = Season.from_template(teams, round_robin.schedule_template(7, 5))
+        expected = Season(teams, ScheduleMethod.CIRCLE, 5)
+        self.assertEqual(
+            [[(game.home_team.name, game.away_team.name) for game in week] for week in season.schedule],
+            [[(game.home_team.name, game.away_team.name) for game in week] for week in expected.schedule],
+        )
+
+    def test_ranked_leaderboard(self):
+        """
+        #name(Test a leaderboard built from ranked teams matches a sorted one, and unranked teams are rejected)
+        """
+        teams = division("T", 6)
+        ordered = Leaderboard(teams)
+        ranked = ArrayR(len(teams))
+        for i, team in enumerate(ordered):
+            ranked[i] = team
+        self.assertEqual(list(Leaderboard.from_ranked(ranked)), list(ordered))
+        with self.assertRaises(ValueError):
+            Leaderboard.from_ranked(teams)
+
+    def test_promotion_and_relegation(self):
+        """
+        #name(Test teams move between divisions as the same objects, keeping their players)
+        """
+        league = make_league()
+        teams_before = {team.name: team for division in league.divisions for team in division.teams}
+        standings = league.play_season()
+        self.assertEqual(len(league.templates), 2)
+        top, middle, bottom = ([team.name for team in table] for table in standings)
+        self.assertEqual({team.name for team in league.divisions[0].teams}, set(top[:4] + middle[:2]))
+        self.assertEqual({team.name for team in league.divisions[1].teams}, set(top[4:] + middle[2:4] + bottom[:2]))
+        self.assertEqual({team.name for team in league.divisions[2].teams}, set(middle[4:] + bottom[2:]))
+        for division in league.divisions:
+            names = [team.name for team in division.teams]
+            self.assertEqual(names, sorted(names))
+            for team in division.teams:
+                self.assertIs(team, teams_before[team.name])
+                self.assertEqual(len(team), len(PlayerPosition))
+        self.assertGreater(sum(team.points for table in standings for team in table), 0)
+
+    def test_seasons_do_not_depend_on_workers(self):
+        """
+        #name(Test several seasons give the same standings with and without workers)
+        """
+        serial = make_league().simulate(3)
+        threaded = make_league().simulate(3, workers=2, processes=False)
+        self.assertEqual(len(serial), 3)
+        self.assertEqual(summary(serial), summary(threaded))
+        self.assertNotEqual(summary(serial), summary(make_league(seed=4).simulate(3)))
+
+    def test_season_streams_limited(self):
+        """
+        #name(Test seasons that would run out of random substreams are rejected)
+        """
+        big = League((("Open", division("Open", 129)),), promoted=0)
+        with self.assertRaises(ValueError):
+            big.play_season()
+        self.assertGreater(len(big.divisions[0].season.schedule), league.SEASON_STREAM_WEEKS)
+
+        old = make_league()
+        old.year = RandomGen.MOD // league.SEASON_STREAM_STRIDE // len(old.divisions)
+        with self.assertRaises(ValueError):
+            old.play_season()
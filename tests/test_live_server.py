@@ -0,0 +1,137 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import time
+from unittest import TestCase
+
+from enums import ScheduleMethod
+from live_server import LiveSeasonServer
+from random_gen import RandomStream
+from season import Season
+from tests.helper import numbered_teams
+
+
+def make_season(num_teams: int) -> Season:
+    return Season(numbered_teams(num_teams, 2, 3), ScheduleMethod.CIRCLE, schedule_seed=2, rng=RandomStream(17))
+
+
+async def read_messages(reader: asyncio.StreamReader) -> list:
+    """ A stand-in client: reads until the end message, noting each message's latency. """
+    messages = []
+    while True:
+        line = await reader.readline()
+        if not line:
+            return messages
+        message = json.loads(line)
+        message["latency"] = time.monotonic() - message["sent"]
+        messages.append(message)
+        if message["type"] == "end":
+            return messages
+
+
+class TestLiveServer(TestCase):
+    def test_subscribers_receive_every_game(self):
+        """
+        #name(Test every TCP subscriber receives each game and the standings of each week, in order)
+        """
+        reference = make_season(12)
+        reference.simulate_season()
+        season = make_season(12)
+
+        async def scenario():
+            server = LiveSeasonServer(season, tick=0.002)
+            host, port = await server.start_tcp()
+            clients = [await asyncio.open_connection(host, port) for _ in range(3)]
+            while len(server.subscribers) < 3:
+                await asyncio.sleep(0.001)
+            start = time.monotonic()
+            received = await asyncio.gather(server.run(), *(read_messages(reader) for reader, _ in clients))
+            elapsed = time.monotonic() - start
+            for _, writer in clients:
+                writer.close()
+            await server.close()
+            return received[1:], elapsed
+
+        received, elapsed = asyncio.run(scenario())
+        weeks = len(reference.schedule)
+        games = sum(len(week.games) for week in reference.schedule)
+        for messages in received:
+            self.assertEqual(len(messages), games + weeks + 1)
+            game_messages = [message for message in messages if message["type"] == "game"]
+            self.assertEqual(len(game_messages), games)
+            self.assertEqual(sorted(set(message["week"] for message in game_messages)), list(range(1, weeks + 1)))
+            final = [message for message in messages if message["type"] == "standings"][-1]
+            self.assertEqual([tuple(row) for row in final["table"]],
+                             [(team.name, team.points) for team in reference.leaderboard])
+            self.assertEqual(messages[-1]["type"], "end")
+            self.assertLess(max(message["latency"] for message in messages), 0.5)
+        self.assertLess(elapsed, 5)
+
+    def test_slow_subscriber_does_not_stall_the_season(self):
+        """
+        #name(Test a client that never reads only loses its own oldest messages)
+        """
+        season = make_season(60)
+        weeks = len(season.schedule)
+
+        async def scenario(path: str):
+            server = LiveSeasonServer(season, tick=0.001, queue_size=64, close_timeout=0.2)
+            await server.start_unix(path)
+            stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            stalled.connect(path)
+            while len(server.subscribers) < 1:
+                await asyncio.sleep(0.001)
+            reader, writer = await asyncio.open_unix_connection(path)
+            while len(server.subscribers) < 2:
+                await asyncio.sleep(0.001)
+            slow, fast = tuple(server.subscribers)
+            _, messages = await asyncio.wait_for(asyncio.gather(server.run(), read_messages(reader)), 30)
+            stalled.close()
+            writer.close()
+            await server.close()
+            return server, slow, fast, messages
+
+        with tempfile.TemporaryDirectory() as directory:
+            server, slow, fast, messages = asyncio.run(scenario(os.path.join(directory, "live.sock")))
+        self.assertEqual(server.weeks_played, weeks)
+        self.assertEqual(fast.dropped, 0)
+        self.assertEqual(messages[-1]["type"], "end")
+        self.assertEqual(len(messages), fast.sent)
+        self.assertGreater(slow.dropped, 0)
+        self.assertLess(slow.sent, fast.sent)
+
+    def test_late_subscriber_gets_the_end(self):
+        """
+        #name(Test a client that connects after the season ended gets the end message and is disconnected)
+        """
+        season = make_season(4)
+
+        async def scenario():
+            server = LiveSeasonServer(season, tick=0)
+            host, port = await server.start_tcp()
+            await server.run()
+            reader, writer = await asyncio.open_connection(host, port)
+            messages = await asyncio.wait_for(read_messages(reader), 5)
+            closed = await asyncio.wait_for(reader.read(), 5)
+            while len(server.subscribers) > 0:
+                await asyncio.sleep(0.001)
+            writer.close()
+            await server.close()
+            return messages, closed
+
+        messages, closed = asyncio.run(scenario())
+        self.assertEqual([message["type"] for message in messages], ["end"])
+        self.assertEqual(closed, b"")
+
+    def test_invalid_settings(self):
+        """
+        #name(Test a negative tick or an empty queue is rejected)
+        """
+        season = make_season(4)
+        with self.assertRaises(ValueError):
+            LiveSeasonServer(season, tick=-1)
+        with self.assertRaises(ValueError):
+            LiveSeasonServer(season, queue_size=0)
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from match_log import MatchLogReader, MatchLogWriter
+from random_gen import RandomStream
+from season import Season
+from tests.helper import TEAM_NAMES, make_teams, take_out_from_adt
+
+
+def summary(teams) -> list:
+    rows = []
+    for team in teams:
+        history = take_out_from_adt(team.get_history()) if team.get_history() is not None else []
+        goals = sorted((player.name, player.goals) for player in team.get_players())
+        rows.append((team.name, team.points, [result.value for result in history], goals))
+    return sorted(rows)
+
+
+class TestMatchLog(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "season.log")
+
+    def test_replay_matches_simulation(self):
+        """
+        #name(Test replaying a logged season rebuilds points, histories and goals)
+        """
+        season = Season(make_teams(TEAM_NAMES, 2, 4), rng=RandomStream(5))
+        with MatchLogWriter(self.path, season.teams) as log:
+            season.simulate_season(event_sink=log)
+        self.assertIsNone(season.event_sink)
+
+        fresh = make_teams(TEAM_NAMES, 2, 4)
+        with MatchLogReader(self.path) as log:
+            games = sum(len(week.games) for week in season.schedule)
+            self.assertEqual(len(log), games)
+            self.assertEqual(log[0][0], season.schedule[0].week)
+            points = log.team_points()
+            self.assertEqual([points[i] for i in range(len(points))], [team.points for team in season.teams])
+            log.replay(fresh)
+        self.assertEqual(summary(fresh), summary(season.teams))
+
+    def test_append_across_runs(self):
+        """
+        #name(Test a log can be appended to week by week and by a parallel run)
+        """
+        season = Season(make_teams(TEAM_NAMES, 2, 4), rng=RandomStream(9))
+        with MatchLogWriter(self.path, season.teams) as log:
+            season.event_sink = log
+            season.simulate_week()
+            season.event_sink = None
+        with MatchLogWriter(self.path, season.teams) as log:
+            season.event_sink = log
+            season.simulate_season_parallel(3)
+            season.event_sink = None
+
+        fresh = make_teams(TEAM_NAMES, 2, 4)
+        with MatchLogReader(self.path) as log:
+            log.replay(fresh)
+            self.assertEqual([game[0] for game in log], sorted(game[0] for game in log))
+        self.assertEqual(summary(fresh), summary(season.teams))
+
+    def test_forked_season_logged(self):
+        """
+        #name(Test the games of a forked season are logged against the copied players)
+        """
+        season = Season(make_teams(TEAM_NAMES, 2, 4), rng=RandomStream(11))
+        season.simulate_week()
+        before = [team.points for team in season.teams]
+        branch = season.fork()
+        with MatchLogWriter(self.path, season.teams) as log:
+            branch.simulate_season(event_sink=log)
+
+        with MatchLogReader(self.path) as log:
+            self.assertEqual(len(log), sum(len(week.games) for week in season.schedule) - len(season.schedule[0].games))
+            points = log.team_points()
+            after = [branch.resolve(team).points for team in season.teams]
+            self.assertEqual([before[i] + points[i] for i in range(len(points))], after)
+            for game in log:
+                self.assertEqual(len(game[5]), game[3] + game[4])
+
+    def test_other_teams_rejected(self):
+        """
+        #name(Test appending to a log started for other teams, or reading a non-log, raises ValueError)
+        """
+        with MatchLogWriter(self.path, make_teams(TEAM_NAMES, 2, 4)):
+            pass
+        with self.assertRaises(ValueError):
+            MatchLogWriter(self.path, make_teams(("Tornadoes", "Sharks"), 2, 4))
+        with open(self.path, "wb") as file:
+            file.write(b"not a log")
+        with self.assertRaises(ValueError):
+            MatchLogReader(self.path)
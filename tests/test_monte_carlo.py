@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from enums import ScheduleMethod
+from monte_carlo import MonteCarloSimulator, _build_teams, roster_from_teams
+from random_gen import RandomGen
+from season import Season
+from tests.helper import TEAM_NAMES, make_teams
+
+
+class TestMonteCarloSetup(TestCase):
+    def setUp(self) -> None:
+        self.team_names = TEAM_NAMES[:5]
+        self.teams = make_teams(self.team_names, players_per_position=2)
+
+
+class TestMonteCarlo(TestMonteCarloSetup):
+    def test_histograms_add_up(self):
+        """
+        #name(Test every replication places every team once)
+        """
+        result = MonteCarloSimulator(self.teams).run(12, master_seed=5)
+        self.assertEqual(result.replications, 12)
+        for name in self.team_names:
+            self.assertEqual(sum(result.histogram(name).to_list()), 12)
+        self.assertAlmostEqual(sum(result.title_probability(name) for name in self.team_names), 1.0)
+        self.assertAlmostEqual(sum(result.relegation_probability(name, 2) for name in self.team_names), 2.0)
+
+    def test_independent_of_worker_count(self):
+        """
+        #name(Test results do not depend on the number of workers)
+        """
+        single = MonteCarloSimulator(self.teams, workers=1).run(10, master_seed=77)
+        pooled = MonteCarloSimulator(self.teams, workers=3).run(10, master_seed=77)
+        self.assertEqual(single.counts.to_list(), pooled.counts.to_list())
+
+    def test_uneven_blocks(self):
+        """
+        #name(Test results do not depend on the number of workers when they do not divide the replications)
+        """
+        single = MonteCarloSimulator(self.teams, workers=1).run(5, master_seed=31)
+        for workers in (3, 4):
+            pooled = MonteCarloSimulator(self.teams, workers=workers).run(5, master_seed=31)
+            self.assertEqual(pooled.replications, 5)
+            self.assertEqual(single.counts.to_list(), pooled.counts.to_list())
+
+    def test_replication_matches_season(self):
+        """
+        #name(Test a replication plays the same season as the teams given, stats and scorer stat included)
+        """
+        for i, team in enumerate(self.teams):
+            team.set_scorer_stat("Shots")
+            for j, player in enumerate(team.get_players()):
+                player["Shots"] = (i + j) % 7
+        rebuilt = _build_teams(roster_from_teams(self.teams))
+        for team, copy in zip(self.teams, rebuilt):
+            self.assertEqual(copy.scorer_stat, "Shots")
+            self.assertEqual([(p.name, p.born_year, p["Shots"]) for p in team.get_players()],
+                             [(p.name, p.born_year, p["Shots"]) for p in copy.get_players()])
+
+        result = MonteCarloSimulator(self.teams).run(1, master_seed=9)
+        season = Season(self.teams, ScheduleMethod.GREEDY, rng=RandomGen.substream(9, 0))
+        season.simulate_season()
+        for position, team in enumerate(season.leaderboard):
+            self.assertEqual(result.histogram(team.name)[position], 1)
+
+    def test_replications_limited_by_substreams(self):
+        """
+        #name(Test asking for more replications than there are substreams is rejected)
+        """
+        with self.assertRaises(ValueError):
+            MonteCarloSimulator(self.teams).run(RandomGen.MOD // RandomGen.SUBSTREAM_STRIDE + 1, master_seed=1)
+
+    def test_random_state_restored(self):
+        """
+        #name(Test an in-process run leaves the RandomGen sequence untouched)
+        """
+        RandomGen.set_seed(123)
+        MonteCarloSimulator(self.teams).run(2, master_seed=1)
+        self.assertEqual(RandomGen.seed, 123)
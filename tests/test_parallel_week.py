@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from enums import ScheduleMethod
+from game_simulator import GameSimulator
+import parallel_week
+from random_gen import RandomStream
+from season import Season
+from tests.helper import numbered_teams
+
+
+def standings(season: Season) -> list:
+    rows = []
+    for team in season.leaderboard:
+        rows.append((team.name, team.points, sorted((player.name, player.goals) for player in team.get_players())))
+    return rows
+
+
+class TestParallelWeek(TestCase):
+    def test_independent_of_workers(self):
+        """
+        #name(Test the standings do not depend on the number or kind of workers)
+        """
+        results = []
+        for workers, processes in ((1, False), (3, False), (2, True)):
+            season = Season(numbered_teams(10, 2), ScheduleMethod.CIRCLE)
+            season.simulate_season_parallel(2024, workers, processes)
+            results.append(standings(season))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+    def test_games_use_their_substreams(self):
+        """
+        #name(Test each game draws exactly like simulate() on its own substream)
+        """
+        season = Season(numbered_teams(6, 2), ScheduleMethod.CIRCLE)
+        week = season.schedule[0]
+        expected = []
+        for index, game in enumerate(week):
+            outcome = GameSimulator.simulate(game.home_team, game.away_team,
+                                             RandomStream(parallel_week.game_seed(7, 0, index)))
+            expected.append((outcome.home_goals, outcome.away_goals, list(outcome.goal_scorers)))
+
+        tasks = tuple(
+            (tuple(game.home_team.scorer_sampler().weights), tuple(game.away_team.scorer_sampler().weights),
+             parallel_week.game_seed(7, 0, index))
+            for index, game in enumerate(week)
+        )
+        actual = []
+        for game, (home_goals, away_goals, home, away) in zip(week, parallel_week.run_week(tasks)):
+            names = [game.home_team.scorer_sampler().values[i].name for i in home]
+            names += [game.away_team.scorer_sampler().values[i].name for i in away]
+            actual.append((home_goals, away_goals, names))
+        self.assertEqual(actual, expected)
+
+    def test_delayed_week_keeps_its_streams(self):
+        """
+        #name(Test a delayed week plays out the same wherever it is moved)
+        """
+        results = []
+        for delay in (False, True):
+            season = Season(numbered_teams(6, 2), ScheduleMethod.CIRCLE)
+            if delay:
+                season.delay_week_of_games(1)
+            season.simulate_season_parallel(11)
+            results.append(standings(season))
+        self.assertEqual(results[0], results[1])
+
+    def test_game_substreams_limited(self):
+        """
+        #name(Test a week rejects game substreams past its share of the sequence)
+        """
+        last = parallel_week.WEEK_STREAM_GAMES - 1
+        self.assertNotEqual(parallel_week.game_seed(7, 0, last), parallel_week.game_seed(7, 1, 0))
+        for index in (-1, parallel_week.WEEK_STREAM_GAMES):
+            with self.assertRaises(ValueError):
+                parallel_week.game_seed(7, 0, index)
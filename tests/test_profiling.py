@@ -0,0 +1,55 @@
+import csv
+import io
+from unittest import TestCase
+
+from profiling import SeasonProfiler
+from random_gen import RandomStream
+from season import Season
+from tests.helper import make_teams, take_out_from_adt
+
+
+class TestSeasonProfiler(TestCase):
+    def test_profiling_does_not_change_results(self):
+        """
+        #name(Test a profiled season finishes like an unprofiled one)
+        """
+        plain = Season(make_teams(), rng=RandomStream(4))
+        plain.simulate_season()
+        profiled = Season(make_teams(), rng=RandomStream(4))
+        profiled.profiler = SeasonProfiler()
+        profiled.simulate_season()
+        self.assertEqual(
+            [(team.name, team.points) for team in profiled.leaderboard],
+            [(team.name, team.points) for team in plain.leaderboard],
+        )
+
+    def test_counts_per_week_and_phase(self):
+        """
+        #name(Test calls are counted per week and phase)
+        """
+        season = Season(make_teams(), rng=RandomStream(9))
+        season.profiler = SeasonProfiler()
+        season.simulate_season()
+        self.assertEqual(take_out_from_adt(season.profiler.weeks).to_list(), [week.week for week in season.schedule])
+        first = season.schedule[0]
+        self.assertEqual(season.profiler.week_totals(first.week, "record")[0], 2 * len(first.games))
+        games = sum(len(week.games) for week in season.schedule)
+        totals = season.profiler.totals()
+        self.assertEqual(sorted(totals.keys().to_list()), sorted(SeasonProfiler.PHASES))
+        self.assertEqual(totals["simulate"][0], games)
+        self.assertEqual(totals["record"][0], 2 * games)
+        self.assertGreater(totals["simulate"][1], 0)
+        with self.assertRaises(ValueError):
+            season.profiler.add(1, "unknown", 10)
+
+    def test_csv_export(self):
+        """
+        #name(Test the CSV export has a row per week and phase)
+        """
+        season = Season(make_teams(), rng=RandomStream(1))
+        season.profiler = SeasonProfiler()
+        season.simulate_week()
+        season.simulate_week()
+        rows = list(csv.reader(io.StringIO(season.profiler.to_csv())))
+        self.assertEqual(rows[0], ["week", "phase", "calls", "seconds"])
+        self.assertEqual(len(rows), 1 + 2 * len(SeasonProfiler.PHASES))
@@ -0,0 +1,133 @@
+from unittest import TestCase
+
+from array import array
+
+from random_gen import RandomGen, RandomStream
+
+
+class TestJumpAhead(TestCase):
+    def setUp(self) -> None:
+        RandomGen.set_seed(2024)
+        self.draws = [RandomGen.random() for _ in range(500)]
+
+    def test_skip_matches_sequential_draws(self):
+        """
+        #name(Test skipping ahead lands on the same draw as stepping)
+        """
+        for steps in (0, 1, 7, 128, 499):
+            RandomGen.set_seed(2024)
+            RandomGen.skip(steps)
+            self.assertEqual(RandomGen.random(), self.draws[steps])
+
+    def test_jump_composes(self):
+        """
+        #name(Test two jumps equal one jump of the combined length)
+        """
+        seed = RandomGen.jump(RandomGen.jump(99, 1000), 2345)
+        self.assertEqual(seed, RandomGen.jump(99, 3345))
+        with self.assertRaises(ValueError):
+            RandomGen.jump(99, -1)
+
+    def test_substreams_are_slices_of_the_master_sequence(self):
+        """
+        #name(Test substreams start at fixed offsets of the master sequence)
+        """
+        for index in range(5):
+            stream = RandomGen.substream(2024, index, stride=100)
+            self.assertEqual([stream.random() for _ in range(100)], self.draws[index * 100:(index + 1) * 100])
+
+    def test_substreams_cannot_wrap_around(self):
+        """
+        #name(Test substreams past the end of the LCG period are refused rather than repeating earlier ones)
+        """
+        last = RandomGen.MOD // RandomGen.SUBSTREAM_STRIDE - 1
+        self.assertNotEqual(RandomGen.substream_seed(7, last), RandomGen.substream_seed(7, 0))
+        for index, stride in ((last + 1, None), (-1, None), (256, 2 ** 40), (0, 0)):
+            with self.assertRaises(ValueError):
+                RandomGen.substream_seed(7, index, stride)
+
+
+class TestRandomStream(TestCase):
+    def test_same_api_and_sequence(self):
+        """
+        #name(Test a stream reproduces the shared sequence for the same seed)
+        """
+        RandomGen.set_seed(31)
+        expected = [RandomGen.randint(1, 6), RandomGen.random_choice("abcdef"), RandomGen.random_chance(0.5)]
+        shuffled = list(range(10))
+        RandomGen.random_shuffle(shuffled)
+
+        stream = RandomStream(31)
+        actual = [stream.randint(1, 6), stream.random_choice("abcdef"), stream.random_chance(0.5)]
+        stream_shuffled = list(range(10))
+        stream.random_shuffle(stream_shuffled)
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(stream_shuffled, shuffled)
+
+    def test_streams_are_independent(self):
+        """
+        #name(Test streams do not disturb each other or RandomGen)
+        """
+        RandomGen.set_seed(5)
+        first = RandomStream(10)
+        second = RandomStream(10)
+        first.random()
+        first.random()
+        self.assertEqual(second.random(), RandomStream(10).random())
+        self.assertEqual(RandomGen.seed, 5)
+
+
+class TestBatchDraws(TestCase):
+    def test_random_batch_matches_scalar(self):
+        """
+        #name(Test batch draws equal scalar draws and leave the same seed)
+        """
+        RandomGen.set_seed(77)
+        expected = [RandomGen.random() for _ in range(50)]
+        seed_after = RandomGen.seed
+
+        RandomGen.set_seed(77)
+        out = array('L', [0]) * 64
+        RandomGen.random_batch(out, 50)
+        self.assertEqual(out[:50].tolist(), expected)
+        self.assertEqual(out[50:].tolist(), [0] * 14)
+        self.assertEqual(RandomGen.seed, seed_after)
+
+    def test_randint_and_choice_batches(self):
+        """
+        #name(Test batched randint and random_choice equal their scalar versions)
+        """
+        stream = RandomStream(3)
+        expected_ints = [stream.randint(-5, 5) for _ in range(40)]
+        expected_choices = [stream.random_choice("xyz") for _ in range(40)]
+
+        stream = RandomStream(3)
+        ints = array('l', [0]) * 40
+        stream.randint_batch(-5, 5, memoryview(ints))
+        choices = [None] * 40
+        stream.random_choice_batch("xyz", choices)
+        self.assertEqual(ints.tolist(), expected_ints)
+        self.assertEqual(choices, expected_choices)
+        self.assertEqual(stream.seed, RandomGen.jump(3, 80))
+
+    def test_empty_batches_rejected(self):
+        """
+        #name(Test batches over an empty range or collection raise instead of returning raw draws)
+        """
+        out = array('l', [0]) * 4
+        for generator in (RandomGen, RandomStream(3)):
+            seed = generator.seed
+            with self.assertRaises(ValueError):
+                generator.randint_batch(5, 4, out)
+            with self.assertRaises(ValueError):
+                generator.random_choice_batch("", out)
+            self.assertEqual(generator.seed, seed)
+        self.assertEqual(out.tolist(), [0] * 4)
+
+    def test_buffer_too_small(self):
+        """
+        #name(Test asking for more draws than the buffer holds)
+        """
+        with self.assertRaises(IndexError):
+            RandomStream(1).random_batch(array('L', [0]) * 3, 4)
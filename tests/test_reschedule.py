@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from data_structures.referential_array import ArrayR
+from data_structures.sequence_tree import SequenceTree
+from enums import ScheduleMethod
+from random_gen import RandomGen
+from season import Season
+from tests.helper import numbered_teams, take_out_from_adt
+
+
+class TestReschedule(TestCase):
+    def setUp(self) -> None:
+        RandomGen.set_seed(5)
+        self.teams = numbered_teams(10, history_length=3)
+
+    def season(self, method: ScheduleMethod = ScheduleMethod.CIRCLE) -> Season:
+        return Season(self.teams, method, schedule_seed=4)
+
+    @staticmethod
+    def weeks(season: Season) -> list:
+        return [week.week for week in season.schedule]
+
+    def test_sequence_tree_matches_list(self):
+        """
+        #name(Test a sequence tree keeps the same order as a list under moves, inserts and deletes)
+        """
+        rng = RandomGen.substream(3, 0)
+        expected = list(range(50))
+        tree = SequenceTree.from_array(ArrayR.from_list(expected))
+        snapshot = tree.copy()
+        for _ in range(300):
+            source, target = rng.randint(0, 49), rng.randint(0, 49)
+            tree.move(source, target)
+            expected.insert(target, expected.pop(source))
+            position = rng.randint(0, 50)
+            tree.insert(position, -position)
+            expected.insert(position, -position)
+            self.assertEqual(tree.delete_at_index(position), expected.pop(position))
+        self.assertEqual(list(tree), expected)
+        self.assertEqual([tree[i] for i in range(-len(tree), 0)], expected)
+        self.assertEqual(list(snapshot), list(range(50)))
+        with self.assertRaises(IndexError):
+            tree[50]
+
+    def test_delays_match_list_moves(self):
+        """
+        #name(Test delaying weeks moves them like deleting and inserting in a list)
+        """
+        season = self.season()
+        expected = self.weeks(season)
+        for orig_week, new_week in ((1, 5), (18, 1), (7, None), (3, 3), (10, 18)):
+            season.delay_week_of_games(orig_week, new_week)
+            week = expected.pop(orig_week - 1)
+            expected.insert(len(expected) if new_week is None else new_week - 1, week)
+            self.assertEqual(self.weeks(season), expected)
+        self.assertEqual(take_out_from_adt(season.schedule).to_list()[0].week, expected[0])
+        with self.assertRaises(IndexError):
+            season.delay_week_of_games(19)
+        with self.assertRaises(IndexError):
+            season.delay_week_of_games(1, 0)
+        self.assertEqual(self.weeks(season), expected)
+
+    def test_reschedule_places_moved_weeks(self):
+        """
+        #name(Test reschedule puts moved weeks at their targets and keeps the rest in order)
+        """
+        for method in (ScheduleMethod.CIRCLE, ScheduleMethod.LAZY):
+            season = self.season(method)
+            branch = season.fork()
+            season.reschedule({1: 18, 18: 1, 5: 2})
+            expected = [18, 5, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 1]
+            self.assertEqual(self.weeks(season), expected)
+            self.assertEqual(self.weeks(branch), list(range(1, 19)))
+
+            single = self.season(method)
+            single.reschedule([(3, 9)])
+            delayed = self.season(method)
+            delayed.delay_week_of_games(3, 9)
+            self.assertEqual(self.weeks(single), self.weeks(delayed))
+
+    def test_reschedule_rejects_conflicts(self):
+        """
+        #name(Test reschedule rejects weeks out of range and clashing moves without changing the schedule)
+        """
+        season = self.season()
+        with self.assertRaises(ValueError):
+            season.reschedule({1: 4, 2: 4})
+        with self.assertRaises(ValueError):
+            season.reschedule([(1, 4), (1, 5)])
+        with self.assertRaises(IndexError):
+            season.reschedule({19: 1})
+        self.assertEqual(self.weeks(season), list(range(1, 19)))
+        season.simulate_season()
+        self.assertEqual(season.current_week, 18)
+
+    def test_schedule_view_is_read_only(self):
+        """
+        #name(Test weeks cannot be replaced through the schedule view)
+        """
+        season = self.season()
+        schedule = season.schedule
+        with self.assertRaises(TypeError):
+            schedule[0] = schedule[1]
+        self.assertEqual(self.weeks(season), list(range(1, 19)))
+        season.delay_week_of_games(1, 2)
+        self.assertIsNot(season.schedule, schedule)
+        self.assertEqual(self.weeks(season)[:2], [2, 1])
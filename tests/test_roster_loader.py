@@ -0,0 +1,117 @@
+import gc
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from enums import PlayerPosition, ScheduleMethod
+from roster_loader import load_league, read_roster_chunks
+from season import Season
+
+
+class TestRosterLoader(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return path
+
+    @staticmethod
+    def roster(team) -> list:
+        return [
+            (player.name, player.position, player.get_age(), sorted((stat, player[stat]) for stat in player.stats.keys()))
+            for player in team.get_players()
+        ]
+
+    def test_csv(self):
+        """
+        #name(Test a CSV roster builds teams with players grouped by position and their stats)
+        """
+        path = self.write("league.csv", (
+            "team,name,position,age,Tackles,Assists\n"
+            "Sharks,Ann,Striker,24,3,\n"
+            "Sharks,Bo,goalkeeper,30,,1\n"
+            "Sharks,Cy,MIDFIELDER,21,0,2\n"
+            "Wolves,Di,Defender,27,5,5\n"
+        ))
+        teams = load_league(path, 4)
+        self.assertEqual([team.name for team in teams], ["Sharks", "Wolves"])
+        sharks = teams[0]
+        self.assertEqual(len(sharks), 3)
+        self.assertEqual(sharks.history_length, 4)
+        self.assertEqual([player.name for player in sharks.get_players()], ["Bo", "Cy", "Ann"])
+        self.assertEqual(self.roster(teams[0])[2], ("Ann", PlayerPosition.STRIKER, 24, [("Tackles", 3)]))
+        self.assertEqual(self.roster(teams[1]), [("Di", PlayerPosition.DEFENDER, 27, [("Assists", 5), ("Tackles", 5)])])
+
+    def test_json_lines_and_chunks(self):
+        """
+        #name(Test JSON Lines and CSV give the same league for any chunk size, with split teams merged)
+        """
+        positions = list(PlayerPosition)
+        records = [
+            {"team": f"Team {i % 7}", "name": f"Player {i}", "position": positions[i % 4].name,
+             "age": 18 + i % 15, "stats": {"Tackles": i % 5}}
+            for i in range(300)
+        ]
+        json_path = self.write("league.jsonl", "".join(json.dumps(record) + "\n" for record in records))
+        csv_path = self.write("league.csv", "team,name,position,age,Tackles\n" + "".join(
+            f"{r['team']},{r['name']},{r['position']},{r['age']},{r['stats']['Tackles']}\n" for r in records
+        ))
+        expected = [(team.name, self.roster(team)) for team in load_league(csv_path, 5)]
+        self.assertEqual(len(expected), 7)
+        self.assertEqual(sum(len(roster) for _, roster in expected), 300)
+        for chunk_size in (1, 16, 4096):
+            teams = load_league(json_path, 5, chunk_size)
+            self.assertEqual([(team.name, self.roster(team)) for team in teams], expected)
+        self.assertEqual([count for _, count in read_roster_chunks(json_path, 128)], [128, 128, 44])
+
+    def test_gc_pause_is_opt_in(self):
+        """
+        #name(Test the garbage collector is only paused when asked, and restored after)
+        """
+        path = self.write("gc.csv", "team,name,position,age\nSharks,Ann,Striker,24\n")
+        enabled = gc.isenabled()
+        try:
+            for pause_gc in (False, True):
+                gc.enable()
+                teams = load_league(path, 3, pause_gc=pause_gc)
+                self.assertTrue(gc.isenabled())
+                self.assertEqual(len(teams), 1)
+            gc.disable()
+            load_league(path, 3, pause_gc=True)
+            self.assertFalse(gc.isenabled())
+        finally:
+            if enabled:
+                gc.enable()
+
+    def test_loaded_league_plays(self):
+        """
+        #name(Test a loaded league can be simulated)
+        """
+        rows = "".join(
+            f"Team {t},P{t}-{j},{position.value},25\n" for t in range(6) for j, position in enumerate(PlayerPosition)
+        )
+        season = Season(load_league(self.write("league.csv", "team,name,position,age\n" + rows), 3), ScheduleMethod.CIRCLE)
+        season.simulate_season()
+        self.assertEqual(season.current_week, len(season.schedule))
+        self.assertGreater(sum(team.points for team in season.teams), 0)
+
+    def test_bad_rows(self):
+        """
+        #name(Test malformed rosters raise ValueError naming the line)
+        """
+        with self.assertRaisesRegex(ValueError, "Line 3"):
+            load_league(self.write("a.csv", "team,name,position,age\nA,x,Striker,20\nA,y,Winger,20\n"), 3)
+        with self.assertRaisesRegex(ValueError, "Line 2"):
+            load_league(self.write("b.csv", "team,name,position,age\nA,x,Striker,old\n"), 3)
+        with self.assertRaisesRegex(ValueError, "age"):
+            load_league(self.write("c.csv", "team,name,position\nA,x,Striker\n"), 3)
+        with self.assertRaisesRegex(ValueError, "Line 1"):
+            load_league(self.write("d.jsonl", '{"team": "A", "name": "x"}\n'), 3)
+        with self.assertRaises(ValueError):
+            load_league(self.write("e.xml", ""), 3)
@@ -0,0 +1,143 @@
+from types import GeneratorType
+from unittest import TestCase
+
+from enums import ScheduleMethod
+from random_gen import RandomStream
+import round_robin
+from season import LazySchedule, Season
+from tests.helper import numbered_teams
+
+
+class TestCircleRound(TestCase):
+    def test_every_pair_meets_once(self):
+        """
+        #name(Test each pair of teams meets exactly once per half)
+        """
+        for num_teams in range(2, 14):
+            pairs = set()
+            for round_index in range(round_robin.number_of_rounds(num_teams)):
+                used = set()
+                for home, away in round_robin.circle_round(num_teams, round_index):
+                    self.assertNotIn(home, used)
+                    self.assertNotIn(away, used)
+                    used.update((home, away))
+                    pairs.add(frozenset((home, away)))
+            self.assertEqual(len(pairs), num_teams * (num_teams - 1) // 2, f"{num_teams} teams")
+
+    def test_number_of_rounds(self):
+        """
+        #name(Test the number of rounds for even and odd leagues)
+        """
+        self.assertEqual(round_robin.number_of_rounds(8), 7)
+        self.assertEqual(round_robin.number_of_rounds(7), 7)
+        self.assertEqual(round_robin.number_of_rounds(1), 0)
+        with self.assertRaises(IndexError):
+            round_robin.circle_round(8, 7)
+
+    def test_team_order(self):
+        """
+        #name(Test the seeded team order is a repeatable permutation)
+        """
+        self.assertEqual(round_robin.team_order(5).to_list(), [0, 1, 2, 3, 4])
+        order = round_robin.team_order(20, 42).to_list()
+        self.assertEqual(sorted(order), list(range(20)))
+        self.assertEqual(order, round_robin.team_order(20, 42).to_list())
+
+
+class TestCircleSchedule(TestCase):
+    def check_schedule(self, num_teams: int) -> None:
+        teams = numbered_teams(num_teams)
+        season = Season(teams, ScheduleMethod.CIRCLE)
+        rounds = round_robin.number_of_rounds(num_teams)
+        self.assertEqual(len(season.schedule), 2 * rounds)
+
+        games = set()
+        for week in season.schedule:
+            playing = set()
+            for game in week:
+                self.assertNotIn(game.home_team.name, playing)
+                self.assertNotIn(game.away_team.name, playing)
+                playing.update((game.home_team.name, game.away_team.name))
+                games.add((game.home_team.name, game.away_team.name))
+        self.assertEqual(len(games), num_teams * (num_teams - 1))
+
+        for week in range(rounds):
+            first = season.schedule[week].games
+            second = season.schedule[week + rounds].games
+            for i in range(len(first)):
+                self.assertIs(first[i].home_team, second[i].away_team)
+                self.assertIs(first[i].away_team, second[i].home_team)
+
+    def test_even_league(self):
+        """
+        #name(Test a circle schedule for an even number of teams)
+        """
+        self.check_schedule(10)
+
+    def test_odd_league(self):
+        """
+        #name(Test a circle schedule for an odd number of teams)
+        """
+        self.check_schedule(9)
+
+    def test_seeded_schedule_is_repeatable(self):
+        """
+        #name(Test the same seed always gives the same schedule)
+        """
+        teams = numbered_teams(12)
+
+        def pairings(season):
+            return [(game.home_team.name, game.away_team.name) for week in season.schedule for game in week]
+
+        first = Season(teams, ScheduleMethod.CIRCLE, 99)
+        second = Season(teams, ScheduleMethod.CIRCLE, 99)
+        self.assertEqual(pairings(first), pairings(second))
+        self.assertNotEqual(pairings(first), pairings(Season(teams, ScheduleMethod.CIRCLE)))
+
+
+class TestLazySchedule(TestCase):
+    def setUp(self) -> None:
+        self.teams = numbered_teams(9)
+
+    @staticmethod
+    def pairings(schedule) -> list:
+        return [[(game.home_team.name, game.away_team.name) for game in week] for week in schedule]
+
+    def test_same_weeks_as_circle(self):
+        """
+        #name(Test a lazy schedule gives the same weeks as a circle schedule)
+        """
+        lazy = Season(self.teams, ScheduleMethod.LAZY, 5)
+        eager = Season(self.teams, ScheduleMethod.CIRCLE, 5)
+        self.assertIsInstance(lazy.schedule, LazySchedule)
+        self.assertIsInstance(iter(lazy.schedule), GeneratorType)
+        self.assertEqual(len(lazy.schedule), len(eager.schedule))
+        self.assertEqual(self.pairings(lazy.schedule), self.pairings(eager.schedule))
+        self.assertEqual(self.pairings([lazy.schedule[-1]]), self.pairings([eager.schedule[-1]]))
+        with self.assertRaises(IndexError):
+            lazy.schedule[len(lazy.schedule)]
+
+    def test_delays_match_eager_schedule(self):
+        """
+        #name(Test delaying weeks of a lazy schedule moves them like an eager one)
+        """
+        lazy = Season(self.teams, ScheduleMethod.LAZY, 5)
+        eager = Season(self.teams, ScheduleMethod.CIRCLE, 5)
+        for season in (lazy, eager):
+            season.delay_week_of_games(2, 6)
+            season.delay_week_of_games(1)
+            season.delay_week_of_games(10, 3)
+        self.assertEqual([week.week for week in lazy.schedule], [week.week for week in eager.schedule])
+        self.assertEqual(self.pairings(lazy.schedule), self.pairings(eager.schedule))
+
+    def test_simulate_matches_eager_season(self):
+        """
+        #name(Test simulating a lazy season gives the same standings as an eager one)
+        """
+        results = []
+        for method in (ScheduleMethod.LAZY, ScheduleMethod.CIRCLE):
+            teams = numbered_teams(9)
+            season = Season(teams, method, 5, rng=RandomStream(12))
+            season.simulate_season()
+            results.append([(team.name, team.points) for team in season.leaderboard])
+        self.assertEqual(results[0], results[1])
@@ -0,0 +1,99 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase
+
+from enums import PlayerPosition
+from random_gen import RandomStream
+from season import Season
+from season_export import BINARY, CSV, ColumnReader, ColumnWriter, GameExporter, export_players, export_standings
+from tests.helper import make_teams
+
+
+def read_binary(path: str) -> list:
+    rows = []
+    with ColumnReader(path) as reader:
+        for chunk in reader:
+            rows.extend(zip(*(chunk[i] for i in range(len(chunk)))))
+    return rows
+
+
+def read_csv(path: str) -> list:
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+class TestSeasonExport(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base = directory.name
+
+    def test_column_round_trip(self):
+        """
+        #name(Test rows survive the binary column format across chunks, and match the CSV)
+        """
+        path = os.path.join(self.base, "table")
+        rows = [(i, f"name {i} é", i * -1000, i / 4) for i in range(25)]
+        with ColumnWriter(path, (("id", "I"), ("name", "s"), ("delta", "q"), ("ratio", "d")), chunk_size=7) as table:
+            for row in rows:
+                table.write_row(*row)
+            self.assertEqual(table.rows, 25)
+        self.assertEqual(read_binary(path + ".cols"), rows)
+        csv_rows = read_csv(path + ".csv")
+        self.assertEqual(csv_rows[0], ["id", "name", "delta", "ratio"])
+        self.assertEqual(csv_rows[1:], [[str(value) for value in row] for row in rows])
+        with ColumnReader(path + ".cols") as reader:
+            self.assertEqual([len(chunk[reader.index("name")]) for chunk in reader], [7, 7, 7, 4])
+
+    def test_games_of_several_runs(self):
+        """
+        #name(Test a game exporter streams the games of several seasons with their run numbers)
+        """
+        path = os.path.join(self.base, "games")
+        seasons = [Season(make_teams(), rng=RandomStream(seed)) for seed in (1, 2)]
+        with GameExporter(path, chunk_size=4) as games:
+            for run, season in enumerate(seasons):
+                games.run = run
+                season.simulate_season(event_sink=games)
+        rows = read_binary(path + ".cols")
+        games_per_season = sum(len(week.games) for week in seasons[0].schedule)
+        self.assertEqual(len(rows), 2 * games_per_season)
+        self.assertEqual([row[0] for row in rows], [0] * games_per_season + [1] * games_per_season)
+        for run, season in enumerate(seasons):
+            points = {team.name: 0 for team in season.teams}
+            for _, _, home, away, home_goals, away_goals, scorers in rows[run * games_per_season:(run + 1) * games_per_season]:
+                self.assertEqual(len(scorers.split(";")) if scorers else 0, home_goals + away_goals)
+                points[home] += 3 if home_goals > away_goals else 1 if home_goals == away_goals else 0
+                points[away] += 3 if away_goals > home_goals else 1 if home_goals == away_goals else 0
+            self.assertEqual(points, {team.name: team.points for team in season.teams})
+        self.assertEqual(len(read_csv(path + ".csv")), len(rows) + 1)
+
+    def test_standings_and_players(self):
+        """
+        #name(Test standings and players with their goals and stats are exported)
+        """
+        season = Season(make_teams(), rng=RandomStream(3))
+        season.teams[0].get_players(PlayerPosition.STRIKER)[0]["Tackles"] = 4
+        season.simulate_season()
+        export_standings(season, os.path.join(self.base, "standings"), formats=(BINARY,))
+        export_players(season, os.path.join(self.base, "players"), formats=(CSV,))
+        self.assertFalse(os.path.exists(os.path.join(self.base, "standings.csv")))
+
+        standings = read_binary(os.path.join(self.base, "standings.cols"))
+        self.assertEqual(standings, [(place, team.name, team.points) for place, team in enumerate(season.leaderboard, 1)])
+        players = read_csv(os.path.join(self.base, "players.csv"))
+        self.assertEqual(players[0], ["team", "player", "position", "age", "goals", "Tackles"])
+        self.assertEqual(len(players), 1 + 6 * len(PlayerPosition))
+        self.assertEqual(sum(int(row[4]) for row in players[1:]), sum(p.goals for t in season.teams for p in t.get_players()))
+        self.assertEqual([row[5] for row in players[1:] if row[5] != "0"], ["4"])
+
+    def test_not_a_column_file(self):
+        """
+        #name(Test reading a file that is not a column file raises ValueError)
+        """
+        path = os.path.join(self.base, "bad.cols")
+        with open(path, "wb") as file:
+            file.write(b"nope")
+        with self.assertRaises(ValueError):
+            ColumnReader(path)
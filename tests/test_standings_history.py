@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from data_structures.referential_array import ArrayR
+from random_gen import RandomStream
+from season import Season
+from standings_history import StandingsHistory
+from tests.helper import TEAM_NAMES, make_teams
+
+
+class TestStandingsHistory(TestCase):
+    def setUp(self) -> None:
+        self.season = Season(make_teams(TEAM_NAMES + ("Bears",)), rng=RandomStream(6))
+        self.season.record_standings()
+
+    @staticmethod
+    def table(rows) -> list:
+        return [(team.name, points) for team, points in rows]
+
+    def test_every_week_can_be_rebuilt(self):
+        """
+        #name(Test the table after every week matches the live leaderboard at that time)
+        """
+        expected = [[(team.name, team.points) for team in self.season.leaderboard]]
+        while self.season.simulate_week():
+            expected.append([(team.name, team.points) for team in self.season.leaderboard])
+        self.assertGreater(len(expected), self.season.history.keyframe_interval)
+        for week in range(len(expected)):
+            self.assertEqual(self.table(self.season.standings_at(week)), expected[week], f"week {week}")
+        with self.assertRaises(IndexError):
+            self.season.standings_at(len(expected))
+
+    def test_only_changes_are_stored(self):
+        """
+        #name(Test unchanged weeks store no changes)
+        """
+        points = ArrayR.from_list([3, 1, 0])
+        order = ArrayR.from_list([0, 1, 2])
+        history = StandingsHistory(points, order, keyframe_interval=3)
+        for _ in range(5):
+            history.record(points, order)
+        history.record(ArrayR.from_list([3, 4, 0]), ArrayR.from_list([1, 0, 2]))
+        self.assertEqual(history.latest_week, 6)
+        self.assertEqual(list(history.at(5)[0]), [3, 1, 0])
+        self.assertEqual(list(history.at(6)[0]), [3, 4, 0])
+        self.assertEqual(list(history.at(6)[1]), [1, 0, 2])
+
+    def test_fork_shares_history(self):
+        """
+        #name(Test a branch keeps its parent's past weeks and records its own)
+        """
+        for _ in range(3):
+            self.season.simulate_week()
+        before = self.table(self.season.standings_at(2))
+        branch = self.season.fork(RandomStream(99))
+        branch.simulate_week()
+        self.assertEqual(self.table(branch.standings_at(2)), before)
+        self.assertEqual(branch.history.latest_week, 4)
+        self.assertEqual(self.season.history.latest_week, 3)
+        self.assertEqual(self.table(self.season.standings_at(3)), self.table(branch.standings_at(3)))
+        branch_week = self.table(branch.standings_at(4))
+        self.season.simulate_week()
+        self.assertEqual(self.table(self.season.standings_at(4)), [(team.name, team.points) for team in self.season.leaderboard])
+        self.assertEqual(self.table(branch.standings_at(4)), branch_week)
+
+    def test_recording_is_opt_in(self):
+        """
+        #name(Test seasons and their branches record no standings unless asked to)
+        """
+        season = Season(self.season.teams, rng=RandomStream(6))
+        season.simulate_week()
+        self.assertIsNone(season.history)
+        self.assertIsNone(season.fork().history)
+        with self.assertRaises(IndexError):
+            season.standings_at(0)
+        season.record_standings()
+        season.simulate_week()
+        self.assertEqual(len(season.history), 1)
+        self.assertEqual(self.table(season.standings_at(2)), [(team.name, team.points) for team in season.leaderboard])
+        with self.assertRaises(IndexError):
+            season.standings_at(0)
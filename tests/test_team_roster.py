@@ -0,0 +1,196 @@
+from unittest import TestCase
+
+from data_structures.linked_list import LinkedList
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from player import Player
+from random_gen import RandomGen
+from team import PositionSlots, Team
+from tests.helper import make_teams, take_out_from_adt
+
+
+class TestTeamRoster(TestCase):
+    def setUp(self) -> None:
+        self.team = make_teams(("Sharks",), players_per_position=3)[0]
+
+    def names(self, team: Team) -> list:
+        return [player.name for player in take_out_from_adt(team.get_players())]
+
+    def expected_names(self, team: Team) -> list:
+        return [player.name for position in PlayerPosition for player in team.get_players(position)]
+
+    def test_roster_view_is_cached(self):
+        """
+        #name(Test all players are returned in position order, by index, from one cached list)
+        """
+        roster = self.team.get_players()
+        self.assertIs(self.team.get_players(), roster)
+        self.assertEqual(self.names(self.team), self.expected_names(self.team))
+        self.assertEqual([roster[i].name for i in range(len(roster))], self.names(self.team))
+        sampler = self.team.scorer_sampler()
+        self.team.get_players()
+        self.assertIs(self.team.scorer_sampler(), sampler)
+
+    def test_roster_view_is_read_only(self):
+        """
+        #name(Test players cannot be replaced through the list of all players)
+        """
+        roster = self.team.get_players()
+        before = self.names(self.team)
+        with self.assertRaises(TypeError):
+            roster[0] = Player("Intruder", PlayerPosition.STRIKER, 30)
+        self.assertEqual(self.names(self.team), before)
+        self.assertEqual([player.name for player in roster], before)
+
+    def test_roster_changes_rebuild_the_view(self):
+        """
+        #name(Test adding and removing players rebuilds the list of all players)
+        """
+        roster = self.team.get_players()
+        newcomer = Player("Newcomer", PlayerPosition.STRIKER, 19)
+        self.team.add_player(newcomer)
+        self.assertIsNot(self.team.get_players(), roster)
+        self.assertEqual(len(self.team.get_players()), len(roster) + 1)
+        self.assertEqual(self.names(self.team), self.expected_names(self.team))
+
+        self.team.remove_player(roster[0])
+        self.assertEqual(len(self.team.get_players()), len(roster))
+        self.assertNotIn(roster[0].name, self.names(self.team))
+        self.assertEqual(self.names(self.team), self.expected_names(self.team))
+
+    def test_fork_keeps_its_own_view(self):
+        """
+        #name(Test a fork's copied player only shows up in the fork's list of players)
+        """
+        original = self.team.get_players()[2]
+        branch = self.team.fork()
+        copy = branch.own_player(original)
+        self.assertIsNot(copy, original)
+        self.assertIs(branch.get_players()[2], copy)
+        self.assertIs(self.team.get_players()[2], original)
+
+    def test_remove_and_find_by_name(self):
+        """
+        #name(Test players are found and removed by name, keeping the order of each position)
+        """
+        defenders = [player.name for player in self.team.get_players(PlayerPosition.DEFENDER)]
+        middle = self.team.find_player(defenders[1])
+        self.assertIs(middle, self.team.get_players(PlayerPosition.DEFENDER)[1])
+        self.assertIsNone(self.team.find_player("Nobody"))
+
+        self.team.remove_player(middle)
+        self.assertIsNone(self.team.find_player(middle.name))
+        self.assertEqual([player.name for player in self.team.get_players(PlayerPosition.DEFENDER)],
+                         [defenders[0], defenders[2]])
+        self.team.remove_player(middle)
+        self.assertEqual(len(self.team), 11)
+
+        self.team.add_player(middle)
+        self.assertIs(self.team.find_player(middle.name), middle)
+        self.assertEqual(self.team.get_players(PlayerPosition.DEFENDER)[-1], middle)
+        with self.assertRaises(ValueError):
+            self.team.add_player(Player(middle.name, PlayerPosition.STRIKER, 30))
+
+    def test_fork_removes_from_its_own_roster(self):
+        """
+        #name(Test removing a player from a fork leaves the original team's roster and index alone)
+        """
+        player = self.team.get_players(PlayerPosition.STRIKER)[0]
+        branch = self.team.fork()
+        branch.remove_player(player)
+        self.assertIsNone(branch.find_player(player.name))
+        self.assertIs(self.team.find_player(player.name), player)
+        self.assertEqual(len(branch), len(self.team) - 1)
+
+    def test_linked_list_nodes(self):
+        """
+        #name(Test list nodes can be deleted directly from the head, middle and rear)
+        """
+        items = LinkedList()
+        nodes = [items.append_node(i) for i in range(5)]
+        items.insert(2, 9)
+        self.assertEqual(items.delete_node(nodes[2]), 2)
+        self.assertEqual(items.delete_node(nodes[0]), 0)
+        self.assertEqual(items.delete_node(nodes[4]), 4)
+        self.assertEqual(take_out_from_adt(items).to_list(), [1, 9, 3])
+        items.append(7)
+        self.assertEqual([node.item for node in items.nodes()], [1, 9, 3, 7])
+        self.assertEqual(items.delete_at_index(1), 9)
+        self.assertEqual(items.delete_node(nodes[3]), 3)
+        self.assertEqual(take_out_from_adt(items).to_list(), [1, 7])
+
+    def test_position_slots_count_players(self):
+        """
+        #name(Test the position slots keep the number of players without walking the positions)
+        """
+        self.assertEqual([position.ordinal for position in PlayerPosition], list(range(len(PlayerPosition))))
+        slots = PositionSlots()
+        nodes = [slots.add(player) for player in take_out_from_adt(self.team.get_players())]
+        self.assertEqual(len(slots), 12)
+        slots.remove(nodes[0])
+        self.assertEqual(len(slots), 11)
+        self.assertEqual(len(slots[PlayerPosition.GOALKEEPER]), 2)
+        slots[PlayerPosition.STRIKER] = LinkedList()
+        self.assertEqual(len(slots), 8)
+
+        self.assertEqual(len(self.team), 12)
+        branch = self.team.fork()
+        branch.add_player(Player("Newcomer", PlayerPosition.GOALKEEPER, 18))
+        branch.remove_player(self.team.get_players()[5])
+        branch.remove_player(self.team.get_players()[6])
+        self.assertEqual((len(self.team), len(branch)), (12, 11))
+
+
+class TestTeamPosts(TestCase):
+    def setUp(self) -> None:
+        self.team = Team("Sharks", ArrayR(0), 5)
+        rng = RandomGen.substream(11, 0)
+        self.expected = {}
+        for _ in range(400):
+            year, month, day = rng.randint(2019, 2024), rng.randint(1, 12), rng.randint(1, 28)
+            date = f"{year}/{month:02}/{day:02}" if rng.random_chance(0.5) else f"{day:02}-{month:02}-{year}"
+            self.team.make_post(date, f"Post {len(self.expected)}")
+            self.expected[(year, month, day)] = (date, f"Post {len(self.expected)}")
+
+    def test_posts_between_dates(self):
+        """
+        #name(Test posts between two dates come back oldest first, whatever format the dates are in)
+        """
+        posts = take_out_from_adt(self.team.get_posts("2021/03/01", "31-12-2022")).to_list()
+        self.assertEqual(posts, [self.expected[day] for day in sorted(self.expected)
+                                 if (2021, 3, 1) <= day <= (2022, 12, 31)])
+        self.assertEqual(len(self.team.get_posts("2030/01/01", "2031/01/01")), 0)
+        date, content = posts[0]
+        self.assertEqual(self.team.post[date], content)
+
+    def test_latest_posts(self):
+        """
+        #name(Test the latest posts come back newest first, with one post per day)
+        """
+        latest = take_out_from_adt(self.team.get_latest_posts(10)).to_list()
+        self.assertEqual(latest, [self.expected[day] for day in sorted(self.expected, reverse=True)[:10]])
+        self.team.make_post("01/01/2030", "New year")
+        self.team.make_post("2030-01-01", "New year, again")
+        self.assertEqual(take_out_from_adt(self.team.get_latest_posts(1)).to_list(), [("2030-01-01", "New year, again")])
+        self.assertEqual(self.team.post["2030-01-01"], "New year, again")
+        self.assertNotIn("01/01/2030", self.team.post)
+        self.assertEqual(len(self.team.post), len(self.team.posts_by_date))
+        self.assertEqual(len(self.team.get_latest_posts(10 ** 6)), len(self.expected) + 1)
+        self.assertEqual(len(self.team.get_latest_posts(0)), 0)
+        with self.assertRaises(ValueError):
+            self.team.get_latest_posts(-1)
+
+    def test_many_seasons_of_posts(self):
+        """
+        #name(Test a team keeps a post a day for more seasons than the listed date table sizes hold)
+        """
+        team = Team("Wolves", ArrayR(0), 5)
+        for year in range(2000, 2012):
+            for month in range(1, 13):
+                for day in range(1, 29):
+                    team.make_post(f"{year}-{month:02}-{day:02}", f"{year} {month} {day}")
+        self.assertEqual(len(team.post), 12 * 12 * 28)
+        self.assertEqual(team.post["2011-12-28"], "2011 12 28")
+        self.assertEqual(take_out_from_adt(team.get_latest_posts(2)).to_list(),
+                         [("2011-12-28", "2011 12 28"), ("2011-12-27", "2011 12 27")])
+        self.assertEqual(len(team.get_posts("01/02/2005", "28/02/2005")), 28)